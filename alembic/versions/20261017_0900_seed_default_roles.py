@@ -0,0 +1,99 @@
+"""create RBAC tables and seed default roles
+
+Revision ID: 20261017_seed_default_roles
+Revises: 20251214_1058_cost_control
+Create Date: 2026-10-17 09:00:00
+
+"""
+import uuid
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+from backend.models.utils import GUID
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_seed_default_roles'
+down_revision = '20251214_1058_cost_control'
+branch_labels = None
+depends_on = None
+
+
+DEFAULT_ROLES = [
+    ("admin", "Full system access, can manage users and contexts"),
+    ("business_dev", "Business Development - can answer Business_Dev category questions"),
+    ("technical", "Technical - can answer Technical category questions"),
+    ("product", "Product - can answer Product category questions"),
+    ("operations", "Operations - can answer Operations category questions"),
+    ("financial", "Financial - can answer Financial category questions"),
+]
+
+roles_table = sa.table(
+    'roles',
+    sa.column('id', GUID),
+    sa.column('name', sa.String),
+    sa.column('description', sa.Text),
+    sa.column('created_at', sa.DateTime),
+    sa.column('updated_at', sa.DateTime),
+)
+
+
+def _create_rbac_tables(inspector):
+    """Create roles and user_roles, which older deployments got from create_all instead."""
+    if not inspector.has_table('roles'):
+        op.create_table('roles',
+        sa.Column('id', GUID(), nullable=False),
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_roles_name'), 'roles', ['name'], unique=True)
+    if not inspector.has_table('user_roles'):
+        op.create_table('user_roles',
+        sa.Column('id', GUID(), nullable=False),
+        sa.Column('user_id', GUID(), nullable=False),
+        sa.Column('role_id', GUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['role_id'], ['roles.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'role_id', name='uq_user_role')
+        )
+        op.create_index(op.f('ix_user_roles_role_id'), 'user_roles', ['role_id'], unique=False)
+        op.create_index(op.f('ix_user_roles_user_id'), 'user_roles', ['user_id'], unique=False)
+
+
+def upgrade():
+    bind = op.get_bind()
+    _create_rbac_tables(sa.inspect(bind))
+
+    now = datetime.utcnow()
+    rows = [
+        {"id": uuid.uuid4(), "name": name, "description": description,
+         "created_at": now, "updated_at": now}
+        for name, description in DEFAULT_ROLES
+    ]
+
+    # Idempotent: roles already seeded by init_db/seed_roles are left alone
+    if bind.dialect.name == 'postgresql':
+        stmt = postgresql.insert(roles_table).on_conflict_do_nothing(index_elements=['name'])
+    elif bind.dialect.name == 'sqlite':
+        stmt = sqlite.insert(roles_table).on_conflict_do_nothing(index_elements=['name'])
+    else:
+        existing = {row.name for row in bind.execute(sa.select(roles_table.c.name))}
+        rows = [row for row in rows if row["name"] not in existing]
+        stmt = roles_table.insert()
+
+    if rows:
+        bind.execute(stmt, rows)
+
+
+def downgrade():
+    # The tables may predate this migration (create_all) and roles may be
+    # referenced by user_roles; leave both in place
+    pass
@@ -0,0 +1,33 @@
+"""add initiative title prefix index
+
+Revision ID: 20261017_title_prefix_idx
+Revises: 20261017_seed_default_roles
+Create Date: 2026-10-17 09:15:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_title_prefix_idx'
+down_revision = '20261017_seed_default_roles'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # lower(title) with text_pattern_ops lets PostgreSQL answer
+    # "lower(title) LIKE 'term%'" with an index range scan
+    op.create_index(
+        'ix_initiatives_org_title_prefix',
+        'initiatives',
+        ['organization_id', sa.text('lower(title) text_pattern_ops')]
+        if op.get_bind().dialect.name == 'postgresql'
+        else ['organization_id', sa.text('lower(title)')],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_initiatives_org_title_prefix', table_name='initiatives')
@@ -0,0 +1,30 @@
+"""add monthly spending period index
+
+Revision ID: 20261017_spending_period_idx
+Revises: 20261017_title_prefix_idx
+Create Date: 2026-10-17 09:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_spending_period_idx'
+down_revision = '20261017_title_prefix_idx'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Leading (year, month) lets "(year, month) >= (:y, :m)" use a range scan
+    op.create_index(
+        'ix_user_monthly_spending_year_month_user',
+        'user_monthly_spending',
+        ['year', 'month', 'user_id'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_user_monthly_spending_year_month_user', table_name='user_monthly_spending')
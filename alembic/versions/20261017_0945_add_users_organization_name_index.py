@@ -0,0 +1,31 @@
+"""add users organization name index
+
+Revision ID: 20261017_users_org_name_idx
+Revises: 20261017_spending_period_idx
+Create Date: 2026-10-17 09:45:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_users_org_name_idx'
+down_revision = '20261017_spending_period_idx'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Serves "WHERE organization_id = ? ORDER BY name, id" (and keyset seeks
+    # past a (name, id) cursor) without a sort step
+    op.create_index(
+        'ix_users_organization_name_id',
+        'users',
+        ['organization_id', 'name', 'id'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_users_organization_name_id', table_name='users')
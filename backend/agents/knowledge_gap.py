@@ -15,7 +15,6 @@ from backend.agents.prompts import (
 )
 from backend.models import Initiative, Context, Question, Answer, QuestionCategory, QuestionPriority
 from backend.repositories.question import QuestionRepository
-from backend.repositories.answer import AnswerRepository
 
 
 class KnowledgeGapAgent(BaseAgent):
@@ -63,14 +62,9 @@ class KnowledgeGapAgent(BaseAgent):
         """
         # Get previous Q&A for this initiative
         question_repo = QuestionRepository(self.db)
-        answer_repo = AnswerRepository(self.db)
 
-        previous_questions = question_repo.get_by_initiative(initiative.id)
-        questions_with_answers = []
-
-        for q in previous_questions:
-            answer = answer_repo.get_by_question(q.id)
-            questions_with_answers.append((q, answer))
+        previous_questions = question_repo.get_by_initiative(initiative.id, with_answers=True)
+        questions_with_answers = [(q, q.answer) for q in previous_questions]
 
         # Build prompt
         previous_qa_section = build_previous_qa_section(questions_with_answers)
@@ -214,17 +208,14 @@ class KnowledgeGapAgent(BaseAgent):
         if keep_existing:
             # Get unanswered questions from current iteration
             question_repo = QuestionRepository(self.db)
-            answer_repo = AnswerRepository(self.db)
 
             current_questions = question_repo.get_by_initiative(
                 initiative.id,
-                iteration=initiative.iteration_count
+                iteration=initiative.iteration_count,
+                with_answers=True
             )
 
-            unanswered = [
-                q for q in current_questions
-                if not answer_repo.get_by_question(q.id)
-            ]
+            unanswered = [q for q in current_questions if not q.answer]
 
             # Combine with new questions
             # Adjust iteration for existing questions
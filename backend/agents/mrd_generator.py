@@ -4,6 +4,7 @@ MRD Generator Agent - Creates Market Requirements Documents from Q&A.
 
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, List, Tuple, Dict, Callable
 from uuid import UUID
 from sqlalchemy.orm import Session
@@ -11,6 +12,7 @@ from sqlalchemy.orm import Session
 logger = logging.getLogger(__name__)
 
 from backend.agents.base import BaseAgent
+from backend.config import settings
 from backend.agents.prompts import (
     MRD_GENERATOR_AGENT_SYSTEM,
     MRD_GENERATOR_AGENT_USER_TEMPLATE,
@@ -23,7 +25,6 @@ from backend.agents.mrd_section_prompts import (
 )
 from backend.models import Initiative, Context, MRD, Question, Answer, AnswerStatus
 from backend.repositories.question import QuestionRepository
-from backend.repositories.answer import AnswerRepository
 
 
 class MRDGeneratorAgent(BaseAgent):
@@ -73,9 +74,8 @@ class MRDGeneratorAgent(BaseAgent):
         """
         # Get all questions and answers for this initiative
         question_repo = QuestionRepository(self.db)
-        answer_repo = AnswerRepository(self.db)
 
-        questions = question_repo.get_by_initiative(initiative.id)
+        questions = question_repo.get_by_initiative(initiative.id, with_answers=True)
 
         if not questions:
             raise ValueError(
@@ -86,8 +86,7 @@ class MRDGeneratorAgent(BaseAgent):
         # Build Q&A list
         questions_with_answers = []
         for question in questions:
-            answer = answer_repo.get_by_question(question.id)
-            questions_with_answers.append((question, answer))
+            questions_with_answers.append((question, question.answer))
 
         # Calculate readiness metrics
         readiness_score, assumptions = self._calculate_readiness(questions_with_answers)
@@ -290,9 +289,8 @@ class MRDGeneratorAgent(BaseAgent):
         """
         # Get all questions and answers
         question_repo = QuestionRepository(self.db)
-        answer_repo = AnswerRepository(self.db)
 
-        questions = question_repo.get_by_initiative(initiative.id)
+        questions = question_repo.get_by_initiative(initiative.id, with_answers=True)
 
         if not questions:
             raise ValueError(
@@ -303,8 +301,7 @@ class MRDGeneratorAgent(BaseAgent):
         # Build Q&A list
         questions_with_answers = []
         for question in questions:
-            answer = answer_repo.get_by_question(question.id)
-            questions_with_answers.append((question, answer))
+            questions_with_answers.append((question, question.answer))
 
         # Calculate readiness metrics
         readiness_score, assumptions = self._calculate_readiness(questions_with_answers)
@@ -320,23 +317,14 @@ class MRDGeneratorAgent(BaseAgent):
         ]
         unanswered_text = "\n".join(unanswered) if unanswered else "All critical questions have been answered."
 
-        # Generate each section
-        sections = {}
+        # Build every section prompt up front; sections don't depend on each other
         section_definitions = get_all_sections()
         total_sections = len(section_definitions)
+        section_requests = []
 
-        for idx, section_def in enumerate(section_definitions):
-            section_key = section_def["key"]
-            section_title = section_def["title"]
-
-            # Calculate progress (10% base + 85% for sections + 5% for assembly)
-            progress_percent = 10 + int((idx / total_sections) * 85)
-
-            if progress_callback:
-                progress_callback(f"Generating {section_title}...", progress_percent)
-
+        for section_def in section_definitions:
             # Get section-specific prompts
-            prompts = get_section_prompt(section_key)
+            prompts = get_section_prompt(section_def["key"])
 
             # Build user message with section-specific template
             user_message = prompts["user_template"].format(
@@ -352,14 +340,20 @@ class MRDGeneratorAgent(BaseAgent):
                 unanswered_questions=unanswered_text,
                 assumptions="\n".join(assumptions) if assumptions else "No major assumptions"
             )
+            section_requests.append((section_def, prompts["system"], user_message))
+
+        # Worker threads must not touch ORM attributes (a commit elsewhere
+        # would make them lazy-load through the shared session)
+        organization_id = initiative.organization_id
+        initiative_id = initiative.id
 
-            # Call LLM for this section
+        def generate_section(section_def: dict, system: str, user_message: str) -> str:
             section_content, llm_call, stop_reason = self.call_llm(
-                system=prompts["system"],
+                system=system,
                 messages=[{"role": "user", "content": user_message}],
-                organization_id=initiative.organization_id,
+                organization_id=organization_id,
                 user_id=user_id,
-                initiative_id=initiative.id,
+                initiative_id=initiative_id,
                 max_tokens=section_def["max_tokens"],
                 temperature=0.7
             )
@@ -367,12 +361,46 @@ class MRDGeneratorAgent(BaseAgent):
             # Check if section was truncated
             if stop_reason == "max_tokens":
                 logger.warning(
-                    f"Section '{section_title}' was truncated at max_tokens limit "
+                    f"Section '{section_def['title']}' was truncated at max_tokens limit "
                     f"({section_def['max_tokens']} tokens). Content may be incomplete. "
-                    f"Initiative: {initiative.id}"
+                    f"Initiative: {initiative_id}"
                 )
 
-            sections[section_key] = section_content.strip()
+            return section_content.strip()
+
+        if progress_callback:
+            progress_callback(f"Generating {total_sections} sections...", 10)
+
+        # Section calls are independent and dominated by LLM latency, so issue
+        # them concurrently; progress is reported from this thread, which owns
+        # the job's session
+        generated = {}
+        workers = max(1, min(settings.mrd_section_concurrency, total_sections))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(generate_section, *request): request[0]["key"]
+                for request in section_requests
+            }
+            try:
+                for done, future in enumerate(as_completed(futures), start=1):
+                    generated[futures[future]] = future.result()
+
+                    # 10% base + 80% for sections + 10% for editing
+                    if progress_callback:
+                        progress_percent = 10 + int((done / total_sections) * 80)
+                        with self.client.record_lock:
+                            progress_callback(f"Generated {done} of {total_sections} sections...", progress_percent)
+            except Exception:
+                # Don't start (and pay for) sections of an MRD that can't be assembled
+                for pending in futures:
+                    pending.cancel()
+                raise
+
+        # Keep the document order of the section definitions
+        sections = {
+            section_def["key"]: generated[section_def["key"]]
+            for section_def in section_definitions
+        }
 
         # Perform editorial pass with MRD Editor Agent
         if progress_callback:
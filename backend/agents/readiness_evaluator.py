@@ -10,7 +10,6 @@ from sqlalchemy.orm import Session
 from backend.agents.base import BaseAgent
 from backend.models import Initiative, Context, Question, Answer
 from backend.repositories.question import QuestionRepository
-from backend.repositories.answer import AnswerRepository
 
 
 READINESS_EVALUATOR_SYSTEM = """You are an expert Product Manager evaluating whether an initiative has sufficient information to create a high-quality Market Requirements Document (MRD).
@@ -179,14 +178,13 @@ class ReadinessEvaluatorAgent(BaseAgent):
         """
         # Get all Q&A for this initiative
         question_repo = QuestionRepository(self.db)
-        answer_repo = AnswerRepository(self.db)
 
-        questions = question_repo.get_by_initiative(initiative.id)
+        questions = question_repo.get_by_initiative(initiative.id, with_answers=True)
 
         # Build Q&A section
         qa_lines = []
         for i, question in enumerate(questions, 1):
-            answer = answer_repo.get_by_question(question.id)
+            answer = question.answer
 
             qa_lines.append(f"## Q{i}: {question.question_text}")
             qa_lines.append(f"**Category**: {question.category.value}")
@@ -3,6 +3,7 @@ Scoring Agent - Calculates RICE and FDV scores for initiative prioritization.
 """
 
 import json
+import logging
 from typing import Tuple, Dict, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
@@ -15,9 +16,10 @@ from backend.agents.prompts import (
 )
 from backend.models import Initiative, Context, MRD
 from backend.repositories.question import QuestionRepository
-from backend.repositories.answer import AnswerRepository
 from backend.repositories.mrd import MRDRepository
 
+logger = logging.getLogger(__name__)
+
 
 class ScoringAgent(BaseAgent):
     """
@@ -77,13 +79,9 @@ class ScoringAgent(BaseAgent):
 
         # Get questions and answers
         question_repo = QuestionRepository(self.db)
-        answer_repo = AnswerRepository(self.db)
 
-        questions = question_repo.get_by_initiative(initiative.id)
-        questions_with_answers = [
-            (q, answer_repo.get_by_question(q.id))
-            for q in questions
-        ]
+        questions = question_repo.get_by_initiative(initiative.id, with_answers=True)
+        questions_with_answers = [(q, q.answer) for q in questions]
 
         # Count estimated answers for confidence penalty
         estimated_count = sum(
@@ -117,7 +115,7 @@ class ScoringAgent(BaseAgent):
             temperature=0.5  # Lower temperature for more consistent scoring
         )
         if stop_reason == "max_tokens":
-            print(f"Warning: Scoring stopped due to max_tokens for initiative {initiative.id}")
+            logger.warning("Scoring stopped due to max_tokens for initiative %s", initiative.id)
 
         # Parse JSON response - handle markdown code fences and whitespace
         json_text = response_text.strip()
@@ -212,33 +210,35 @@ class ScoringAgent(BaseAgent):
         Returns:
             True if calculation is correct within tolerance
         """
-        print(f"[VALIDATION] Inside validate_rice_score method")
         reach = rice_data.get("reach")
         impact = rice_data.get("impact")
         confidence = rice_data.get("confidence")
         effort = rice_data.get("effort")
         rice_score = rice_data.get("rice_score")
 
-        print(f"[VALIDATION] RICE values - reach: {reach}, impact: {impact}, confidence: {confidence}, effort: {effort}, score: {rice_score}")
+        logger.debug(
+            "RICE values - reach: %s, impact: %s, confidence: %s, effort: %s, score: %s",
+            reach, impact, confidence, effort, rice_score
+        )
 
         # Check for None values
         if reach is None or impact is None or confidence is None or effort is None or rice_score is None:
-            print(f"[VALIDATION ERROR] One or more RICE values is None - skipping validation")
+            logger.debug("One or more RICE values is None - skipping validation")
             return False
 
         # Check for zero effort (division by zero)
         if effort == 0:
-            print(f"[VALIDATION ERROR] Effort is zero - cannot calculate RICE score")
+            logger.debug("Effort is zero - cannot calculate RICE score")
             return False
 
         # Calculate expected score
         expected = (reach * impact * (confidence / 100)) / effort
-        print(f"[VALIDATION] Expected RICE: {expected}, Actual: {rice_score}")
+        logger.debug("Expected RICE: %s, Actual: %s", expected, rice_score)
 
         # Allow 1% tolerance for rounding
         tolerance = expected * 0.01
         result = abs(rice_score - expected) <= tolerance
-        print(f"[VALIDATION] RICE validation result: {result}")
+        logger.debug("RICE validation result: %s", result)
         return result
 
     def validate_fdv_score(self, fdv_data: Dict) -> bool:
@@ -256,11 +256,14 @@ class ScoringAgent(BaseAgent):
         viability = fdv_data.get("viability")
         fdv_score = fdv_data.get("fdv_score")
 
-        print(f"[VALIDATION] FDV values - feasibility: {feasibility}, desirability: {desirability}, viability: {viability}, score: {fdv_score}")
+        logger.debug(
+            "FDV values - feasibility: %s, desirability: %s, viability: %s, score: %s",
+            feasibility, desirability, viability, fdv_score
+        )
 
         # Check for None values
         if feasibility is None or desirability is None or viability is None or fdv_score is None:
-            print(f"[VALIDATION ERROR] One or more FDV values is None - skipping validation")
+            logger.debug("One or more FDV values is None - skipping validation")
             return False
 
         # Calculate expected score
@@ -269,5 +272,5 @@ class ScoringAgent(BaseAgent):
         # Allow small tolerance for rounding
         tolerance = 0.1
         result = abs(fdv_score - expected) <= tolerance
-        print(f"[VALIDATION] FDV validation - Expected: {expected}, Actual: {fdv_score}, Result: {result}")
+        logger.debug("FDV validation - Expected: %s, Actual: %s, Result: %s", expected, fdv_score, result)
         return result
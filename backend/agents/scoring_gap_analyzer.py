@@ -6,6 +6,7 @@ to bridge data gaps, enabling users to provide estimates that unlock scoring.
 """
 
 import json
+import logging
 from typing import Dict, List, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
@@ -14,9 +15,10 @@ from backend.agents.base import BaseAgent
 from backend.agents.scoring import ScoringAgent
 from backend.models import Initiative, Context
 from backend.repositories.question import QuestionRepository
-from backend.repositories.answer import AnswerRepository
 from backend.repositories.mrd import MRDRepository
 
+logger = logging.getLogger(__name__)
+
 
 class ScoringGapAnalyzer(BaseAgent):
     """
@@ -150,16 +152,15 @@ class ScoringGapAnalyzer(BaseAgent):
         """
         # Get Q&A and MRD context
         question_repo = QuestionRepository(self.db)
-        answer_repo = AnswerRepository(self.db)
         mrd_repo = MRDRepository(self.db)
 
-        questions = question_repo.get_by_initiative(initiative.id)
+        questions = question_repo.get_by_initiative(initiative.id, with_answers=True)
         mrd = mrd_repo.get_by_initiative(initiative.id)
 
         # Build Q&A summary
         qa_summary = []
         for q in questions[:10]:  # Limit to first 10 for context
-            answer = answer_repo.get_by_question(q.id)
+            answer = q.answer
             if answer and answer.answer_status == "Answered":
                 qa_summary.append(f"Q: {q.question_text}\nA: {answer.answer_text}")
 
@@ -242,6 +243,7 @@ Focus on practical, estimable questions. Avoid asking for data that requires ext
             gaps = result.get("gaps", [])
 
             # Create Question records for gap-filling questions
+            new_questions = []
             for gap in gaps:
                 for q_data in gap.get("questions", []):
                     # Create a new question
@@ -270,15 +272,18 @@ Focus on practical, estimable questions. Avoid asking for data that requires ext
                         question_text=q_data["text"],
                         rationale=f"[Gap Analysis] {q_data.get('hint', 'Missing data for scoring')}"
                     )
-                    question_repo.create(new_question)
+                    new_questions.append((q_data, new_question))
+
+            question_repo.bulk_create([question for _, question in new_questions])
 
-                    # Add question_id to the response
-                    q_data["question_id"] = str(new_question.id)
+            # Add question_id to the response
+            for q_data, new_question in new_questions:
+                q_data["question_id"] = str(new_question.id)
 
             return gaps
         except json.JSONDecodeError as e:
-            print(f"Failed to parse gap analysis response: {e}")
-            print(f"Response: {json_text[:500]}")
+            logger.warning("Failed to parse gap analysis response: %s", e)
+            logger.debug("Gap analysis response: %s", json_text[:500])
             # Return empty gaps on parse failure
             return []
 
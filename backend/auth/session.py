@@ -7,8 +7,9 @@ a shared session store (Redis, database, etc.).
 """
 
 import secrets
+import threading
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Iterable, Optional, Dict, List, Set
 from dataclasses import dataclass
 import uuid
 
@@ -46,6 +47,9 @@ class SessionManager:
 
     def __init__(self, session_duration_minutes: int = 43200):  # 30 days default
         self._sessions: Dict[str, Session] = {}
+        # Session IDs per user, so revoking a user's sessions does not scan every session
+        self._user_sessions: Dict[uuid.UUID, Set[str]] = {}
+        self._lock = threading.Lock()
         self._session_duration = timedelta(minutes=session_duration_minutes)
 
     def create_session(
@@ -76,9 +80,23 @@ class SessionManager:
             expires_at=expires_at
         )
 
-        self._sessions[session_id] = session
+        with self._lock:
+            self._sessions[session_id] = session
+            self._user_sessions.setdefault(user_id, set()).add(session_id)
         return session
 
+    def _remove(self, session_id: str) -> bool:
+        """Remove a session and its user index entry. Caller must hold the lock."""
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        user_session_ids = self._user_sessions.get(session.user_id)
+        if user_session_ids is not None:
+            user_session_ids.discard(session_id)
+            if not user_session_ids:
+                del self._user_sessions[session.user_id]
+        return True
+
     def get_session(self, session_id: str) -> Optional[Session]:
         """
         Get a session by ID if it exists and is not expired.
@@ -104,10 +122,8 @@ class SessionManager:
 
         Returns True if session was deleted, False if it didn't exist.
         """
-        if session_id in self._sessions:
-            del self._sessions[session_id]
-            return True
-        return False
+        with self._lock:
+            return self._remove(session_id)
 
     def delete_user_sessions(self, user_id: uuid.UUID) -> int:
         """
@@ -115,15 +131,32 @@ class SessionManager:
 
         Returns the number of sessions deleted.
         """
-        sessions_to_delete = [
-            sid for sid, session in self._sessions.items()
-            if session.user_id == user_id
-        ]
+        return self.delete_user_sessions_bulk([user_id])[user_id]
 
-        for session_id in sessions_to_delete:
-            del self._sessions[session_id]
+    def delete_user_sessions_bulk(self, user_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, int]:
+        """
+        Delete all sessions for several users at once.
 
-        return len(sessions_to_delete)
+        Returns the number of sessions deleted per user.
+        """
+        deleted = {}
+        with self._lock:
+            for user_id in user_ids:
+                session_ids = self._user_sessions.pop(user_id, set())
+                for session_id in session_ids:
+                    self._sessions.pop(session_id, None)
+                deleted[user_id] = len(session_ids)
+        return deleted
+
+    def user_session_counts(self, user_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, int]:
+        """
+        Count the sessions each user holds, without revoking them.
+
+        Lets callers record what a revocation will cover before the
+        database change it depends on is committed.
+        """
+        with self._lock:
+            return {user_id: len(self._user_sessions.get(user_id, ())) for user_id in user_ids}
 
     def cleanup_expired_sessions(self) -> int:
         """
@@ -132,13 +165,14 @@ class SessionManager:
         Returns the number of sessions cleaned up.
         """
         now = datetime.utcnow()
-        expired_sessions = [
-            sid for sid, session in self._sessions.items()
-            if now > session.expires_at
-        ]
+        with self._lock:
+            expired_sessions = [
+                sid for sid, session in self._sessions.items()
+                if now > session.expires_at
+            ]
 
-        for session_id in expired_sessions:
-            del self._sessions[session_id]
+            for session_id in expired_sessions:
+                self._remove(session_id)
 
         return len(expired_sessions)
 
@@ -158,7 +192,9 @@ class SessionManager:
     def get_active_session_count(self) -> int:
         """Get the count of active (non-expired) sessions."""
         now = datetime.utcnow()
-        return sum(1 for session in self._sessions.values() if now <= session.expires_at)
+        with self._lock:
+            sessions = list(self._sessions.values())
+        return sum(1 for session in sessions if now <= session.expires_at)
 
 
 # Global session manager instance
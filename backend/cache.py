@@ -0,0 +1,92 @@
+"""
+Small in-process caches for read-heavy endpoints.
+
+Entries live in process memory and expire after a fixed TTL. Like the
+session store, this is per-instance: gunicorn runs several API workers and
+jobs run in separate worker processes, and ``invalidate`` only reaches the
+process that calls it. A cache is therefore only used for data that is
+
+- checked against the database on every hit, by keying entries on a
+  version read with a cheap query (initiative results), or
+- harmless to serve stale until the TTL expires (analytics and budget
+  aggregates, the current-context existence check).
+
+Per-user security state such as roles is not cached by default, and
+nothing relies on local invalidation for correctness.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe mapping whose entries expire ``ttl_seconds`` after insertion.
+
+    The oldest entry is evicted once ``maxsize`` is reached. Sync FastAPI
+    endpoints run in a threadpool, so access is guarded by a lock.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store value under key, evicting the oldest entry when full.
+
+        ttl_seconds overrides the cache-wide TTL for this entry.
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.maxsize:
+                self._entries.popitem(last=False)
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_matching(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key satisfies predicate; returns the number dropped."""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,7 +3,7 @@ Application configuration using Pydantic Settings.
 Loads environment variables from .env file.
 """
 
-from typing import List
+from typing import List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -16,6 +16,46 @@ class Settings(BaseSettings):
         default="sqlite:///./produck.db",
         description="Database connection string"
     )
+    db_pool_size: int = Field(
+        default=10,
+        description="Persistent connections kept in the PostgreSQL pool"
+    )
+    db_max_overflow: int = Field(
+        default=20,
+        description="Extra connections allowed above db_pool_size under load"
+    )
+    db_pool_timeout: int = Field(
+        default=30,
+        description="Seconds to wait for a pooled connection before failing"
+    )
+    db_pool_recycle: int = Field(
+        default=1800,
+        description="Seconds after which pooled connections are replaced"
+    )
+    threadpool_size: int = Field(
+        default=40,
+        description="Worker threads for sync endpoints; keep at or above db_pool_size + db_max_overflow"
+    )
+    mrd_section_concurrency: int = Field(
+        default=4,
+        description="MRD sections generated concurrently per job (1 generates them one at a time)"
+    )
+    run_job_worker: bool = Field(
+        default=True,
+        description="Poll for and run background jobs in the API process; disable when running dedicated workers"
+    )
+    job_worker_concurrency: int = Field(
+        default=4,
+        description="Background jobs each worker runs at once; jobs mostly wait on LLM calls"
+    )
+    job_dedup_window_seconds: int = Field(
+        default=300,
+        description="A repeat request for a job still pending or running within this window returns the existing job (0 disables)"
+    )
+    pdf_render_workers: Optional[int] = Field(
+        default=None,
+        description="Worker processes for PDF rendering; unset uses one per CPU, 0 renders in the request thread"
+    )
 
     # Redis
     redis_url: str = Field(
@@ -61,6 +101,30 @@ class Settings(BaseSettings):
         default="INFO",
         description="Logging level: DEBUG, INFO, WARNING, ERROR"
     )
+    auto_seed_roles: bool = Field(
+        default=True,
+        description="Seed default roles from the application; disable in production, where the Alembic migration creates and seeds the role tables"
+    )
+    analytics_cache_ttl_seconds: int = Field(
+        default=60,
+        description="How long admin analytics aggregates are served from the in-process cache (0 disables)"
+    )
+    rbac_cache_ttl_seconds: int = Field(
+        default=0,
+        description="How long a user's role names are reused for permission checks (0 disables; single-process deployments only)"
+    )
+    context_cache_ttl_seconds: int = Field(
+        default=300,
+        description="How long an organization's current context is reused by agent routes (0 disables)"
+    )
+    results_cache_ttl_seconds: int = Field(
+        default=60,
+        description="How long MRD, score and evaluation responses are served from the in-process cache (0 disables)"
+    )
+    strict_relationship_loading: bool = Field(
+        default=False,
+        description="Raise on relationship lazy loads in routes that declare their loading up front (enable in development and CI)"
+    )
     cors_origins: str = Field(
         default="http://localhost:3000,http://localhost:8000",
         description="Comma-separated CORS origins"
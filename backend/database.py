@@ -4,6 +4,7 @@ Database configuration and session management.
 
 import logging
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
@@ -26,12 +27,25 @@ if settings.database_url.startswith("sqlite"):
 else:
     # PostgreSQL configuration
     logger.info(f"Configuring PostgreSQL database with connection pooling")
+    engine_options = {}
+    if make_url(settings.database_url).get_driver_name() == "psycopg2":
+        # INSERTs are sent as multi-row VALUES (insertmanyvalues_page_size below);
+        # executemany() UPDATE/DELETE go through psycopg2's execute_batch
+        engine_options = {
+            "executemany_mode": "values_plus_batch",
+            "executemany_batch_page_size": 500,
+        }
     engine = create_engine(
         settings.database_url,
         pool_pre_ping=True,
-        pool_size=10,
-        max_overflow=20,
-        echo=settings.environment == "development"
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        # Recycle before server-side/proxy idle timeouts drop the connection
+        pool_recycle=settings.db_pool_recycle,
+        insertmanyvalues_page_size=1000,
+        echo=settings.environment == "development",
+        **engine_options
     )
 
 # Session factory
@@ -0,0 +1,34 @@
+"""
+Initiative access dependencies shared across routers.
+"""
+
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, status
+
+from backend.auth.dependencies import get_current_user
+from backend.dependencies.repositories import get_initiative_repository
+from backend.models.user import User
+from backend.repositories.initiative import InitiativeRepository
+
+
+def require_initiative_access(
+    initiative_id: UUID,
+    current_user: User = Depends(get_current_user),
+    initiative_repo: InitiativeRepository = Depends(get_initiative_repository)
+) -> UUID:
+    """
+    Dependency ensuring the path's initiative exists in the user's organization.
+
+    Runs an EXISTS check without loading the row; use it on routes that
+    only need the access check. Raises 404 otherwise.
+
+    Returns:
+        The checked initiative ID
+    """
+    if not initiative_repo.exists(initiative_id, current_user.organization_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Initiative not found"
+        )
+    return initiative_id
@@ -2,18 +2,41 @@
 Role-Based Access Control (RBAC) dependencies.
 """
 
+from typing import FrozenSet
+from uuid import UUID
+
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
 
-from backend.database import get_db
+from backend.cache import TTLCache
+from backend.config import settings
 from backend.auth.dependencies import get_current_user
 from backend.models.user import User
 
 
-def require_admin(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-) -> User:
+# Role names by user id. get_current_user still loads the user row on every
+# request (so deactivation takes effect immediately); this only saves the
+# user_roles/roles lookups behind each role check. Entries are per-process
+# and invalidate_user_roles only reaches the process that made the change,
+# so the cache is off by default: enable it only for single-process
+# deployments, where role edits through the admin API apply at once.
+rbac_cache = TTLCache(ttl_seconds=settings.rbac_cache_ttl_seconds, maxsize=10_000)
+
+
+def get_role_names(user: User) -> FrozenSet[str]:
+    """Return the user's role names, loading them only on a cache miss."""
+    role_names = rbac_cache.get(user.id)
+    if role_names is None:
+        role_names = frozenset(user.role_names)
+        rbac_cache.set(user.id, role_names)
+    return role_names
+
+
+def invalidate_user_roles(user_id: UUID) -> None:
+    """Forget cached role names after a user's roles change or the user is removed."""
+    rbac_cache.invalidate(user_id)
+
+
+def require_admin(current_user: User = Depends(get_current_user)) -> User:
     """
     Dependency to require admin role.
 
@@ -23,7 +46,7 @@ def require_admin(
     Returns:
         The current user if they have admin role
     """
-    if not current_user.has_role("admin"):
+    if "admin" not in get_role_names(current_user):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin role required"
@@ -46,11 +69,8 @@ def require_any_role(*roles: str):
     Returns:
         Dependency function that checks for required roles
     """
-    def check_roles(
-        current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db)
-    ) -> User:
-        if not current_user.has_any_role(*roles):
+    def check_roles(current_user: User = Depends(get_current_user)) -> User:
+        if get_role_names(current_user).isdisjoint(roles):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"One of the following roles is required: {', '.join(roles)}"
@@ -75,11 +95,8 @@ def require_all_roles(*roles: str):
     Returns:
         Dependency function that checks for required roles
     """
-    def check_roles(
-        current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db)
-    ) -> User:
-        user_roles = set(current_user.role_names)
+    def check_roles(current_user: User = Depends(get_current_user)) -> User:
+        user_roles = get_role_names(current_user)
         required_roles = set(roles)
         if not required_roles.issubset(user_roles):
             missing_roles = required_roles - user_roles
@@ -0,0 +1,37 @@
+"""
+Repository dependencies shared across routers.
+
+Each provider binds a repository to the request's session. FastAPI caches
+dependencies per request, so an endpoint and its sub-dependencies share
+one instance, and tests can swap a repository through
+``app.dependency_overrides``.
+"""
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from backend.database import get_db
+from backend.repositories.context import ContextRepository
+from backend.repositories.initiative import InitiativeRepository
+from backend.repositories.mrd import MRDRepository
+from backend.repositories.score import ScoreRepository
+
+
+def get_initiative_repository(db: Session = Depends(get_db)) -> InitiativeRepository:
+    """Dependency providing an InitiativeRepository for the request."""
+    return InitiativeRepository(db)
+
+
+def get_context_repository(db: Session = Depends(get_db)) -> ContextRepository:
+    """Dependency providing a ContextRepository for the request."""
+    return ContextRepository(db)
+
+
+def get_mrd_repository(db: Session = Depends(get_db)) -> MRDRepository:
+    """Dependency providing an MRDRepository for the request."""
+    return MRDRepository(db)
+
+
+def get_score_repository(db: Session = Depends(get_db)) -> ScoreRepository:
+    """Dependency providing a ScoreRepository for the request."""
+    return ScoreRepository(db)
@@ -0,0 +1,19 @@
+"""
+Service dependencies shared across routers.
+"""
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from backend.database import get_db
+from backend.services.budget_service import BudgetService
+
+
+def get_budget_service(db: Session = Depends(get_db)) -> BudgetService:
+    """
+    Dependency providing a BudgetService bound to the request's session.
+
+    FastAPI caches dependencies per request, so every use within one request
+    (endpoint and helpers) shares a single instance.
+    """
+    return BudgetService(db)
@@ -0,0 +1,35 @@
+"""
+HTTP conditional-request helpers shared by the routers.
+
+Endpoints that send an ETag use these to answer a matching If-None-Match
+with 304 Not Modified instead of the full payload.
+"""
+
+import hashlib
+
+from fastapi import Request
+
+
+def payload_etag(body: bytes) -> str:
+    """Strong ETag derived from a serialized response body."""
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    """Entity tag without its weakness indicator, for weak comparison."""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Report whether the request's If-None-Match covers ``etag``.
+
+    Accepts comma-separated lists and ``*``. Tags are compared weakly (a
+    ``W/`` prefix on either side is ignored), as If-None-Match requires.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {_opaque_tag(tag) for tag in if_none_match.split(",")}
+    return "*" in candidates or _opaque_tag(etag) in candidates
@@ -5,6 +5,7 @@ Anthropic API client wrapper with error handling and tracking.
 import time
 import hashlib
 import logging
+import threading
 from typing import Optional, Dict, Any
 from uuid import UUID
 from anthropic import Anthropic, APIError, APITimeoutError, RateLimitError
@@ -68,6 +69,11 @@ class AnthropicClient:
             timeout=settings.anthropic_api_timeout
         )
 
+        # Agents may issue calls from several threads that share one session;
+        # the API requests overlap but tracking writes (and any other use of
+        # that session while calls are in flight) hold this lock
+        self.record_lock = threading.Lock()
+
     def create_message(
         self,
         db: Session,
@@ -120,6 +126,12 @@ class AnthropicClient:
         # Calculate prompt hash for versioning
         prompt_hash = self._hash_prompt(system, messages)
 
+        # End the caller's transaction before waiting on the network so its
+        # pooled connection is free while the model responds. Nothing changes
+        # for the caller: the call record below commits pending work anyway.
+        with self.record_lock:
+            db.commit()
+
         try:
             logger.info(f"Starting Anthropic API call: agent={agent_name}, model={model}, timeout={settings.anthropic_api_timeout}s")
 
@@ -186,44 +198,45 @@ class AnthropicClient:
             # Calculate cost
             cost_usd = self._calculate_cost(model, input_tokens, output_tokens)
 
-            # Log the call
-            llm_call = LLMCall(
-                agent_name=agent_name,
-                model=model,
-                provider="anthropic",
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                total_tokens=total_tokens,
-                latency_ms=latency_ms,
-                cost_usd=cost_usd,
-                status=status,
-                error_message=error_message,
-                user_id=user_id,
-                organization_id=organization_id,
-                initiative_id=initiative_id,
-                prompt_hash=prompt_hash
-            )
+            with self.record_lock:
+                # Log the call
+                llm_call = LLMCall(
+                    agent_name=agent_name,
+                    model=model,
+                    provider="anthropic",
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    total_tokens=total_tokens,
+                    latency_ms=latency_ms,
+                    cost_usd=cost_usd,
+                    status=status,
+                    error_message=error_message,
+                    user_id=user_id,
+                    organization_id=organization_id,
+                    initiative_id=initiative_id,
+                    prompt_hash=prompt_hash
+                )
 
-            db.add(llm_call)
-            db.commit()
-            db.refresh(llm_call)
+                db.add(llm_call)
+                db.commit()
+                db.refresh(llm_call)
 
-            # Record spending for budget tracking if user_id is provided
-            if user_id and cost_usd > 0:
-                try:
-                    from backend.services.budget_service import BudgetService
-                    from decimal import Decimal
+                # Record spending for budget tracking if user_id is provided
+                if user_id and cost_usd > 0:
+                    try:
+                        from backend.services.budget_service import BudgetService
+                        from decimal import Decimal
                     
-                    budget_service = BudgetService(db)
-                    budget_service.record_spending(
-                        user_id=user_id,
-                        amount=Decimal(str(cost_usd)),
-                        llm_call_id=llm_call.id
-                    )
-                    logger.debug(f"Recorded spending ${cost_usd:.4f} for user {user_id}")
-                except Exception as e:
-                    # Log error but don't fail the LLM call
-                    logger.error(f"Failed to record spending for user {user_id}: {e}")
+                        budget_service = BudgetService(db)
+                        budget_service.record_spending(
+                            user_id=user_id,
+                            amount=Decimal(str(cost_usd)),
+                            llm_call_id=llm_call.id
+                        )
+                        logger.debug(f"Recorded spending ${cost_usd:.4f} for user {user_id}")
+                    except Exception as e:
+                        # Log error but don't fail the LLM call
+                        logger.error(f"Failed to record spending for user {user_id}: {e}")
 
         return response_text, llm_call, stop_reason
 
@@ -5,12 +5,20 @@ Configures structured logging with timestamps, log levels, and proper formatting
 for Docker container environments (stdout/stderr).
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Optional
 from backend.config import settings
 
 
+# Writes to stdout/stderr can block (e.g. behind a Docker log driver), so
+# request threads only enqueue records and a listener thread does the I/O
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
 class ColoredFormatter(logging.Formatter):
     """
     Custom formatter that adds colors to log levels for better readability in development.
@@ -78,12 +86,16 @@ def setup_logging(
         use_colors=use_colors
     )
     
+    global _queue_listener
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
     # Remove existing handlers
     root_logger.handlers.clear()
+    if _queue_listener is not None:
+        _queue_listener.stop()
     
     # Add stdout handler for INFO and below
     stdout_handler = logging.StreamHandler(sys.stdout)
@@ -96,13 +108,19 @@ def setup_logging(
             return record.levelno < logging.WARNING
     
     stdout_handler.addFilter(StdoutFilter())
-    root_logger.addHandler(stdout_handler)
     
     # Add stderr handler for WARNING and above
     stderr_handler = logging.StreamHandler(sys.stderr)
     stderr_handler.setLevel(logging.WARNING)
     stderr_handler.setFormatter(formatter)
-    root_logger.addHandler(stderr_handler)
+
+    # Both stream handlers run on the listener thread
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, stdout_handler, stderr_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
     
     # Configure third-party loggers to reduce noise
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -116,6 +134,18 @@ def setup_logging(
     logger.info(f"Logging configured: level={log_level}, environment={settings.environment}, colors={use_colors}")
 
 
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a module.
@@ -3,10 +3,13 @@ ProDuckt FastAPI application entry point.
 """
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import logging
 
+from anyio import to_thread
+
 from backend.config import settings
 from backend.database import engine, Base
 from backend.logging_config import setup_logging
@@ -26,16 +29,24 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info(f"Starting ProDuckt API - Environment: {settings.environment}")
 
+    # Sync endpoints (all DB-backed routes) run in AnyIO's worker threadpool;
+    # size it so requests queue for a DB connection rather than for a thread
+    to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    logger.info(f"Worker threadpool size: {settings.threadpool_size}")
+
     # Create tables if they don't exist (development only)
     if settings.environment == "development":
         logger.info("Development mode: Creating database tables if needed")
         Base.metadata.create_all(bind=engine)
 
     # Start background job worker
-    logger.info("Starting background job worker...")
-    from backend.services.job_worker import start_job_worker
-    start_job_worker(poll_interval=2)
-    logger.info("Background job worker started")
+    if settings.run_job_worker:
+        logger.info("Starting background job worker...")
+        from backend.services.job_worker import start_job_worker
+        start_job_worker(poll_interval=2)
+        logger.info("Background job worker started")
+    else:
+        logger.info("Background jobs are run by dedicated workers")
 
     logger.info("ProDuckt API startup complete")
 
@@ -43,9 +54,12 @@ async def lifespan(app: FastAPI):
 
     # Shutdown: Clean up resources
     logger.info("Shutting down ProDuckt API")
-    from backend.services.job_worker import stop_job_worker
-    stop_job_worker()
-    logger.info("Background job worker stopped")
+    if settings.run_job_worker:
+        from backend.services.job_worker import stop_job_worker
+        stop_job_worker()
+        logger.info("Background job worker stopped")
+    from backend.services.pdf_generator import shutdown_render_pool
+    shutdown_render_pool()
 
 
 # Create FastAPI app
@@ -53,7 +67,10 @@ app = FastAPI(
     title="ProDuckt API",
     description="MRD Orchestration Platform using Claude 3.5 Sonnet",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson encodes the nested JSON payloads (evaluation_data, quality
+    # breakdowns, admin analytics) several times faster than the stdlib
+    default_response_class=ORJSONResponse
 )
 
 # Configure middlewares
@@ -79,7 +96,7 @@ app.add_middleware(RateLimitMiddleware)
 
 
 @app.get("/health")
-async def health_check():
+def health_check():
     """
     Health check endpoint for Docker and monitoring.
     Checks database connectivity and returns service status.
@@ -153,7 +170,7 @@ async def debug_config():
 
 
 @app.get("/debug/job-worker")
-async def debug_job_worker():
+def debug_job_worker():
     """Debug job worker status."""
     from backend.services.job_worker import get_job_worker
     from backend.database import SessionLocal
@@ -4,7 +4,7 @@ Initiative model - core entity for product ideas.
 
 import enum
 import uuid
-from sqlalchemy import Column, String, Text, Integer, Enum, ForeignKey, Index, DateTime
+from sqlalchemy import Column, String, Text, Integer, Enum, ForeignKey, Index, DateTime, func
 from backend.models.utils import GUID
 from sqlalchemy.orm import relationship
 
@@ -79,6 +79,13 @@ class Initiative(Base, TimestampMixin):
     __table_args__ = (
         Index('ix_initiatives_org_status', 'organization_id', 'status'),
         Index('ix_initiatives_created_by', 'created_by'),
+        # Case-insensitive prefix search (type-ahead) as an index range scan
+        Index(
+            'ix_initiatives_org_title_prefix',
+            'organization_id',
+            func.lower(title).label('title_lower'),
+            postgresql_ops={'title_lower': 'text_pattern_ops'}
+        ),
     )
 
     def __repr__(self):
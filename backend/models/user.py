@@ -5,7 +5,7 @@ User model for authentication and authorization.
 import enum
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Enum, Boolean, ForeignKey, DateTime, Numeric
+from sqlalchemy import Column, String, Enum, Boolean, ForeignKey, DateTime, Numeric, Index
 from backend.models.utils import GUID
 from sqlalchemy.orm import relationship
 
@@ -64,6 +64,12 @@ class User(Base, TimestampMixin):
     monthly_spending = relationship("UserMonthlySpending", back_populates="user", cascade="all, delete-orphan")
     budget_updated_by_user = relationship("User", remote_side=[id], foreign_keys=[budget_updated_by])
 
+    # Indexes
+    __table_args__ = (
+        # Admin user list: organization filter plus (name, id) ordering and keyset seeks
+        Index('ix_users_organization_name_id', 'organization_id', 'name', 'id'),
+    )
+
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, role={self.role.value})>"
 
@@ -35,6 +35,8 @@ class UserMonthlySpending(Base, TimestampMixin):
     __table_args__ = (
         UniqueConstraint('user_id', 'year', 'month', name='uq_user_month'),
         Index('ix_user_monthly_spending_user_month', 'user_id', 'year', 'month'),
+        # Period-range scans for org spending trends
+        Index('ix_user_monthly_spending_year_month_user', 'year', 'month', 'user_id'),
     )
 
     def __repr__(self):
@@ -36,7 +36,10 @@ class UserRole(Base, TimestampMixin):
 
     # Relationships
     user = relationship("User", back_populates="user_roles")
-    role = relationship("Role", back_populates="user_roles")
+    # Joined by default: an assignment is almost always read for its role
+    # name (User.has_role, RBAC dependencies), so loading User.user_roles
+    # fetches the roles in the same query instead of one SELECT per role
+    role = relationship("Role", back_populates="user_roles", lazy="joined")
 
     # Constraints
     __table_args__ = (
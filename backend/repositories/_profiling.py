@@ -0,0 +1,60 @@
+"""
+Query counting helpers for repository performance tests.
+
+Used to lock in the number of SQL statements a repository method emits
+and to check that repeated calls are served from SQLAlchemy's compiled
+statement cache.
+"""
+
+import contextlib
+from dataclasses import dataclass, field
+from typing import Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.orm import Session
+
+
+@dataclass
+class QueryCounter:
+    """Statements captured while a ``count_queries`` block is active."""
+
+    statements: List[str] = field(default_factory=list)
+    cache_misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+
+@contextlib.contextmanager
+def count_queries(session: Session) -> Iterator[QueryCounter]:
+    """
+    Count SQL statements executed through a session's engine.
+
+    Usage:
+        with count_queries(db) as queries:
+            repo.get_unanswered(initiative_id)
+        assert len(queries) == 1
+
+    ``cache_misses`` counts statements that had to be compiled because
+    they were not found in the engine's compiled cache.
+
+    Args:
+        session: Session whose bound engine should be observed
+
+    Yields:
+        QueryCounter populated as statements execute
+    """
+    engine = session.get_bind()
+    counter = QueryCounter()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        counter.statements.append(statement)
+        if getattr(context, "cache_hit", None) is CacheStats.CACHE_MISS:
+            counter.cache_misses += 1
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
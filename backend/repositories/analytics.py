@@ -5,7 +5,7 @@ Analytics repository for LLM usage and cost reporting.
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, case
+from sqlalchemy import func, and_, case, select
 from uuid import UUID
 
 from backend.models.llmcall import LLMCall, LLMCallStatus
@@ -18,6 +18,28 @@ class AnalyticsRepository:
     def __init__(self, db: Session):
         self.db = db
 
+    def _time_bucket(self, column, granularity: str):
+        """Truncate a timestamp column to the given bucket size for the bound dialect."""
+        # Database-agnostic date truncation
+        # Check if using PostgreSQL or SQLite
+        dialect_name = self.db.bind.dialect.name
+
+        if dialect_name == 'postgresql':
+            # PostgreSQL uses date_trunc function
+            if granularity not in ('hour', 'day', 'week', 'month'):
+                granularity = 'day'
+            return func.date_trunc(granularity, column)
+
+        # SQLite uses strftime
+        if granularity == 'hour':
+            return func.strftime('%Y-%m-%d %H:00:00', column)
+        if granularity == 'week':
+            # Week truncation: get start of week (Monday)
+            return func.date(column, 'weekday 0', '-6 days')
+        if granularity == 'month':
+            return func.strftime('%Y-%m-01', column)
+        return func.strftime('%Y-%m-%d', column)
+
     def get_total_stats(
         self,
         organization_id: UUID,
@@ -188,35 +210,7 @@ class AnalyticsRepository:
         Returns:
             List of dicts with time-series data
         """
-        # Database-agnostic date truncation
-        # Check if using PostgreSQL or SQLite
-        dialect_name = self.db.bind.dialect.name
-        
-        if dialect_name == 'postgresql':
-            # PostgreSQL uses date_trunc function
-            if granularity == 'hour':
-                date_trunc = func.date_trunc('hour', LLMCall.created_at)
-            elif granularity == 'day':
-                date_trunc = func.date_trunc('day', LLMCall.created_at)
-            elif granularity == 'week':
-                date_trunc = func.date_trunc('week', LLMCall.created_at)
-            elif granularity == 'month':
-                date_trunc = func.date_trunc('month', LLMCall.created_at)
-            else:
-                date_trunc = func.date_trunc('day', LLMCall.created_at)
-        else:
-            # SQLite uses strftime
-            if granularity == 'hour':
-                date_trunc = func.strftime('%Y-%m-%d %H:00:00', LLMCall.created_at)
-            elif granularity == 'day':
-                date_trunc = func.strftime('%Y-%m-%d', LLMCall.created_at)
-            elif granularity == 'week':
-                # Week truncation: get start of week (Monday)
-                date_trunc = func.date(LLMCall.created_at, 'weekday 0', '-6 days')
-            elif granularity == 'month':
-                date_trunc = func.strftime('%Y-%m-01', LLMCall.created_at)
-            else:
-                date_trunc = func.strftime('%Y-%m-%d', LLMCall.created_at)
+        date_trunc = self._time_bucket(LLMCall.created_at, granularity)
 
         query = self.db.query(
             date_trunc.label('time_bucket'),
@@ -343,3 +337,192 @@ class AnalyticsRepository:
             "success_count": total_calls - error_count,
             "error_rate_percent": round(error_rate, 2)
         }
+
+    def get_dashboard(
+        self,
+        organization_id: UUID,
+        start_date: datetime,
+        days: int,
+        granularity: str = 'day',
+        user_limit: int = 50
+    ) -> Dict:
+        """
+        Get every admin dashboard panel in one round of queries.
+
+        All aggregates read from a single ``calls`` CTE holding the
+        organization's calls since ``start_date``, and run in the same
+        transaction so the panels agree with each other.
+
+        Args:
+            organization_id: Organization to query
+            start_date: Start of the reporting window
+            days: Length of the window, echoed back as period_days
+            granularity: Time bucket size for over_time ('hour', 'day', 'week', 'month')
+            user_limit: Maximum number of users in by_user
+
+        Returns:
+            Dict with overview, by_user, by_agent, by_model and over_time
+        """
+        calls = select(
+            LLMCall.id,
+            LLMCall.user_id,
+            LLMCall.agent_name,
+            LLMCall.model,
+            LLMCall.status,
+            LLMCall.cost_usd,
+            LLMCall.total_tokens,
+            LLMCall.input_tokens,
+            LLMCall.output_tokens,
+            LLMCall.latency_ms,
+            LLMCall.created_at
+        ).where(
+            LLMCall.organization_id == organization_id,
+            LLMCall.created_at >= start_date
+        ).cte('calls')
+        succeeded = calls.c.status == LLMCallStatus.SUCCESS
+
+        # Overview and error stats share one pass over the window
+        totals = self.db.execute(
+            select(
+                func.count(calls.c.id).label('all_calls'),
+                func.count(case((succeeded, calls.c.id))).label('total_calls'),
+                func.sum(case((succeeded, calls.c.cost_usd))).label('total_cost'),
+                func.sum(case((succeeded, calls.c.total_tokens))).label('total_tokens'),
+                func.avg(case((succeeded, calls.c.latency_ms))).label('avg_latency')
+            )
+        ).one()
+
+        by_user = self.db.execute(
+            select(
+                User.id,
+                User.email,
+                User.name,
+                func.count(calls.c.id).label('call_count'),
+                func.sum(calls.c.cost_usd).label('total_cost'),
+                func.sum(calls.c.total_tokens).label('total_tokens'),
+                func.sum(calls.c.input_tokens).label('input_tokens'),
+                func.sum(calls.c.output_tokens).label('output_tokens')
+            ).join(
+                User, calls.c.user_id == User.id
+            ).where(
+                succeeded
+            ).group_by(
+                User.id, User.email, User.name
+            ).order_by(
+                func.sum(calls.c.cost_usd).desc()
+            ).limit(user_limit)
+        ).all()
+
+        by_agent = self.db.execute(
+            select(
+                calls.c.agent_name,
+                func.count(calls.c.id).label('call_count'),
+                func.sum(calls.c.cost_usd).label('total_cost'),
+                func.sum(calls.c.total_tokens).label('total_tokens'),
+                func.avg(calls.c.latency_ms).label('avg_latency')
+            ).where(
+                succeeded
+            ).group_by(
+                calls.c.agent_name
+            ).order_by(
+                func.sum(calls.c.cost_usd).desc()
+            )
+        ).all()
+
+        by_model = self.db.execute(
+            select(
+                calls.c.model,
+                func.count(calls.c.id).label('call_count'),
+                func.sum(calls.c.cost_usd).label('total_cost'),
+                func.sum(calls.c.total_tokens).label('total_tokens')
+            ).where(
+                succeeded
+            ).group_by(
+                calls.c.model
+            ).order_by(
+                func.sum(calls.c.cost_usd).desc()
+            )
+        ).all()
+
+        time_bucket = self._time_bucket(calls.c.created_at, granularity).label('time_bucket')
+        over_time = self.db.execute(
+            select(
+                time_bucket,
+                func.count(calls.c.id).label('call_count'),
+                func.sum(calls.c.cost_usd).label('total_cost'),
+                func.sum(calls.c.total_tokens).label('total_tokens')
+            ).where(
+                succeeded
+            ).group_by(
+                time_bucket
+            ).order_by(
+                time_bucket
+            )
+        ).all()
+
+        all_calls = totals.all_calls or 0
+        success_count = totals.total_calls or 0
+        error_count = all_calls - success_count
+        error_rate = (error_count / all_calls * 100) if all_calls > 0 else 0.0
+
+        return {
+            "period_days": days,
+            "start_date": start_date.isoformat(),
+            "end_date": datetime.utcnow().isoformat(),
+            "granularity": granularity,
+            "overview": {
+                "total_stats": {
+                    "total_calls": success_count,
+                    "total_cost": float(totals.total_cost or 0.0),
+                    "total_tokens": totals.total_tokens or 0,
+                    "avg_latency_ms": float(totals.avg_latency) if totals.avg_latency else None
+                },
+                "error_stats": {
+                    "total_calls": all_calls,
+                    "error_count": error_count,
+                    "success_count": success_count,
+                    "error_rate_percent": round(error_rate, 2)
+                }
+            },
+            "by_user": [
+                {
+                    "user_id": str(r.id),
+                    "email": r.email,
+                    "full_name": r.name,
+                    "call_count": r.call_count,
+                    "total_cost": float(r.total_cost or 0.0),
+                    "total_tokens": r.total_tokens or 0,
+                    "input_tokens": r.input_tokens or 0,
+                    "output_tokens": r.output_tokens or 0
+                }
+                for r in by_user
+            ],
+            "by_agent": [
+                {
+                    "agent_name": r.agent_name,
+                    "call_count": r.call_count,
+                    "total_cost": float(r.total_cost or 0.0),
+                    "total_tokens": r.total_tokens or 0,
+                    "avg_latency_ms": float(r.avg_latency or 0.0) if r.avg_latency else None
+                }
+                for r in by_agent
+            ],
+            "by_model": [
+                {
+                    "model": r.model,
+                    "call_count": r.call_count,
+                    "total_cost": float(r.total_cost or 0.0),
+                    "total_tokens": r.total_tokens or 0
+                }
+                for r in by_model
+            ],
+            "over_time": [
+                {
+                    "timestamp": r.time_bucket if isinstance(r.time_bucket, str) else r.time_bucket.isoformat(),
+                    "call_count": r.call_count,
+                    "total_cost": float(r.total_cost or 0.0),
+                    "total_tokens": r.total_tokens or 0
+                }
+                for r in over_time
+            ]
+        }
@@ -2,12 +2,18 @@
 Base repository pattern for data access.
 
 Provides common CRUD operations with multi-tenancy support.
+
+Bulk writes should go through a single ``session.execute(insert(Model), rows)``
+or ``session.add_all(...)`` + ``flush()`` rather than per-row flushes: the
+engine is configured (see ``backend.database``) to batch executemany
+statements into multi-row VALUES, so one call becomes a handful of
+round-trips regardless of row count.
 """
 
 from typing import TypeVar, Generic, Type, Optional, List
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, lambda_stmt
 
 from backend.models.base import TimestampMixin
 
@@ -45,13 +51,15 @@ class BaseRepository(Generic[T]):
         Returns:
             Entity if found, None otherwise
         """
-        query = select(self.model).where(self.model.id == id)
+        # lambda_stmt caches the compiled SQL per model for this hot lookup
+        model = self.model
+        stmt = lambda_stmt(lambda: select(model).where(model.id == id))
 
         # Apply organization filter if model has organization_id
-        if organization_id and hasattr(self.model, 'organization_id'):
-            query = query.where(self.model.organization_id == organization_id)
+        if organization_id and hasattr(model, 'organization_id'):
+            stmt += lambda s: s.where(model.organization_id == organization_id)
 
-        result = self.db.execute(query)
+        result = self.db.execute(stmt)
         return result.scalar_one_or_none()
 
     def get_all(
@@ -166,3 +174,30 @@ class BaseRepository(Generic[T]):
             True if entity exists, False otherwise
         """
         return self.get_by_id(id, organization_id) is not None
+
+
+class InitiativeScopedMixin(Generic[T]):
+    """
+    Mixin for repositories whose model has a one-to-one ``initiative_id``.
+
+    Must be combined with BaseRepository (relies on ``self.model`` and
+    ``self.db``). The lookup is built with ``lambda_stmt`` so its compiled
+    SQL is cached per model and reused across calls.
+    """
+
+    def get_by_initiative(self, initiative_id: UUID) -> Optional[T]:
+        """
+        Get the entity belonging to an initiative.
+
+        Args:
+            initiative_id: Initiative ID
+
+        Returns:
+            Entity if exists, None otherwise
+        """
+        model = self.model
+        stmt = lambda_stmt(
+            lambda: select(model).where(model.initiative_id == initiative_id)
+        )
+        result = self.db.execute(stmt)
+        return result.scalar_one_or_none()
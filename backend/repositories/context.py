@@ -7,8 +7,19 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from backend.cache import TTLCache
+from backend.config import settings
 from backend.models import Context
 from backend.repositories.base import BaseRepository
+from backend.schemas.context import ContextResponse
+
+
+# Current context per organization, as detached snapshots. Agent routes
+# check it on every request while it only changes on new versions. The
+# routes only gate on a context existing, and the current version can be
+# switched but never deleted, so an entry another process has superseded
+# is still a correct answer for them (see backend.cache).
+current_context_cache = TTLCache(ttl_seconds=settings.context_cache_ttl_seconds)
 
 
 class ContextRepository(BaseRepository[Context]):
@@ -35,6 +46,29 @@ class ContextRepository(BaseRepository[Context]):
         result = self.db.execute(query)
         return result.scalar_one_or_none()
 
+    def get_current_snapshot(self, organization_id: UUID) -> Optional[ContextResponse]:
+        """
+        Get the current context as a cached, session-independent snapshot.
+
+        Served from current_context_cache for up to
+        CONTEXT_CACHE_TTL_SECONDS; creating or switching the current
+        version drops the organization's entry.
+
+        Args:
+            organization_id: Organization ID
+
+        Returns:
+            Snapshot of the current context or None if none exists
+        """
+        snapshot = current_context_cache.get(organization_id)
+        if snapshot is None:
+            context = self.get_current(organization_id)
+            if context is None:
+                return None
+            snapshot = ContextResponse.model_validate(context)
+            current_context_cache.set(organization_id, snapshot)
+        return snapshot
+
     def get_by_version(
         self,
         organization_id: UUID,
@@ -136,6 +170,8 @@ class ContextRepository(BaseRepository[Context]):
         for ctx in existing_contexts:
             ctx.is_current = False
 
+        current_context_cache.invalidate(organization_id)
+
         # Create new context
         new_context = Context(
             organization_id=organization_id,
@@ -177,6 +213,7 @@ class ContextRepository(BaseRepository[Context]):
             ctx.is_current = (ctx.id == id)
 
         self.db.flush()
+        current_context_cache.invalidate(organization_id)
         self.db.refresh(context)
         return context
 
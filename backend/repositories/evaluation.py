@@ -2,36 +2,21 @@
 Repository for Evaluation operations.
 """
 
-from typing import Optional
 from uuid import UUID
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from backend.models import Evaluation
-from backend.repositories.base import BaseRepository
+from backend.repositories.base import BaseRepository, InitiativeScopedMixin
+from backend.repositories.results_cache import invalidate_initiative_results
 
 
-class EvaluationRepository(BaseRepository[Evaluation]):
+class EvaluationRepository(InitiativeScopedMixin[Evaluation], BaseRepository[Evaluation]):
     """Repository for Evaluation CRUD operations."""
 
     def __init__(self, db: Session):
         """Initialize Evaluation repository."""
         super().__init__(Evaluation, db)
 
-    def get_by_initiative(self, initiative_id: UUID) -> Optional[Evaluation]:
-        """
-        Get evaluation for a specific initiative.
-
-        Args:
-            initiative_id: Initiative ID
-
-        Returns:
-            Evaluation if exists, None otherwise
-        """
-        query = select(Evaluation).where(Evaluation.initiative_id == initiative_id)
-        result = self.db.execute(query)
-        return result.scalar_one_or_none()
-
     def create_or_update(
         self,
         initiative_id: UUID,
@@ -55,6 +40,8 @@ class EvaluationRepository(BaseRepository[Evaluation]):
         Returns:
             Evaluation object (new or updated)
         """
+        invalidate_initiative_results(initiative_id)
+
         # Check if evaluation exists
         existing = self.get_by_initiative(initiative_id)
 
@@ -95,6 +82,8 @@ class EvaluationRepository(BaseRepository[Evaluation]):
         Returns:
             True if deleted, False if not found
         """
+        invalidate_initiative_results(initiative_id)
+
         evaluation = self.get_by_initiative(initiative_id)
         if evaluation:
             self.db.delete(evaluation)
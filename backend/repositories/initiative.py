@@ -2,15 +2,39 @@
 Initiative repository for data access.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy import select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, update, func, bindparam, and_, exists
+from sqlalchemy.orm import Session, defer, joinedload, raiseload
 
-from backend.models import Initiative, InitiativeStatus
+from backend.config import settings
+from backend.models import Context, Initiative, InitiativeStatus, MRD, Score
 from backend.repositories.base import BaseRepository
 
 
+# Built once at import; the expanding IN keeps a single cached compiled
+# form regardless of how many statuses are passed
+_READY_FOR_MRD_STMT = select(Initiative).where(
+    Initiative.organization_id == bindparam("organization_id"),
+    Initiative.status.in_(bindparam("statuses", expanding=True))
+).order_by(Initiative.readiness_score.desc())
+
+_READY_FOR_MRD_STATUSES = [InitiativeStatus.IN_QA, InitiativeStatus.READY]
+
+
+def _for_route(query):
+    """
+    Apply strict_relationship_loading to a loader used by the agent routes.
+
+    The routes read only the columns they fetch up front, so with the
+    setting enabled, touching any relationship raises instead of issuing
+    a lazy SELECT.
+    """
+    if settings.strict_relationship_loading:
+        query = query.options(raiseload("*"))
+    return query
+
+
 class InitiativeRepository(BaseRepository[Initiative]):
     """Repository for Initiative entities."""
 
@@ -67,6 +91,141 @@ class InitiativeRepository(BaseRepository[Initiative]):
         result = self.db.execute(query)
         return result.scalar_one_or_none()
 
+    def get_generation_state(
+        self,
+        id: UUID,
+        organization_id: UUID
+    ) -> Optional[Tuple[InitiativeStatus, int]]:
+        """
+        Get just the columns question generation gates on.
+
+        Args:
+            id: Initiative ID
+            organization_id: Organization ID
+
+        Returns:
+            (status, iteration_count), or None if not found
+        """
+        query = select(Initiative.status, Initiative.iteration_count).where(
+            Initiative.id == id,
+            Initiative.organization_id == organization_id
+        )
+
+        row = self.db.execute(query).first()
+        if row is None:
+            return None
+        return row.status, row.iteration_count
+
+    def exists(self, id: UUID, organization_id: UUID) -> bool:
+        """
+        Check that an initiative exists in the organization without loading it.
+
+        Args:
+            id: Initiative ID
+            organization_id: Organization ID
+
+        Returns:
+            True if the initiative exists and belongs to the organization
+        """
+        query = select(exists().where(
+            Initiative.id == id,
+            Initiative.organization_id == organization_id
+        ))
+        return bool(self.db.scalar(query))
+
+    def get_with_context(
+        self,
+        id: UUID,
+        organization_id: UUID
+    ) -> Tuple[Optional[Initiative], Optional[Context]]:
+        """
+        Get an initiative and its organization's current context in one query.
+
+        The context is outer-joined so callers can still tell a missing
+        initiative from a missing context.
+
+        Args:
+            id: Initiative ID
+            organization_id: Organization ID
+
+        Returns:
+            (initiative, context); either may be None
+        """
+        query = select(Initiative, Context).outerjoin(
+            Context,
+            and_(
+                Context.organization_id == Initiative.organization_id,
+                Context.is_current == True
+            )
+        ).where(
+            Initiative.id == id,
+            Initiative.organization_id == organization_id
+        )
+
+        row = self.db.execute(_for_route(query)).first()
+        if row is None:
+            return None, None
+        return row.Initiative, row.Context
+
+    def get_with_mrd(
+        self,
+        id: UUID,
+        organization_id: UUID
+    ) -> Tuple[Optional[Initiative], Optional[MRD]]:
+        """
+        Get an initiative and its MRD in one tenant-scoped query.
+
+        The MRD is outer-joined so callers can still tell a missing
+        initiative from a missing MRD. Its structured ``sections`` JSON,
+        which duplicates the assembled content, is deferred: the MRD
+        routes only read the content and metadata.
+
+        Args:
+            id: Initiative ID
+            organization_id: Organization ID
+
+        Returns:
+            (initiative, mrd); either may be None
+        """
+        query = select(Initiative, MRD).outerjoin(
+            MRD, MRD.initiative_id == Initiative.id
+        ).where(
+            Initiative.id == id,
+            Initiative.organization_id == organization_id
+        ).options(defer(MRD.sections))
+
+        row = self.db.execute(_for_route(query)).first()
+        if row is None:
+            return None, None
+        return row.Initiative, row.MRD
+
+    def get_with_score(
+        self,
+        id: UUID,
+        organization_id: UUID
+    ) -> Tuple[Optional[Initiative], Optional[Score]]:
+        """
+        Get an initiative and its score in one tenant-scoped query.
+
+        Args:
+            id: Initiative ID
+            organization_id: Organization ID
+
+        Returns:
+            (initiative, score); either may be None
+        """
+        query = select(Initiative, Score).outerjoin(
+            Score, Score.initiative_id == Initiative.id
+        ).where(
+            Initiative.id == id,
+            Initiative.organization_id == organization_id
+        )
+
+        row = self.db.execute(_for_route(query)).first()
+        if row is None:
+            return None, None
+        return row.Initiative, row.Score
+
     def get_ready_for_mrd(self, organization_id: UUID) -> List[Initiative]:
         """
         Get initiatives that are ready for MRD generation.
@@ -79,12 +238,10 @@ class InitiativeRepository(BaseRepository[Initiative]):
         Returns:
             List of initiatives ready for MRD generation
         """
-        query = select(Initiative).where(
-            Initiative.organization_id == organization_id,
-            Initiative.status.in_([InitiativeStatus.IN_QA, InitiativeStatus.READY])
-        ).order_by(Initiative.readiness_score.desc())
-
-        result = self.db.execute(query)
+        result = self.db.execute(
+            _READY_FOR_MRD_STMT,
+            {"organization_id": organization_id, "statuses": _READY_FOR_MRD_STATUSES}
+        )
         return list(result.scalars().all())
 
     def update_status(
@@ -150,18 +307,25 @@ class InitiativeRepository(BaseRepository[Initiative]):
         Returns:
             Updated initiative or None if not found
         """
-        initiative = self.get_by_id(id, organization_id)
-        if initiative:
-            initiative.iteration_count += 1
-            self.db.flush()
-            self.db.refresh(initiative)
-        return initiative
+        # Increment in the database and read the row back in the same
+        # statement, instead of SELECT + UPDATE + refresh
+        stmt = update(Initiative).where(
+            Initiative.id == id,
+            Initiative.organization_id == organization_id
+        ).values(
+            iteration_count=Initiative.iteration_count + 1
+        ).returning(Initiative)
+
+        return self.db.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).one_or_none()
 
     def search_by_title(
         self,
         search_term: str,
         organization_id: UUID,
-        limit: int = 20
+        limit: int = 20,
+        prefix: bool = False
     ) -> List[Initiative]:
         """
         Search initiatives by title or description.
@@ -170,15 +334,31 @@ class InitiativeRepository(BaseRepository[Initiative]):
             search_term: Term to search for
             organization_id: Organization ID
             limit: Maximum number of results
+            prefix: Only match titles starting with the term (type-ahead).
+                Served by ix_initiatives_org_title_prefix instead of a scan.
 
         Returns:
             List of matching initiatives
         """
-        search_pattern = f"%{search_term}%"
+        # Treat LIKE wildcards in user input literally
+        escaped = (
+            search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+
+        if prefix:
+            condition = func.lower(Initiative.title).like(
+                f"{escaped.lower()}%", escape="\\"
+            )
+        else:
+            search_pattern = f"%{escaped}%"
+            condition = (
+                Initiative.title.ilike(search_pattern, escape="\\") |
+                Initiative.description.ilike(search_pattern, escape="\\")
+            )
+
         query = select(Initiative).where(
             Initiative.organization_id == organization_id,
-            (Initiative.title.ilike(search_pattern) |
-             Initiative.description.ilike(search_pattern))
+            condition
         ).order_by(Initiative.created_at.desc()).limit(limit)
 
         result = self.db.execute(query)
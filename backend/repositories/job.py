@@ -4,10 +4,12 @@ Job repository for managing async background jobs.
 
 from typing import Optional, List
 from uuid import UUID
-from sqlalchemy import select
+from datetime import datetime
+
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
-from backend.models import Job, JobStatus, JobType
+from backend.models import Initiative, Job, JobStatus, JobType
 from backend.repositories.base import BaseRepository
 
 
@@ -55,6 +57,61 @@ class JobRepository(BaseRepository[Job]):
         result = self.db.execute(query)
         return list(result.scalars().all())
 
+    def lock_initiative_dispatch(self, initiative_id: UUID) -> None:
+        """
+        Serialize job dispatch for an initiative until the transaction ends.
+
+        Locks the initiative row, so a concurrent request in any API
+        process waits here and then sees this transaction's job in its
+        in-flight check. Dispatches for other initiatives are unaffected.
+        SQLite ignores FOR UPDATE, so there a no-op UPDATE takes the
+        database write lock instead.
+
+        Args:
+            initiative_id: Initiative ID
+        """
+        if self.db.get_bind().dialect.name == "sqlite":
+            self.db.execute(
+                update(Initiative)
+                .where(Initiative.id == initiative_id)
+                .values(updated_at=Initiative.updated_at)
+                .execution_options(synchronize_session=False)
+            )
+        else:
+            self.db.execute(
+                select(Initiative.id).where(Initiative.id == initiative_id).with_for_update()
+            )
+
+    def get_in_flight(
+        self,
+        initiative_id: UUID,
+        job_type: JobType,
+        created_after: datetime
+    ) -> Optional[Job]:
+        """
+        Get the newest pending or running job of a type for an initiative.
+
+        Jobs created before ``created_after`` are ignored so a job left
+        behind by a crashed worker does not block new requests forever.
+
+        Args:
+            initiative_id: Initiative ID
+            job_type: Type of job
+            created_after: Oldest creation time still considered in flight
+
+        Returns:
+            The in-flight job, or None
+        """
+        query = select(Job).where(
+            Job.initiative_id == initiative_id,
+            Job.job_type == job_type,
+            Job.status.in_([JobStatus.PENDING, JobStatus.IN_PROGRESS]),
+            Job.created_at >= created_after
+        ).order_by(Job.created_at.desc()).limit(1)
+
+        result = self.db.execute(query)
+        return result.scalar_one_or_none()
+
     def get_pending_jobs(self, limit: int = 100) -> List[Job]:
         """Get pending jobs to process."""
         query = select(Job).where(
@@ -64,12 +121,35 @@ class JobRepository(BaseRepository[Job]):
         result = self.db.execute(query)
         return list(result.scalars().all())
 
+    def claim(self, job_id: UUID) -> bool:
+        """
+        Atomically move a PENDING job to IN_PROGRESS.
+
+        The conditional UPDATE lets several worker processes poll the same
+        table; only the worker whose update matches the row runs the job.
+
+        Returns:
+            True if this caller claimed the job
+        """
+        result = self.db.execute(
+            update(Job).where(
+                Job.id == job_id,
+                Job.status == JobStatus.PENDING
+            ).values(
+                status=JobStatus.IN_PROGRESS,
+                progress_message="Starting job...",
+                started_at=datetime.utcnow()
+            ).execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
     def create_job(
         self,
         job_type: JobType,
         organization_id: UUID,
         created_by: UUID,
-        initiative_id: Optional[UUID] = None
+        initiative_id: Optional[UUID] = None,
+        progress_message: Optional[str] = None
     ) -> Job:
         """Create a new job."""
         job = Job(
@@ -78,7 +158,8 @@ class JobRepository(BaseRepository[Job]):
             organization_id=organization_id,
             created_by=created_by,
             initiative_id=initiative_id,
-            progress_percent=0  # Initialize to 0
+            progress_percent=0,  # Initialize to 0
+            progress_message=progress_message
         )
         self.db.add(job)
         self.db.flush()  # Get the ID without committing
@@ -2,36 +2,21 @@
 Repository for MRD (Market Requirements Document) operations.
 """
 
-from typing import Optional
 from uuid import UUID
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from backend.models import MRD
-from backend.repositories.base import BaseRepository
+from backend.repositories.base import BaseRepository, InitiativeScopedMixin
+from backend.repositories.results_cache import invalidate_initiative_results
 
 
-class MRDRepository(BaseRepository[MRD]):
+class MRDRepository(InitiativeScopedMixin[MRD], BaseRepository[MRD]):
     """Repository for MRD CRUD operations."""
 
     def __init__(self, db: Session):
         """Initialize MRD repository."""
         super().__init__(MRD, db)
 
-    def get_by_initiative(self, initiative_id: UUID) -> Optional[MRD]:
-        """
-        Get MRD for a specific initiative.
-
-        Args:
-            initiative_id: Initiative ID
-
-        Returns:
-            MRD if exists, None otherwise
-        """
-        query = select(MRD).where(MRD.initiative_id == initiative_id)
-        result = self.db.execute(query)
-        return result.scalar_one_or_none()
-
     def create_or_update(
         self,
         initiative_id: UUID,
@@ -59,6 +44,8 @@ class MRDRepository(BaseRepository[MRD]):
         Returns:
             MRD object (new or updated)
         """
+        invalidate_initiative_results(initiative_id)
+
         # Check if MRD exists
         existing = self.get_by_initiative(initiative_id)
 
@@ -101,6 +88,8 @@ class MRDRepository(BaseRepository[MRD]):
         Returns:
             True if deleted, False if not found
         """
+        invalidate_initiative_results(initiative_id)
+
         mrd = self.get_by_initiative(initiative_id)
         if mrd:
             self.delete(mrd.id)
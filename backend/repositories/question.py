@@ -4,8 +4,8 @@ Question repository for data access.
 
 from typing import Optional, List
 from uuid import UUID
-from sqlalchemy import select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from backend.models import Question, QuestionPriority, QuestionCategory
 from backend.repositories.base import BaseRepository
@@ -17,10 +17,29 @@ class QuestionRepository(BaseRepository[Question]):
     def __init__(self, db: Session):
         super().__init__(Question, db)
 
+    def bulk_create(self, questions: List[Question]) -> List[Question]:
+        """
+        Insert several questions with a single flush.
+
+        Unlike create(), the rows are not refreshed afterwards: ids and
+        timestamps are generated client-side, so the INSERTs go out as
+        one batched statement.
+
+        Args:
+            questions: Unsaved questions
+
+        Returns:
+            The same questions, now persistent
+        """
+        self.db.add_all(questions)
+        self.db.flush()
+        return questions
+
     def get_by_initiative(
         self,
         initiative_id: UUID,
-        iteration: Optional[int] = None
+        iteration: Optional[int] = None,
+        with_answers: bool = False
     ) -> List[Question]:
         """
         Get all questions for an initiative.
@@ -28,6 +47,8 @@ class QuestionRepository(BaseRepository[Question]):
         Args:
             initiative_id: Initiative ID
             iteration: Optional iteration number to filter by
+            with_answers: Load each question's answer in one extra query
+                (read ``question.answer``) instead of one lookup per question
 
         Returns:
             List of questions for the initiative
@@ -37,6 +58,9 @@ class QuestionRepository(BaseRepository[Question]):
         if iteration is not None:
             query = query.where(Question.iteration == iteration)
 
+        if with_answers:
+            query = query.options(selectinload(Question.answer))
+
         query = query.order_by(
             Question.priority.asc(),  # P0 first
             Question.category.asc(),
@@ -61,7 +85,7 @@ class QuestionRepository(BaseRepository[Question]):
         """
         query = select(Question).where(
             Question.id == id
-        ).options(joinedload(Question.answers))
+        ).options(joinedload(Question.answer))
 
         result = self.db.execute(query)
         return result.scalar_one_or_none()
@@ -70,7 +94,8 @@ class QuestionRepository(BaseRepository[Question]):
         self,
         initiative_id: UUID,
         priority: QuestionPriority,
-        iteration: Optional[int] = None
+        iteration: Optional[int] = None,
+        with_answers: bool = False
     ) -> List[Question]:
         """
         Get questions by priority level.
@@ -79,6 +104,7 @@ class QuestionRepository(BaseRepository[Question]):
             initiative_id: Initiative ID
             priority: Question priority (P0/P1/P2)
             iteration: Optional iteration number
+            with_answers: Load each question's answer in one extra query
 
         Returns:
             List of questions with specified priority
@@ -91,6 +117,9 @@ class QuestionRepository(BaseRepository[Question]):
         if iteration is not None:
             query = query.where(Question.iteration == iteration)
 
+        if with_answers:
+            query = query.options(selectinload(Question.answer))
+
         query = query.order_by(
             Question.category.asc(),
             Question.created_at.asc()
@@ -210,27 +239,20 @@ class QuestionRepository(BaseRepository[Question]):
         Returns:
             Dictionary with counts for P0, P1, P2
         """
-        from sqlalchemy import func
-
-        query = select(
-            Question.priority,
-            func.count(Question.id)
-        ).where(
+        # One row with a filtered count per priority, so priorities without
+        # questions come back as 0 straight from the database
+        query = select(*(
+            func.count().filter(Question.priority == priority).label(priority.value)
+            for priority in QuestionPriority
+        )).where(
             Question.initiative_id == initiative_id
         )
 
         if iteration is not None:
             query = query.where(Question.iteration == iteration)
 
-        query = query.group_by(Question.priority)
-
         result = self.db.execute(query)
-        counts = {priority.value: 0 for priority in QuestionPriority}
-
-        for priority, count in result.all():
-            counts[priority.value] = count
-
-        return counts
+        return dict(result.one()._mapping)
 
     def get_latest_iteration(self, initiative_id: UUID) -> int:
         """
@@ -242,11 +264,11 @@ class QuestionRepository(BaseRepository[Question]):
         Returns:
             Latest iteration number (0 if no questions exist)
         """
-        from sqlalchemy import func
-
-        query = select(func.max(Question.iteration)).where(
+        # Served by ix_questions_initiative_iteration: a single backward
+        # index probe instead of aggregating every question row
+        query = select(Question.iteration).where(
             Question.initiative_id == initiative_id
-        )
+        ).order_by(Question.iteration.desc()).limit(1)
 
         result = self.db.execute(query)
         max_iteration = result.scalar_one_or_none()
@@ -0,0 +1,65 @@
+"""
+In-process cache of generated initiative results.
+
+The dashboard polls the MRD, scores and readiness evaluation of an
+initiative while those rows only change when a generator job, a
+fine-tune or a delete writes them. Those writers may run in another API
+worker or in a dedicated job-worker process, so a cached entry is only
+served after a cheap lookup confirms the row it was built from is still
+current: entries are keyed by (kind, organization_id, initiative_id,
+stamp), where the stamp is the row id plus its version or last-modified
+time. Local invalidation just frees superseded entries early.
+"""
+
+from typing import Hashable, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.cache import TTLCache
+from backend.config import settings
+from backend.models import MRD, Evaluation, Initiative, Score
+
+
+initiative_results_cache = TTLCache(ttl_seconds=settings.results_cache_ttl_seconds)
+
+# Column that changes on every write, per result kind
+_STAMP_COLUMNS = {
+    "mrd": (MRD, MRD.version),
+    "score": (Score, Score.scored_at),
+    "evaluation": (Evaluation, Evaluation.updated_at),
+}
+
+
+def result_cache_key(kind: str, organization_id: UUID, initiative_id: UUID, row) -> Tuple[Hashable, ...]:
+    """Cache key for a result built from ``row`` (an MRD, Score or Evaluation)."""
+    column = _STAMP_COLUMNS[kind][1]
+    return (kind, organization_id, initiative_id, (row.id, getattr(row, column.key)))
+
+
+def get_current_result(db: Session, kind: str, organization_id: UUID, initiative_id: UUID):
+    """
+    Return the cached result for an initiative if it is still current.
+
+    Reads only the row id and stamp column, scoped to the organization,
+    so a hit costs one small indexed query instead of loading the row.
+    Returns None when nothing is cached for the current row.
+    """
+    model, column = _STAMP_COLUMNS[kind]
+    stamp = db.execute(
+        select(model.id, column)
+        .join(Initiative, Initiative.id == model.initiative_id)
+        .where(
+            model.initiative_id == initiative_id,
+            Initiative.organization_id == organization_id
+        )
+    ).first()
+    if stamp is None:
+        return None
+    return initiative_results_cache.get((kind, organization_id, initiative_id, tuple(stamp)))
+
+
+def invalidate_initiative_results(initiative_id: UUID) -> None:
+    """Forget cached MRD, score and evaluation responses for an initiative."""
+    initiative_results_cache.invalidate_matching(lambda key: key[2] == initiative_id)
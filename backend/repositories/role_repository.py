@@ -6,6 +6,7 @@ from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 
+from backend.config import settings
 from backend.models.role import Role
 
 
@@ -36,6 +37,17 @@ class RoleRepository:
         """Get role by ID."""
         return self.db.query(Role).filter(Role.id == role_id).first()
 
+    def get_many(self, role_ids: List[UUID]) -> List[Role]:
+        """
+        Get the roles with the given IDs using a single query.
+
+        Unknown IDs are left out; callers compare the result with the
+        requested IDs to find them.
+        """
+        if not role_ids:
+            return []
+        return self.db.query(Role).filter(Role.id.in_(role_ids)).all()
+
     def get_by_name(self, name: str) -> Optional[Role]:
         """Get role by name."""
         return self.db.query(Role).filter(Role.name == name).first()
@@ -74,7 +86,15 @@ class RoleRepository:
         return True
 
     def ensure_default_roles(self) -> None:
-        """Ensure default roles exist in the database."""
+        """
+        Ensure default roles exist in the database.
+
+        No-op unless settings.auto_seed_roles is enabled; production
+        deployments get the roles from the seed_default_roles migration.
+        """
+        if not settings.auto_seed_roles:
+            return
+
         default_roles = [
             ("admin", "Full system access, can manage users and contexts"),
             ("business_dev", "Business Development - can answer Business_Dev category questions"),
@@ -84,6 +104,16 @@ class RoleRepository:
             ("financial", "Financial - can answer Financial category questions"),
         ]
 
-        for name, description in default_roles:
-            if not self.get_by_name(name):
-                self.create(name=name, description=description)
+        existing = {
+            name for (name,) in self.db.query(Role.name).filter(
+                Role.name.in_([name for name, _ in default_roles])
+            )
+        }
+        missing = [
+            Role(name=name, description=description)
+            for name, description in default_roles
+            if name not in existing
+        ]
+        if missing:
+            self.db.add_all(missing)
+            self.db.commit()
@@ -2,36 +2,31 @@
 Repository for Score operations.
 """
 
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from backend.models import Score
-from backend.repositories.base import BaseRepository
+from backend.repositories.base import BaseRepository, InitiativeScopedMixin
+from backend.repositories.results_cache import invalidate_initiative_results
 
 
-class ScoreRepository(BaseRepository[Score]):
+# Dialects with INSERT ... ON CONFLICT DO UPDATE support
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+class ScoreRepository(InitiativeScopedMixin[Score], BaseRepository[Score]):
     """Repository for Score CRUD operations."""
 
     def __init__(self, db: Session):
         """Initialize Score repository."""
         super().__init__(Score, db)
 
-    def get_by_initiative(self, initiative_id: UUID) -> Optional[Score]:
-        """
-        Get score for a specific initiative.
-
-        Args:
-            initiative_id: Initiative ID
-
-        Returns:
-            Score if exists, None otherwise
-        """
-        query = select(Score).where(Score.initiative_id == initiative_id)
-        result = self.db.execute(query)
-        return result.scalar_one_or_none()
-
     def create_or_update(
         self,
         initiative_id: UUID,
@@ -73,49 +68,50 @@ class ScoreRepository(BaseRepository[Score]):
         Returns:
             Score object (new or updated)
         """
-        # Check if score exists
-        existing = self.get_by_initiative(initiative_id)
+        invalidate_initiative_results(initiative_id)
+
+        fields = {
+            "reach": reach,
+            "impact": impact,
+            "confidence": confidence,
+            "effort": effort,
+            "rice_score": rice_score,
+            "rice_reasoning": rice_reasoning,
+            "feasibility": feasibility,
+            "desirability": desirability,
+            "viability": viability,
+            "fdv_score": fdv_score,
+            "fdv_reasoning": fdv_reasoning,
+            "scored_by": scored_by,
+            "data_quality": data_quality,
+            "warnings": warnings,
+            # Re-scoring moves scored_at, which also marks cached scores as stale
+            "scored_at": datetime.utcnow(),
+        }
+
+        dialect = self.db.get_bind().dialect.name
+        if dialect in _UPSERT_INSERTS:
+            # Single INSERT ... ON CONFLICT (initiative_id) DO UPDATE round-trip
+            stmt = _UPSERT_INSERTS[dialect](Score).values(
+                initiative_id=initiative_id, **fields
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Score.initiative_id],
+                set_=fields
+            ).returning(Score)
+            return self.db.scalars(
+                stmt, execution_options={"populate_existing": True}
+            ).one()
 
+        existing = self.get_by_initiative(initiative_id)
         if existing:
-            # Update existing score
-            existing.reach = reach
-            existing.impact = impact
-            existing.confidence = confidence
-            existing.effort = effort
-            existing.rice_score = rice_score
-            existing.rice_reasoning = rice_reasoning
-            existing.feasibility = feasibility
-            existing.desirability = desirability
-            existing.viability = viability
-            existing.fdv_score = fdv_score
-            existing.fdv_reasoning = fdv_reasoning
-            existing.scored_by = scored_by
-            existing.data_quality = data_quality
-            existing.warnings = warnings
-
+            for name, value in fields.items():
+                setattr(existing, name, value)
             self.db.flush()
             self.db.refresh(existing)
             return existing
-        else:
-            # Create new score
-            score = Score(
-                initiative_id=initiative_id,
-                reach=reach,
-                impact=impact,
-                confidence=confidence,
-                effort=effort,
-                rice_score=rice_score,
-                rice_reasoning=rice_reasoning,
-                feasibility=feasibility,
-                desirability=desirability,
-                viability=viability,
-                fdv_score=fdv_score,
-                fdv_reasoning=fdv_reasoning,
-                scored_by=scored_by,
-                data_quality=data_quality,
-                warnings=warnings
-            )
-            return self.create(score)
+
+        return self.create(Score(initiative_id=initiative_id, **fields))
 
     def delete_by_initiative(self, initiative_id: UUID) -> bool:
         """
@@ -127,6 +123,8 @@ class ScoreRepository(BaseRepository[Score]):
         Returns:
             True if deleted, False if not found
         """
+        invalidate_initiative_results(initiative_id)
+
         score = self.get_by_initiative(initiative_id)
         if score:
             self.delete(score.id)
@@ -4,44 +4,130 @@ Repository for User model operations.
 
 import secrets
 import string
+from decimal import Decimal
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, func, lambda_stmt, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload, load_only
 
+from backend.models.role import Role
 from backend.models.user import User
 from backend.models.user_role import UserRole as UserRoleAssociation
 from backend.auth.password import hash_password
 
 
+# Character sets for generated passwords (one of each is always included)
+_PW_SETS = (
+    string.ascii_lowercase,
+    string.ascii_uppercase,
+    string.digits,
+    "!@#$%^&*",
+)
+_PW_ALPHABET = "".join(_PW_SETS)
+_SYS_RAND = secrets.SystemRandom()
+
+# Dialects whose INSERT supports ON CONFLICT ... DO NOTHING
+_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
 class UserRepository:
-    """Repository for managing users."""
+    """
+    Repository for managing users.
+
+    Write methods flush but do not commit; the caller owns the transaction.
+    """
 
     def __init__(self, db: Session):
         self.db = db
 
-    def get_all(self, organization_id: UUID) -> List[User]:
-        """Get all users in an organization."""
-        return self.db.query(User).filter(
-            User.organization_id == organization_id
-        ).options(
-            joinedload(User.user_roles).joinedload(UserRoleAssociation.role)
-        ).order_by(User.name).all()
+    def get_all(
+        self,
+        organization_id: UUID,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[UUID] = None
+    ) -> List[User]:
+        """
+        Get users in an organization, ordered by name.
+
+        Roles are loaded with selectinload (one flat query per level) rather
+        than a users x user_roles x roles join that repeats every user row.
+        Only the columns the admin list view renders are selected.
+
+        Args:
+            organization_id: Organization ID
+            limit: Maximum number of users to return (all when None)
+            offset: Number of users to skip
+            after: Keyset cursor; return users sorting after this user ID
+        """
+        query = self.db.query(User).filter(User.organization_id == organization_id)
+        if after is not None:
+            # Seek past (name, id) of the cursor user instead of skipping rows
+            after_name = select(User.name).where(
+                User.id == after,
+                User.organization_id == organization_id
+            ).scalar_subquery()
+            query = query.filter(or_(
+                User.name > after_name,
+                and_(User.name == after_name, User.id > after)
+            ))
+
+        return query.options(
+            load_only(
+                User.id,
+                User.email,
+                User.name,
+                User.is_active,
+                User.created_at,
+                User.updated_at,
+                User.last_login_at,
+                User.monthly_budget_usd,
+                User.budget_updated_at,
+                User.budget_updated_by
+            ),
+            selectinload(User.user_roles).selectinload(UserRoleAssociation.role).load_only(
+                Role.id, Role.name, Role.description
+            ),
+            raiseload("*")
+        ).order_by(User.name, User.id).offset(offset).limit(limit).all()
+
+    def count(self, organization_id: UUID) -> int:
+        """Count users in an organization."""
+        return self.db.scalar(
+            select(func.count()).select_from(User).where(User.organization_id == organization_id)
+        )
+
+    def sum_monthly_budget(self, organization_id: UUID) -> Decimal:
+        """Total of monthly budgets across an organization's users."""
+        total = self.db.scalar(
+            select(func.sum(User.monthly_budget_usd)).where(User.organization_id == organization_id)
+        )
+        return Decimal(total) if total is not None else Decimal("0")
 
     def get_by_id(self, user_id: UUID, organization_id: UUID) -> Optional[User]:
         """Get user by ID within organization."""
-        return self.db.query(User).filter(
+        stmt = lambda_stmt(lambda: select(User).where(
             User.id == user_id,
             User.organization_id == organization_id
         ).options(
-            joinedload(User.user_roles).joinedload(UserRoleAssociation.role)
-        ).first()
+            joinedload(User.user_roles).joinedload(UserRoleAssociation.role),
+            raiseload("*")
+        ))
+        return self.db.execute(stmt).unique().scalar_one_or_none()
 
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
-        return self.db.query(User).filter(User.email == email).options(
-            joinedload(User.user_roles).joinedload(UserRoleAssociation.role)
-        ).first()
+        stmt = lambda_stmt(lambda: select(User).where(User.email == email).options(
+            joinedload(User.user_roles).joinedload(UserRoleAssociation.role),
+            raiseload("*")
+        ))
+        return self.db.execute(stmt).unique().scalar_one_or_none()
 
     def create(
         self,
@@ -50,10 +136,13 @@ class UserRepository:
         name: str,
         organization_id: UUID,
         is_active: bool = True
-    ) -> User:
+    ) -> Optional[User]:
         """
         Create a new user.
 
+        Email uniqueness is enforced by the unique index on users.email
+        rather than a look-up first, so concurrent creates cannot race.
+
         Args:
             email: User's email address
             password: Plain text password (will be hashed)
@@ -62,21 +151,30 @@ class UserRepository:
             is_active: Whether the user is active
 
         Returns:
-            The created user
+            The created user, or None if the email is already registered
         """
-        password_hash = hash_password(password)
-
-        user = User(
+        values = dict(
             email=email,
-            password_hash=password_hash,
+            password_hash=hash_password(password),
             name=name,
             organization_id=organization_id,
             is_active=is_active
         )
 
-        self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        dialect = self.db.get_bind().dialect.name
+        if dialect in _INSERTS:
+            # INSERT ... ON CONFLICT (email) DO NOTHING RETURNING: no row means taken
+            stmt = _INSERTS[dialect](User).values(**values).on_conflict_do_nothing(
+                index_elements=[User.email]
+            ).returning(User)
+            return self.db.scalars(stmt).one_or_none()
+
+        user = User(**values)
+        try:
+            with self.db.begin_nested():
+                self.db.add(user)
+        except IntegrityError:
+            return None
 
         return user
 
@@ -102,24 +200,54 @@ class UserRepository:
 
         Returns:
             The updated user or None if not found
+
+        Raises:
+            IntegrityError: If the new email is already registered; the
+                caller must roll back the session
         """
-        user = self.get_by_id(user_id, organization_id)
-        if not user:
-            return None
+        values = {
+            field: value
+            for field, value in (
+                ("email", email),
+                ("name", name),
+                ("is_active", is_active),
+                ("force_password_change", force_password_change),
+            )
+            if value is not None
+        }
+        if not values:
+            return self.get_by_id(user_id, organization_id)
+
+        # Single UPDATE ... RETURNING instead of loading the user and its roles first;
+        # "fetch" syncs any copy already in the session from the returned row
+        stmt = update(User).where(
+            User.id == user_id,
+            User.organization_id == organization_id
+        ).values(**values).returning(User)
+        return self.db.scalars(
+            stmt,
+            execution_options={"synchronize_session": "fetch"}
+        ).one_or_none()
 
-        if email is not None:
-            user.email = email
-        if name is not None:
-            user.name = name
-        if is_active is not None:
-            user.is_active = is_active
-        if force_password_change is not None:
-            user.force_password_change = force_password_change
+    def deactivate_many(self, user_ids: List[UUID], organization_id: UUID) -> List[UUID]:
+        """
+        Deactivate several users with a single UPDATE.
 
-        self.db.commit()
-        self.db.refresh(user)
+        Args:
+            user_ids: IDs of the users to deactivate
+            organization_id: Organization ID for security check
 
-        return user
+        Returns:
+            IDs of the users that were active and are now deactivated
+        """
+        if not user_ids:
+            return []
+        stmt = update(User).where(
+            User.id.in_(user_ids),
+            User.organization_id == organization_id,
+            User.is_active.is_(True)
+        ).values(is_active=False).returning(User.id)
+        return list(self.db.scalars(stmt, execution_options={"synchronize_session": "fetch"}))
 
     def change_password(
         self,
@@ -144,12 +272,11 @@ class UserRepository:
 
         user.password_hash = hash_password(new_password)
 
-        self.db.commit()
-        self.db.refresh(user)
+        self.db.flush()
 
         return user
 
-    def delete(self, user_id: UUID, organization_id: UUID) -> bool:
+    def delete(self, user_id: UUID, organization_id: UUID) -> Optional[User]:
         """
         Delete a user.
 
@@ -158,16 +285,16 @@ class UserRepository:
             organization_id: Organization ID for security check
 
         Returns:
-            True if deleted, False if not found
+            The deleted user (still readable until commit) or None if not found
         """
         user = self.get_by_id(user_id, organization_id)
         if not user:
-            return False
+            return None
 
         self.db.delete(user)
-        self.db.commit()
+        self.db.flush()
 
-        return True
+        return user
 
     @staticmethod
     def generate_random_password(length: int = 16) -> str:
@@ -180,25 +307,13 @@ class UserRepository:
         Returns:
             A random password containing letters, digits, and special characters
         """
-        # Define character sets
-        lowercase = string.ascii_lowercase
-        uppercase = string.ascii_uppercase
-        digits = string.digits
-        special = "!@#$%^&*"
-
         # Ensure at least one character from each set
-        password = [
-            secrets.choice(lowercase),
-            secrets.choice(uppercase),
-            secrets.choice(digits),
-            secrets.choice(special),
-        ]
+        password = [_SYS_RAND.choice(charset) for charset in _PW_SETS]
 
         # Fill the rest with random characters from all sets
-        all_chars = lowercase + uppercase + digits + special
-        password.extend(secrets.choice(all_chars) for _ in range(length - 4))
+        password.extend(_SYS_RAND.choice(_PW_ALPHABET) for _ in range(length - len(_PW_SETS)))
 
         # Shuffle to avoid predictable patterns
-        secrets.SystemRandom().shuffle(password)
+        _SYS_RAND.shuffle(password)
 
         return ''.join(password)
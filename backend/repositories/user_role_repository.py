@@ -4,21 +4,28 @@ Repository for UserRole model operations.
 
 from typing import List
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, joinedload
 
 from backend.models.user_role import UserRole
 from backend.models.role import Role
 
 
 class UserRoleRepository:
-    """Repository for managing user-role assignments."""
+    """
+    Repository for managing user-role assignments.
+
+    Write methods flush but do not commit; the caller owns the transaction.
+    """
 
     def __init__(self, db: Session):
         self.db = db
 
     def get_user_roles(self, user_id: UUID) -> List[UserRole]:
-        """Get all roles for a user."""
-        return self.db.query(UserRole).filter(UserRole.user_id == user_id).all()
+        """Get all roles for a user, with the Role rows loaded."""
+        return self.db.query(UserRole).filter(
+            UserRole.user_id == user_id
+        ).options(joinedload(UserRole.role)).all()
 
     def assign_role(self, user_id: UUID, role_id: UUID) -> UserRole:
         """
@@ -36,8 +43,7 @@ class UserRoleRepository:
         """
         user_role = UserRole(user_id=user_id, role_id=role_id)
         self.db.add(user_role)
-        self.db.commit()
-        self.db.refresh(user_role)
+        self.db.flush()
         return user_role
 
     def remove_role(self, user_id: UUID, role_id: UUID) -> bool:
@@ -60,37 +66,57 @@ class UserRoleRepository:
             return False
 
         self.db.delete(user_role)
-        self.db.commit()
+        self.db.flush()
         return True
 
     def set_user_roles(self, user_id: UUID, role_ids: List[UUID]) -> List[UserRole]:
         """
         Set the roles for a user (replaces existing roles).
 
+        Only the difference between the current and requested roles is
+        written: removed roles are deleted and new ones bulk-inserted.
+
         Args:
             user_id: The user's ID
             role_ids: List of role IDs to assign
 
         Returns:
-            List of UserRole associations
+            List of UserRole associations with their roles loaded
         """
-        # Remove all existing roles
-        self.db.query(UserRole).filter(UserRole.user_id == user_id).delete()
-
-        # Add new roles
-        user_roles = []
-        for role_id in role_ids:
-            user_role = UserRole(user_id=user_id, role_id=role_id)
-            self.db.add(user_role)
-            user_roles.append(user_role)
+        self.sync_user_roles(user_id, role_ids)
+        return self.get_user_roles(user_id)
 
-        self.db.commit()
+    def sync_user_roles(self, user_id: UUID, role_ids: List[UUID]) -> None:
+        """
+        Write the role changes for a user without reloading the assignments.
 
-        # Refresh all user_roles
-        for user_role in user_roles:
-            self.db.refresh(user_role)
+        For callers that already hold the Role rows (e.g. from validating the
+        requested IDs) and do not need the associations back.
 
-        return user_roles
+        Args:
+            user_id: The user's ID
+            role_ids: List of role IDs to assign
+        """
+        existing = {
+            role_id for (role_id,) in
+            self.db.query(UserRole.role_id).filter(UserRole.user_id == user_id)
+        }
+        requested = set(role_ids)
+        to_remove = existing - requested
+        to_add = [role_id for role_id in dict.fromkeys(role_ids) if role_id not in existing]
+
+        # Only touch the rows that actually change
+        if to_remove:
+            self.db.query(UserRole).filter(
+                UserRole.user_id == user_id,
+                UserRole.role_id.in_(to_remove)
+            ).delete()
+
+        if to_add:
+            self.db.execute(
+                insert(UserRole),
+                [{"user_id": user_id, "role_id": role_id} for role_id in to_add]
+            )
 
     def has_role(self, user_id: UUID, role_name: str) -> bool:
         """
@@ -103,7 +129,9 @@ class UserRoleRepository:
         Returns:
             True if the user has the role, False otherwise
         """
-        return self.db.query(UserRole).join(Role).filter(
-            UserRole.user_id == user_id,
-            Role.name == role_name
-        ).count() > 0
+        return self.db.query(
+            self.db.query(UserRole).join(Role).filter(
+                UserRole.user_id == user_id,
+                Role.name == role_name
+            ).exists()
+        ).scalar()
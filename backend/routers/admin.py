@@ -2,16 +2,21 @@
 Admin endpoints for user management and system configuration.
 """
 
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from backend.database import get_db
-from backend.dependencies.rbac import require_admin
+from backend.dependencies.rbac import require_admin, invalidate_user_roles
+from backend.dependencies.services import get_budget_service
 from backend.models.user import User
+from backend.models.role import Role
 from backend.repositories.user_repository import UserRepository
 from backend.repositories.role_repository import RoleRepository
 from backend.repositories.user_role_repository import UserRoleRepository
@@ -19,12 +24,17 @@ from backend.repositories.analytics import AnalyticsRepository
 from backend.services.audit_logger import AuditLogger
 from backend.services.budget_service import BudgetService
 from backend.auth.session import session_manager
+from backend.cache import TTLCache
+from backend.http_cache import etag_matches, payload_etag
+from backend.config import settings
 from backend.schemas.admin import (
     UserResponse,
     UserListResponse,
     CreateUserRequest,
     CreateUserResponse,
     UpdateUserRequest,
+    BulkDeactivateRequest,
+    BulkDeactivateResponse,
     ChangePasswordRequest,
     ChangePasswordResponse,
     RoleResponse,
@@ -42,21 +52,39 @@ router = APIRouter(prefix="/admin", tags=["Admin"])
 
 
 # Helper function to convert User model to UserResponse with roles
-def user_to_response(user: User, db: Session) -> UserResponse:
-    """Convert User model to UserResponse with role and budget information."""
-    roles = [
+def user_to_response(
+    user: User,
+    budget_service: BudgetService,
+    roles: Optional[List[Role]] = None,
+    budget_status: Optional[dict] = None
+) -> UserResponse:
+    """
+    Convert User model to UserResponse with role and budget information.
+
+    Pass roles when the caller already holds the user's Role rows to avoid
+    reloading the relationship, and
+    budget_status (from BudgetService.get_budget_statuses_bulk) when
+    converting many users so their budgets are fetched in one query.
+    """
+    if roles is None:
+        roles = [ur.role for ur in user.user_roles]
+
+    role_infos = [
         UserRoleInfo(
-            id=ur.role.id,
-            name=ur.role.name,
-            description=ur.role.description
+            id=role.id,
+            name=role.name,
+            description=role.description
         )
-        for ur in user.user_roles
+        for role in roles
     ]
 
     # Get budget information with warnings
-    budget_service = BudgetService(db)
     try:
-        budget_status_with_warnings = budget_service.get_budget_status_with_warnings(user.id)
+        budget_status_with_warnings = (
+            budget_status
+            if budget_status is not None
+            else budget_service.get_budget_statuses_bulk([user.id])[user.id]
+        )
         budget_info = BudgetInfo(
             monthly_budget_usd=budget_status_with_warnings["budget_limit"],
             current_spending_usd=budget_status_with_warnings["current_spending"],
@@ -78,7 +106,7 @@ def user_to_response(user: User, db: Session) -> UserResponse:
         email=user.email,
         name=user.name,
         is_active=user.is_active,
-        roles=roles,
+        roles=role_infos,
         budget=budget_info,
         created_at=user.created_at,
         updated_at=user.updated_at,
@@ -86,6 +114,34 @@ def user_to_response(user: User, db: Session) -> UserResponse:
     )
 
 
+def validate_role_ids(role_repo: RoleRepository, role_ids: List[UUID]) -> List[Role]:
+    """
+    Load the requested roles in one query, raising 400 if any do not exist.
+
+    Returns the roles in request order (duplicates removed).
+    """
+    roles_by_id = {role.id: role for role in role_repo.get_many(role_ids)}
+    missing = [role_id for role_id in role_ids if role_id not in roles_by_id]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Role ID {', '.join(str(role_id) for role_id in missing)} not found"
+        )
+    return [roles_by_id[role_id] for role_id in dict.fromkeys(role_ids)]
+
+
+# Budget dashboards change only when spending is recorded or an admin edits
+# users/budgets; cache them briefly and drop an organization's entries on edits.
+_BUDGET_CACHE_TTL_SECONDS = 30
+_SPENDING_TRENDS_CACHE_TTL_SECONDS = 300
+_budget_cache = TTLCache(ttl_seconds=_BUDGET_CACHE_TTL_SECONDS)
+
+
+def _invalidate_budget_cache(organization_id: UUID) -> None:
+    """Drop cached budget dashboard responses for an organization."""
+    _budget_cache.invalidate_matching(lambda key: key[1] == organization_id)
+
+
 # Role endpoints
 @router.get("/roles", response_model=List[RoleResponse])
 def list_roles(
@@ -102,17 +158,37 @@ def list_roles(
 @router.get("/users", response_model=UserListResponse)
 def list_users(
     current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    budget_service: BudgetService = Depends(get_budget_service),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of users to return"),
+    offset: int = Query(0, ge=0, description="Number of users to skip"),
+    after: Optional[UUID] = Query(None, description="Return users after this cursor (next_cursor of the previous page)")
 ):
-    """Get all users in the organization."""
+    """
+    Get a page of users in the organization, ordered by name.
+
+    Pass the previous page's next_cursor as ``after`` to page without the
+    cost of large offsets.
+    """
     user_repo = UserRepository(db)
-    users = user_repo.get_all(current_user.organization_id)
+    users = user_repo.get_all(current_user.organization_id, limit=limit, offset=offset, after=after)
+
+    budget_statuses = budget_service.get_budget_statuses_bulk([user.id for user in users])
+    user_responses = [
+        user_to_response(user, budget_service, budget_status=budget_statuses.get(user.id))
+        for user in users
+    ]
 
-    user_responses = [user_to_response(user, db) for user in users]
+    # A short page ends the list, so only count when there may be more rows
+    if after is None and len(users) < limit and (users or offset == 0):
+        total = offset + len(users)
+    else:
+        total = user_repo.count(current_user.organization_id)
 
     return UserListResponse(
         users=user_responses,
-        total=len(user_responses)
+        total=total,
+        next_cursor=users[-1].id if len(users) == limit else None
     )
 
 
@@ -120,7 +196,8 @@ def list_users(
 def get_user(
     user_id: UUID,
     current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    budget_service: BudgetService = Depends(get_budget_service)
 ):
     """Get a specific user by ID."""
     user_repo = UserRepository(db)
@@ -132,14 +209,15 @@ def get_user(
             detail="User not found"
         )
 
-    return user_to_response(user, db)
+    return user_to_response(user, budget_service)
 
 
 @router.post("/users", response_model=CreateUserResponse, status_code=status.HTTP_201_CREATED)
 def create_user(
     request: CreateUserRequest,
     current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    budget_service: BudgetService = Depends(get_budget_service)
 ):
     """
     Create a new user.
@@ -151,14 +229,6 @@ def create_user(
     user_role_repo = UserRoleRepository(db)
     audit_logger = AuditLogger(db)
 
-    # Check if email already exists
-    existing_user = user_repo.get_by_email(request.email)
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-
     # Validate password requirements
     if not request.generate_password and not request.password:
         raise HTTPException(
@@ -173,7 +243,10 @@ def create_user(
         else request.password
     )
 
-    # Create user
+    # Validate all role IDs exist before creating anything
+    roles = validate_role_ids(role_repo, request.role_ids) if request.role_ids else []
+
+    # Create user (None when the email is already registered)
     user = user_repo.create(
         email=request.email,
         password=password,
@@ -181,28 +254,18 @@ def create_user(
         organization_id=current_user.organization_id,
         is_active=request.is_active
     )
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
 
-    # Assign roles
-    if request.role_ids:
-        # Validate all role IDs exist
-        for role_id in request.role_ids:
-            role = role_repo.get_by_id(role_id)
-            if not role:
-                # Rollback user creation
-                user_repo.delete(user.id, current_user.organization_id)
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Role ID {role_id} not found"
-                )
-
-        # Assign roles
-        user_role_repo.set_user_roles(user.id, request.role_ids)
-
-        # Refresh user to get updated roles
-        db.refresh(user)
+    # Assign roles; the validated Role rows serve the audit log and response
+    if roles:
+        user_role_repo.sync_user_roles(user.id, [role.id for role in roles])
 
     # Get role names for audit log
-    role_names = [ur.role.name for ur in user.user_roles]
+    role_names = [role.name for role in roles]
 
     # Log user creation
     audit_logger.log_user_creation(
@@ -214,10 +277,14 @@ def create_user(
         organization_id=current_user.organization_id
     )
 
-    return CreateUserResponse(
-        user=user_to_response(user, db),
+    response = CreateUserResponse(
+        user=user_to_response(user, budget_service, roles=roles),
         generated_password=password if request.generate_password else None
     )
+    db.commit()
+    _invalidate_budget_cache(current_user.organization_id)
+
+    return response
 
 
 @router.patch("/users/{user_id}", response_model=UserResponse)
@@ -225,7 +292,8 @@ def update_user(
     user_id: UUID,
     request: UpdateUserRequest,
     current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    budget_service: BudgetService = Depends(get_budget_service)
 ):
     """Update user details."""
     user_repo = UserRepository(db)
@@ -243,16 +311,11 @@ def update_user(
 
     # Track changes for audit log
     changes = {}
+    old_roles = set(ur.role.name for ur in user.user_roles)
 
     # Update basic fields
     if request.email and request.email != user.email:
-        # Check if new email is already taken
-        existing_user = user_repo.get_by_email(request.email)
-        if existing_user and existing_user.id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
+        # Uniqueness is enforced by the users.email index when the UPDATE runs
         changes["email"] = {"old": user.email, "new": request.email}
 
     if request.name and request.name != user.name:
@@ -271,43 +334,52 @@ def update_user(
     if request.force_password_change is not None and request.force_password_change != user.force_password_change:
         changes["force_password_change"] = {"old": user.force_password_change, "new": request.force_password_change}
 
-    # Update user in database FIRST
-    updated_user = user_repo.update(
-        user_id=user_id,
-        organization_id=current_user.organization_id,
-        email=request.email,
-        name=request.name,
-        is_active=request.is_active,
-        force_password_change=request.force_password_change
+    # Only touch roles when the requested set differs from the current one
+    roles_changed = (
+        request.role_ids is not None
+        and set(request.role_ids) != {ur.role_id for ur in user.user_roles}
     )
-    
-    # AFTER database is updated, invalidate sessions
-    if should_invalidate_sessions:
-        deleted_sessions = session_manager.delete_user_sessions(user_id)
-        changes["sessions_invalidated"] = deleted_sessions
 
-    # Update roles if provided
-    if request.role_ids is not None:
-        # Validate all role IDs exist
-        for role_id in request.role_ids:
-            role = role_repo.get_by_id(role_id)
-            if not role:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Role ID {role_id} not found"
-                )
+    # Nothing differs from the stored state: respond without writing
+    if not changes and not roles_changed:
+        return user_to_response(user, budget_service)
 
-        # Get old roles
-        old_roles = set(ur.role.name for ur in user.user_roles)
+    # Validate all role IDs exist before writing anything
+    roles = None
+    if roles_changed:
+        roles = validate_role_ids(role_repo, request.role_ids) if request.role_ids else []
 
-        # Set new roles
-        user_role_repo.set_user_roles(user_id, request.role_ids)
+    # Apply the field updates FIRST (committed together with roles and audit below)
+    field_updates = {field: change["new"] for field, change in changes.items()}
+    try:
+        updated_user = (
+            user_repo.update(
+                user_id=user_id,
+                organization_id=current_user.organization_id,
+                **field_updates
+            )
+            if field_updates
+            else user
+        )
+    except IntegrityError:
+        # Nothing has been written yet in this request, so the rollback is safe
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    
+    # Sessions are revoked only once the update is committed (below), so a
+    # failed role sync, audit write or commit leaves the user logged in
+    if should_invalidate_sessions:
+        changes["sessions_invalidated"] = session_manager.user_session_counts([user_id])[user_id]
 
-        # Refresh user to get updated roles
-        db.refresh(updated_user)
+    # Update roles if provided
+    if roles_changed:
+        user_role_repo.sync_user_roles(user_id, [role.id for role in roles])
 
-        # Get new roles
-        new_roles = set(ur.role.name for ur in updated_user.user_roles)
+        # New role names come from the validated Role rows
+        new_roles = set(role.name for role in roles)
 
         # Calculate role changes
         added_roles = list(new_roles - old_roles)
@@ -337,7 +409,57 @@ def update_user(
             organization_id=current_user.organization_id
         )
 
-    return user_to_response(updated_user, db)
+    response = user_to_response(updated_user, budget_service, roles=roles)
+    db.commit()
+    if should_invalidate_sessions:
+        session_manager.delete_user_sessions(user_id)
+    _invalidate_budget_cache(current_user.organization_id)
+    if roles_changed:
+        invalidate_user_roles(user_id)
+
+    return response
+
+
+@router.post("/users/deactivate", response_model=BulkDeactivateResponse)
+def bulk_deactivate_users(
+    request: BulkDeactivateRequest,
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    Deactivate several users and revoke their sessions (e.g. offboarding).
+
+    Users that are already inactive or belong to another organization are
+    skipped. The caller's own account is never deactivated.
+    """
+    user_repo = UserRepository(db)
+    audit_logger = AuditLogger(db)
+
+    user_ids = [user_id for user_id in dict.fromkeys(request.user_ids) if user_id != current_user.id]
+    deactivated_ids = user_repo.deactivate_many(user_ids, current_user.organization_id)
+
+    # Sessions are revoked only after the commit, so a failed audit write
+    # or commit does not log out users who stay active
+    session_counts = session_manager.user_session_counts(deactivated_ids)
+
+    for user_id in deactivated_ids:
+        audit_logger.log_user_update(
+            user_id=user_id,
+            changes={
+                "is_active": {"old": True, "new": False},
+                "sessions_invalidated": session_counts[user_id]
+            },
+            actor_id=current_user.id,
+            organization_id=current_user.organization_id
+        )
+    db.commit()
+    deleted_sessions = session_manager.delete_user_sessions_bulk(deactivated_ids)
+    _invalidate_budget_cache(current_user.organization_id)
+
+    return BulkDeactivateResponse(
+        deactivated_user_ids=deactivated_ids,
+        sessions_invalidated=sum(deleted_sessions.values())
+    )
 
 
 @router.post("/users/{user_id}/change-password", response_model=ChangePasswordResponse)
@@ -387,6 +509,7 @@ def change_user_password(
         actor_id=current_user.id,
         organization_id=current_user.organization_id
     )
+    db.commit()
 
     return ChangePasswordResponse(
         message="Password changed successfully",
@@ -401,17 +524,6 @@ def delete_user(
     db: Session = Depends(get_db)
 ):
     """Delete a user."""
-    user_repo = UserRepository(db)
-    audit_logger = AuditLogger(db)
-
-    # Get user before deletion for audit log
-    user = user_repo.get_by_id(user_id, current_user.organization_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-
     # Prevent self-deletion
     if user_id == current_user.id:
         raise HTTPException(
@@ -419,9 +531,12 @@ def delete_user(
             detail="Cannot delete your own account"
         )
 
-    # Delete user
-    success = user_repo.delete(user_id, current_user.organization_id)
-    if not success:
+    user_repo = UserRepository(db)
+    audit_logger = AuditLogger(db)
+
+    # Delete and audit in one transaction so the log always matches the deletion
+    user = user_repo.delete(user_id, current_user.organization_id)
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
@@ -434,6 +549,9 @@ def delete_user(
         actor_id=current_user.id,
         organization_id=current_user.organization_id
     )
+    db.commit()
+    _invalidate_budget_cache(current_user.organization_id)
+    invalidate_user_roles(user_id)
 
     return None
 
@@ -443,11 +561,11 @@ def update_user_budget(
     user_id: UUID,
     request: UpdateBudgetRequest,
     current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    budget_service: BudgetService = Depends(get_budget_service)
 ):
     """Update a user's monthly budget (admin only)."""
     user_repo = UserRepository(db)
-    budget_service = BudgetService(db)
     audit_logger = AuditLogger(db)
 
     # Get existing user
@@ -480,10 +598,12 @@ def update_user_budget(
             actor_id=current_user.id,
             organization_id=current_user.organization_id
         )
+        db.commit()
+        _invalidate_budget_cache(current_user.organization_id)
 
         return UpdateBudgetResponse(
             message=f"Budget updated successfully to ${request.monthly_budget_usd}",
-            user=user_to_response(user, db)
+            user=user_to_response(user, budget_service)
         )
 
     except ValueError as e:
@@ -494,8 +614,43 @@ def update_user_budget(
 
 
 # Analytics endpoints
+# Aggregates over a multi-day window barely move within a minute, so polling
+# dashboards are served from a short-lived per-process cache.
+_analytics_cache = TTLCache(ttl_seconds=settings.analytics_cache_ttl_seconds)
+
+
+def _analytics_window_start(now: datetime, days: int) -> datetime:
+    """Start of the reporting window, rounded down to the minute so it can key the cache."""
+    return (now - timedelta(days=days)).replace(second=0, microsecond=0)
+
+
+def _analytics_response(request: Request, cache_key: tuple, build: Callable[[], dict]) -> Response:
+    """
+    Serve an analytics payload from the cache, computing it on a miss.
+
+    The serialized body is cached with an ETag digested from it, so a
+    polling dashboard revalidates with a cheap 304 until the aggregates
+    actually change.
+    """
+    entry = _analytics_cache.get(cache_key)
+    headers = {"X-Cache": "HIT"}
+    if entry is None:
+        body = orjson.dumps(jsonable_encoder(build()))
+        entry = (body, payload_etag(body))
+        _analytics_cache.set(cache_key, entry)
+        headers["X-Cache"] = "MISS"
+    body, etag = entry
+    headers["ETag"] = etag
+    if settings.analytics_cache_ttl_seconds > 0:
+        headers["Cache-Control"] = f"private, max-age={settings.analytics_cache_ttl_seconds}"
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("/analytics/overview")
 def get_analytics_overview(
+    request: Request,
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
     days: int = Query(30, description="Number of days to look back")
@@ -505,30 +660,37 @@ def get_analytics_overview(
 
     Returns total statistics for the last N days.
     """
-    analytics_repo = AnalyticsRepository(db)
-    start_date = datetime.utcnow() - timedelta(days=days)
+    now = datetime.utcnow()
+    start_date = _analytics_window_start(now, days)
+    cache_key = ("overview", current_user.organization_id, days, start_date)
 
-    total_stats = analytics_repo.get_total_stats(
-        organization_id=current_user.organization_id,
-        start_date=start_date
-    )
+    def build() -> dict:
+        analytics_repo = AnalyticsRepository(db)
 
-    error_stats = analytics_repo.get_error_stats(
-        organization_id=current_user.organization_id,
-        start_date=start_date
-    )
+        total_stats = analytics_repo.get_total_stats(
+            organization_id=current_user.organization_id,
+            start_date=start_date
+        )
 
-    return {
-        "period_days": days,
-        "start_date": start_date.isoformat(),
-        "end_date": datetime.utcnow().isoformat(),
-        "total_stats": total_stats,
-        "error_stats": error_stats
-    }
+        error_stats = analytics_repo.get_error_stats(
+            organization_id=current_user.organization_id,
+            start_date=start_date
+        )
+
+        return {
+            "period_days": days,
+            "start_date": start_date.isoformat(),
+            "end_date": now.isoformat(),
+            "total_stats": total_stats,
+            "error_stats": error_stats
+        }
+
+    return _analytics_response(request, cache_key, build)
 
 
 @router.get("/analytics/by-user")
 def get_analytics_by_user(
+    request: Request,
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
     days: int = Query(30, description="Number of days to look back"),
@@ -539,25 +701,32 @@ def get_analytics_by_user(
 
     Returns usage and cost for each user, ordered by total cost descending.
     """
-    analytics_repo = AnalyticsRepository(db)
-    start_date = datetime.utcnow() - timedelta(days=days)
+    now = datetime.utcnow()
+    start_date = _analytics_window_start(now, days)
+    cache_key = ("by-user", current_user.organization_id, days, limit, start_date)
 
-    user_stats = analytics_repo.get_usage_by_user(
-        organization_id=current_user.organization_id,
-        start_date=start_date,
-        limit=limit
-    )
+    def build() -> dict:
+        analytics_repo = AnalyticsRepository(db)
 
-    return {
-        "period_days": days,
-        "start_date": start_date.isoformat(),
-        "end_date": datetime.utcnow().isoformat(),
-        "users": user_stats
-    }
+        user_stats = analytics_repo.get_usage_by_user(
+            organization_id=current_user.organization_id,
+            start_date=start_date,
+            limit=limit
+        )
+
+        return {
+            "period_days": days,
+            "start_date": start_date.isoformat(),
+            "end_date": now.isoformat(),
+            "users": user_stats
+        }
+
+    return _analytics_response(request, cache_key, build)
 
 
 @router.get("/analytics/by-agent")
 def get_analytics_by_agent(
+    request: Request,
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
     days: int = Query(30, description="Number of days to look back")
@@ -567,24 +736,31 @@ def get_analytics_by_agent(
 
     Returns usage and cost for each agent, ordered by total cost descending.
     """
-    analytics_repo = AnalyticsRepository(db)
-    start_date = datetime.utcnow() - timedelta(days=days)
+    now = datetime.utcnow()
+    start_date = _analytics_window_start(now, days)
+    cache_key = ("by-agent", current_user.organization_id, days, start_date)
 
-    agent_stats = analytics_repo.get_usage_by_agent(
-        organization_id=current_user.organization_id,
-        start_date=start_date
-    )
+    def build() -> dict:
+        analytics_repo = AnalyticsRepository(db)
 
-    return {
-        "period_days": days,
-        "start_date": start_date.isoformat(),
-        "end_date": datetime.utcnow().isoformat(),
-        "agents": agent_stats
-    }
+        agent_stats = analytics_repo.get_usage_by_agent(
+            organization_id=current_user.organization_id,
+            start_date=start_date
+        )
+
+        return {
+            "period_days": days,
+            "start_date": start_date.isoformat(),
+            "end_date": now.isoformat(),
+            "agents": agent_stats
+        }
+
+    return _analytics_response(request, cache_key, build)
 
 
 @router.get("/analytics/by-model")
 def get_analytics_by_model(
+    request: Request,
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
     days: int = Query(30, description="Number of days to look back")
@@ -594,24 +770,31 @@ def get_analytics_by_model(
 
     Returns usage and cost for each model, ordered by total cost descending.
     """
-    analytics_repo = AnalyticsRepository(db)
-    start_date = datetime.utcnow() - timedelta(days=days)
+    now = datetime.utcnow()
+    start_date = _analytics_window_start(now, days)
+    cache_key = ("by-model", current_user.organization_id, days, start_date)
 
-    model_stats = analytics_repo.get_usage_by_model(
-        organization_id=current_user.organization_id,
-        start_date=start_date
-    )
+    def build() -> dict:
+        analytics_repo = AnalyticsRepository(db)
 
-    return {
-        "period_days": days,
-        "start_date": start_date.isoformat(),
-        "end_date": datetime.utcnow().isoformat(),
-        "models": model_stats
-    }
+        model_stats = analytics_repo.get_usage_by_model(
+            organization_id=current_user.organization_id,
+            start_date=start_date
+        )
+
+        return {
+            "period_days": days,
+            "start_date": start_date.isoformat(),
+            "end_date": now.isoformat(),
+            "models": model_stats
+        }
+
+    return _analytics_response(request, cache_key, build)
 
 
 @router.get("/analytics/over-time")
 def get_analytics_over_time(
+    request: Request,
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
     days: int = Query(30, description="Number of days to look back"),
@@ -622,101 +805,100 @@ def get_analytics_over_time(
 
     Returns time-series data with call counts and costs.
     """
-    analytics_repo = AnalyticsRepository(db)
-    start_date = datetime.utcnow() - timedelta(days=days)
+    now = datetime.utcnow()
+    start_date = _analytics_window_start(now, days)
+    cache_key = ("over-time", current_user.organization_id, days, granularity, start_date)
 
-    time_series = analytics_repo.get_usage_over_time(
-        organization_id=current_user.organization_id,
-        start_date=start_date,
-        granularity=granularity
-    )
+    def build() -> dict:
+        analytics_repo = AnalyticsRepository(db)
 
-    return {
-        "period_days": days,
-        "start_date": start_date.isoformat(),
-        "end_date": datetime.utcnow().isoformat(),
-        "granularity": granularity,
-        "data": time_series
-    }
+        time_series = analytics_repo.get_usage_over_time(
+            organization_id=current_user.organization_id,
+            start_date=start_date,
+            granularity=granularity
+        )
+
+        return {
+            "period_days": days,
+            "start_date": start_date.isoformat(),
+            "end_date": now.isoformat(),
+            "granularity": granularity,
+            "data": time_series
+        }
+
+    return _analytics_response(request, cache_key, build)
+
+
+@router.get("/analytics/dashboard")
+def get_analytics_dashboard(
+    request: Request,
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db),
+    days: int = Query(30, description="Number of days to look back"),
+    granularity: str = Query("day", description="Time bucket size: hour, day, week, month"),
+    limit: int = Query(50, description="Maximum number of users to return")
+):
+    """
+    Get all admin dashboard analytics in a single request.
+
+    Combines the overview, by-user, by-agent, by-model and over-time
+    panels, computed from one filtered scan of the LLM call log.
+    """
+    now = datetime.utcnow()
+    start_date = _analytics_window_start(now, days)
+    cache_key = ("dashboard", current_user.organization_id, days, granularity, limit, start_date)
+
+    def build() -> dict:
+        analytics_repo = AnalyticsRepository(db)
+
+        return analytics_repo.get_dashboard(
+            organization_id=current_user.organization_id,
+            start_date=start_date,
+            days=days,
+            granularity=granularity,
+            user_limit=limit
+        )
+
+    return _analytics_response(request, cache_key, build)
 
 
 # Budget monitoring endpoints
 @router.get("/budget/overview", response_model=BudgetOverviewResponse)
 def get_budget_overview(
+    response: Response,
     current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    budget_service: BudgetService = Depends(get_budget_service)
 ):
     """
     Get budget overview dashboard for all users in the organization.
     
     Returns summary statistics and user budget utilization data.
     """
-    user_repo = UserRepository(db)
-    budget_service = BudgetService(db)
-    
-    # Get all users in organization
-    users = user_repo.get_all(current_user.organization_id)
-    
-    # Calculate budget statistics
-    total_budget = sum(user.monthly_budget_usd for user in users)
-    total_spending = Decimal('0.00')
-    users_over_budget = 0
-    users_near_limit = 0  # 80%+ utilization
-    user_budget_data = []
-    
-    for user in users:
-        try:
-            budget_status = budget_service.get_budget_status_with_warnings(user.id)
-            current_spending = budget_status["current_spending"]
-            budget_limit = budget_status["budget_limit"]
-            utilization = budget_status["utilization_percentage"]
-            
-            total_spending += current_spending
-            
-            if budget_status["is_over_budget"]:
-                users_over_budget += 1
-            elif utilization >= 80.0:
-                users_near_limit += 1
-            
-            user_budget_data.append({
-                "user_id": str(user.id),
-                "email": user.email,
-                "name": user.name,
-                "monthly_budget_usd": float(budget_limit),
-                "current_spending_usd": float(current_spending),
-                "remaining_budget_usd": float(budget_status["remaining_budget"]),
-                "utilization_percentage": utilization,
-                "is_over_budget": budget_status["is_over_budget"],
-                "is_near_limit": budget_status["is_near_limit"],
-                "has_warning": budget_status["has_warning"],
-                "warning_message": budget_status["warning_message"]
-            })
-        except Exception:
-            # If budget service fails for a user, skip them
-            continue
-    
-    # Sort by utilization percentage descending
-    user_budget_data.sort(key=lambda x: x["utilization_percentage"], reverse=True)
-    
-    return {
-        "summary": {
-            "total_users": len(users),
-            "total_budget_usd": float(total_budget),
-            "total_spending_usd": float(total_spending),
-            "remaining_budget_usd": float(total_budget - total_spending),
-            "overall_utilization_percentage": float(total_spending / total_budget * 100) if total_budget > 0 else 0.0,
-            "users_over_budget": users_over_budget,
-            "users_near_limit": users_near_limit,
-            "users_within_budget": len(users) - users_over_budget - users_near_limit
-        },
-        "users": user_budget_data
-    }
+    cache_key = ("budget-overview", current_user.organization_id)
+    cached = _budget_cache.get(cache_key)
+    if cached is not None:
+        response.headers["X-Cache"] = "HIT"
+        return cached
+
+    result = budget_service.get_org_overview(current_user.organization_id)
+    _budget_cache.set(cache_key, result)
+    response.headers["X-Cache"] = "MISS"
+    return result
+
+
+def _months_before(year: int, month: int, months: int) -> Tuple[int, int]:
+    """Return the (year, month) that lies the given number of months earlier."""
+    start_year, start_month_index = divmod(year * 12 + (month - 1) - months, 12)
+    return start_year, start_month_index + 1
 
 
 @router.get("/budget/spending-trends", response_model=SpendingTrendsResponse)
 def get_spending_trends(
+    response: Response,
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
+    budget_service: BudgetService = Depends(get_budget_service),
     months: int = Query(6, description="Number of months to look back", ge=1, le=24)
 ):
     """
@@ -724,44 +906,25 @@ def get_spending_trends(
     
     Returns monthly spending data for trend analysis.
     """
-    from backend.repositories.user_repository import UserRepository
-    from backend.models.user_monthly_spending import UserMonthlySpending
-    from sqlalchemy import extract
-    
-    # Calculate date range
+    cache_key = ("spending-trends", current_user.organization_id, months)
+    cached = _budget_cache.get(cache_key)
+    if cached is not None:
+        response.headers["X-Cache"] = "HIT"
+        return cached
+
+    # Calculate date range: first day of the month (months - 1) before this one
     end_date = datetime.utcnow()
-    start_date = end_date.replace(day=1)  # First day of current month
-    
-    # Go back the specified number of months
-    for _ in range(months - 1):
-        if start_date.month == 1:
-            start_date = start_date.replace(year=start_date.year - 1, month=12)
-        else:
-            start_date = start_date.replace(month=start_date.month - 1)
+    start_year, start_month = _months_before(end_date.year, end_date.month, months - 1)
+    start_date = end_date.replace(year=start_year, month=start_month, day=1)
     
-    # Query monthly spending data
-    spending_data = (
-        db.query(
-            UserMonthlySpending.year,
-            UserMonthlySpending.month,
-            func.sum(UserMonthlySpending.total_spent_usd).label('total_spending'),
-            func.count(UserMonthlySpending.user_id).label('active_users')
-        )
-        .join(User, User.id == UserMonthlySpending.user_id)
-        .filter(
-            User.organization_id == current_user.organization_id,
-            UserMonthlySpending.year >= start_date.year,
-            UserMonthlySpending.month >= start_date.month if UserMonthlySpending.year == start_date.year else True
-        )
-        .group_by(UserMonthlySpending.year, UserMonthlySpending.month)
-        .order_by(UserMonthlySpending.year, UserMonthlySpending.month)
-        .all()
+    # Monthly totals from the first day of the window (compiled statement is cached)
+    spending_data = budget_service.get_monthly_spending_totals(
+        current_user.organization_id, start_year, start_month
     )
     
     # Get total budget for each month (sum of all user budgets)
     user_repo = UserRepository(db)
-    users = user_repo.get_all(current_user.organization_id)
-    total_monthly_budget = sum(user.monthly_budget_usd for user in users)
+    total_monthly_budget = user_repo.sum_monthly_budget(current_user.organization_id)
     
     # Format the data
     trends = []
@@ -779,18 +942,24 @@ def get_spending_trends(
             "utilization_percentage": utilization
         })
     
-    return {
+    result = {
         "period_months": months,
         "start_date": start_date.isoformat(),
         "end_date": end_date.isoformat(),
         "trends": trends
     }
+    # Past months are final, so trends can be kept longer than the live views
+    _budget_cache.set(cache_key, result, ttl_seconds=_SPENDING_TRENDS_CACHE_TTL_SECONDS)
+    response.headers["X-Cache"] = "MISS"
+    return result
 
 
 @router.get("/budget/alerts", response_model=BudgetAlertsResponse)
 def get_budget_alerts(
+    response: Response,
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
+    budget_service: BudgetService = Depends(get_budget_service),
     include_resolved: bool = Query(False, description="Include users who are no longer over budget")
 ):
     """
@@ -798,31 +967,40 @@ def get_budget_alerts(
     
     Returns users who are over budget or approaching their limits.
     """
+    cache_key = ("budget-alerts", current_user.organization_id, include_resolved)
+    cached = _budget_cache.get(cache_key)
+    if cached is not None:
+        response.headers["X-Cache"] = "HIT"
+        return cached
+
     user_repo = UserRepository(db)
-    budget_service = BudgetService(db)
     
     users = user_repo.get_all(current_user.organization_id)
     alerts = []
     
+    budget_statuses = budget_service.get_budget_statuses_bulk([user.id for user in users])
+    last_updated = datetime.utcnow().isoformat()
+
     for user in users:
         try:
-            budget_status = budget_service.get_budget_status_with_warnings(user.id)
+            budget_status = budget_statuses[user.id]
             
             # Only include users with warnings or over budget
             if budget_status["has_warning"] or budget_status["is_over_budget"]:
                 alert_level = "critical" if budget_status["is_over_budget"] else "warning"
                 
+                # Decimals are converted by BudgetAlertsResponse, not per row here
                 alerts.append({
                     "user_id": str(user.id),
                     "email": user.email,
                     "name": user.name,
                     "alert_level": alert_level,
-                    "monthly_budget_usd": float(budget_status["budget_limit"]),
-                    "current_spending_usd": float(budget_status["current_spending"]),
+                    "monthly_budget_usd": budget_status["budget_limit"],
+                    "current_spending_usd": budget_status["current_spending"],
                     "utilization_percentage": budget_status["utilization_percentage"],
                     "is_over_budget": budget_status["is_over_budget"],
                     "warning_message": budget_status["warning_message"],
-                    "last_updated": datetime.utcnow().isoformat()
+                    "last_updated": last_updated
                 })
             elif include_resolved:
                 # Include users within budget if requested
@@ -831,12 +1009,12 @@ def get_budget_alerts(
                     "email": user.email,
                     "name": user.name,
                     "alert_level": "resolved",
-                    "monthly_budget_usd": float(budget_status["budget_limit"]),
-                    "current_spending_usd": float(budget_status["current_spending"]),
+                    "monthly_budget_usd": budget_status["budget_limit"],
+                    "current_spending_usd": budget_status["current_spending"],
                     "utilization_percentage": budget_status["utilization_percentage"],
                     "is_over_budget": False,
                     "warning_message": None,
-                    "last_updated": datetime.utcnow().isoformat()
+                    "last_updated": last_updated
                 })
         except Exception:
             # Skip users with budget service errors
@@ -845,12 +1023,15 @@ def get_budget_alerts(
     # Sort by utilization percentage descending (most critical first)
     alerts.sort(key=lambda x: x["utilization_percentage"], reverse=True)
     
-    return {
+    result = {
         "total_alerts": len([a for a in alerts if a["alert_level"] in ["warning", "critical"]]),
         "critical_alerts": len([a for a in alerts if a["alert_level"] == "critical"]),
         "warning_alerts": len([a for a in alerts if a["alert_level"] == "warning"]),
         "alerts": alerts
     }
+    _budget_cache.set(cache_key, result)
+    response.headers["X-Cache"] = "MISS"
+    return result
 
 # Debug endpoints for session management
 @router.get("/debug/sessions")
@@ -2,23 +2,35 @@
 AI Agent API endpoints for question generation and MRD creation.
 """
 
+import hashlib
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Callable, Optional, Tuple, Type
+from pydantic import BaseModel, Field, TypeAdapter
 
 logger = logging.getLogger(__name__)
 
+from backend.config import settings
 from backend.database import get_db
-from backend.models import User, JobType
+from backend.models import Answer, AnswerStatus, Initiative, InitiativeStatus, JobStatus, JobType, User
 from backend.repositories.initiative import InitiativeRepository
 from backend.repositories.context import ContextRepository
 from backend.repositories.question import QuestionRepository
 from backend.repositories.evaluation import EvaluationRepository
 from backend.repositories.job import JobRepository
+from backend.repositories.answer import AnswerRepository
 from backend.auth.dependencies import get_current_user
+from backend.dependencies.initiatives import require_initiative_access
+from backend.dependencies.repositories import (
+    get_context_repository,
+    get_initiative_repository,
+    get_mrd_repository,
+    get_score_repository
+)
 from backend.agents.knowledge_gap import KnowledgeGapAgent
 from backend.agents.mrd_generator import MRDGeneratorAgent
 from backend.agents.mrd_editor import MRDEditorAgent
@@ -26,11 +38,19 @@ from backend.agents.scoring import ScoringAgent
 from backend.agents.readiness_evaluator import ReadinessEvaluatorAgent
 from backend.repositories.mrd import MRDRepository
 from backend.repositories.score import ScoreRepository
+from backend.repositories.results_cache import (
+    get_current_result,
+    initiative_results_cache,
+    invalidate_initiative_results,
+    result_cache_key,
+)
 from backend.schemas.question import QuestionResponse
 from backend.schemas.score import ScoreResponse
 from backend.schemas.mrd import MRDResponse, MRDContentResponse
-from backend.services.pdf_generator import markdown_to_pdf
-from fastapi.responses import Response
+from backend.services.pdf_generator import iter_pdf_chunks, markdown_to_pdf, render_pdf_async, scorecard_to_pdf
+from fastapi.responses import Response, StreamingResponse
+from backend.cache import TTLCache
+from backend.http_cache import etag_matches
 from backend.services.job_executor import execute_job_in_background
 from backend.services.quality_scorer import calculate_quality_score
 from backend.agents.scoring_gap_analyzer import ScoringGapAnalyzer
@@ -42,6 +62,119 @@ from backend.services.exceptions import BudgetExceededError, QuestionGenerationT
 
 router = APIRouter(prefix="/agents", tags=["AI Agents"])
 
+# Initiative statuses that accept question generation and regeneration
+_QUESTION_GEN_STATUSES = frozenset({InitiativeStatus.DRAFT, InitiativeStatus.IN_QA})
+
+# Validates a whole batch of regenerated questions in one pydantic-core call
+_QUESTION_LIST_ADAPTER = TypeAdapter(list[QuestionResponse])
+
+
+# Rendered MRD PDFs are identical until the MRD version (or the initiative
+# title used as the PDF title) changes; keep the latest render per initiative.
+_MRD_PDF_CACHE_TTL_SECONDS = 24 * 60 * 60
+_mrd_pdf_cache = TTLCache(ttl_seconds=_MRD_PDF_CACHE_TTL_SECONDS, maxsize=64)
+
+
+def _invalidate_mrd_pdf(initiative_id: UUID) -> None:
+    """Drop cached PDF renders for an initiative's MRD."""
+    _mrd_pdf_cache.invalidate_matching(lambda key: key[0] == initiative_id)
+
+
+def _start_job(
+    db: Session,
+    job_type: JobType,
+    initiative_id: UUID,
+    current_user: User,
+    progress_message: Optional[str] = None
+) -> Tuple[UUID, JobStatus, bool]:
+    """
+    Create and start a background job, or return the identical one already in flight.
+
+    A pending or running job of the same type for the initiative, created
+    within JOB_DEDUP_WINDOW_SECONDS, is returned instead of paying for a
+    second LLM pipeline.
+
+    Only plain values are returned: reading attributes of the job after the
+    commit would reload it and check a pooled connection back out for the
+    rest of the request.
+
+    Returns:
+        (job_id, status, created); created is False when an existing job was returned
+    """
+    job_repo = JobRepository(db)
+    if settings.job_dedup_window_seconds > 0:
+        # Held until the commit below, so a double-click served by another
+        # thread or API process sees this job instead of starting its own
+        job_repo.lock_initiative_dispatch(initiative_id)
+        created_after = datetime.utcnow() - timedelta(seconds=settings.job_dedup_window_seconds)
+        in_flight = job_repo.get_in_flight(initiative_id, job_type, created_after)
+        if in_flight:
+            job_id, job_status = in_flight.id, in_flight.status
+            db.commit()
+            logger.info("Reusing in-flight %s job %s for initiative %s", job_type.value, job_id, initiative_id)
+            return job_id, job_status, False
+
+    job = job_repo.create_job(
+        job_type=job_type,
+        organization_id=current_user.organization_id,
+        created_by=current_user.id,
+        initiative_id=initiative_id,
+        progress_message=progress_message
+    )
+    job_id = job.id
+    db.commit()
+
+    execute_job_in_background(job_id)
+    return job_id, JobStatus.PENDING, True
+
+
+def _section_word_count(text: str, before: str, after: str) -> int:
+    """Words in ``text`` that do not merge with a word touching it on either side."""
+    count = len(text.split())
+    if before and not before.isspace() and not text[0].isspace():
+        count -= 1
+    if after and not after.isspace() and not text[-1].isspace():
+        count -= 1
+    return count
+
+
+def _spliced_word_count(
+    word_count: Optional[int],
+    content: str,
+    start: int,
+    old_section: str,
+    new_section: str
+) -> Optional[int]:
+    """
+    Word count after replacing ``old_section`` at ``start``, from the sections alone.
+
+    Words straddling a section boundary are counted once. Returns None when
+    the stored count is missing or a section has no words (so neighbours
+    could join across it); callers then count the whole document.
+    """
+    if word_count is None or not old_section.strip() or not new_section.strip():
+        return None
+
+    before = content[start - 1:start]
+    after = content[start + len(old_section):start + len(old_section) + 1]
+    return (
+        word_count
+        - _section_word_count(old_section, before, after)
+        + _section_word_count(new_section, before, after)
+    )
+
+
+def _pdf_attachment(pdf_bytes: bytes, filename: str) -> StreamingResponse:
+    """Stream a rendered PDF as a download without copying it into a response body."""
+    return StreamingResponse(
+        iter_pdf_chunks(pdf_bytes),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(len(pdf_bytes))
+        }
+    )
+
 
 # Request models
 class FineTuneSectionRequest(BaseModel):
@@ -53,6 +186,8 @@ class FineTuneSectionRequest(BaseModel):
 @router.post("/initiatives/{initiative_id}/generate-questions")
 def generate_questions(
     initiative_id: UUID,
+    initiative_repo: InitiativeRepository = Depends(get_initiative_repository),
+    context_repo: ContextRepository = Depends(get_context_repository),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -70,26 +205,26 @@ def generate_questions(
     Returns:
         Dict with job_id for polling job status
     """
-    # Get initiative
-    initiative_repo = InitiativeRepository(db)
-    initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
+    # Get the initiative's status and iteration (the job loads the full row)
+    state = initiative_repo.get_generation_state(initiative_id, current_user.organization_id)
 
-    if not initiative:
+    if not state:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Initiative not found"
         )
 
+    initiative_status, iteration_count = state
+
     # Check status - allow question generation for Draft and In_QA initiatives
-    if initiative.status.value not in ["Draft", "In_QA"]:
+    if initiative_status not in _QUESTION_GEN_STATUSES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot generate questions for initiative in {initiative.status.value} status"
+            detail=f"Cannot generate questions for initiative in {initiative_status.value} status"
         )
 
     # Verify context exists
-    context_repo = ContextRepository(db)
-    context = context_repo.get_current(current_user.organization_id)
+    context = context_repo.get_current_snapshot(current_user.organization_id)
 
     if not context:
         raise HTTPException(
@@ -101,7 +236,7 @@ def generate_questions(
     throttle_service = QuestionThrottleService(db)
     try:
         # Check with estimated question count (15 for first generation, 8 for subsequent)
-        estimated_questions = 15 if initiative.iteration_count == 0 else 8
+        estimated_questions = 15 if iteration_count == 0 else 8
         throttle_service.check_question_limits_or_raise(initiative_id, estimated_questions)
     except QuestionGenerationThrottledError as e:
         raise HTTPException(
@@ -155,27 +290,18 @@ def generate_questions(
         # Log the error but don't block generation if cost estimation fails
         logger.warning(f"Cost estimation failed for initiative {initiative_id}: {e}")
 
-    # Create async job
-    job_repo = JobRepository(db)
-    job = job_repo.create_job(
-        job_type=JobType.GENERATE_QUESTIONS,
-        organization_id=current_user.organization_id,
-        created_by=current_user.id,
-        initiative_id=initiative_id
-    )
-    db.commit()
-
-    # Start background execution
-    execute_job_in_background(job.id)
+    # Create and start the async job, unless one is already running
+    job_id, _, _ = _start_job(db, JobType.GENERATE_QUESTIONS, initiative_id, current_user)
 
     # Return job ID for polling
-    return {"job_id": str(job.id)}
+    return {"job_id": str(job_id)}
 
 
 @router.post("/initiatives/{initiative_id}/regenerate-questions", response_model=list[QuestionResponse])
 def regenerate_questions(
     initiative_id: UUID,
     keep_unanswered: bool = False,
+    initiative_repo: InitiativeRepository = Depends(get_initiative_repository),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -193,9 +319,8 @@ def regenerate_questions(
 
     Only regenerates for initiatives in DRAFT or IN_REVIEW status.
     """
-    # Get initiative
-    initiative_repo = InitiativeRepository(db)
-    initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
+    # Get initiative and current context together
+    initiative, context = initiative_repo.get_with_context(initiative_id, current_user.organization_id)
 
     if not initiative:
         raise HTTPException(
@@ -204,16 +329,12 @@ def regenerate_questions(
         )
 
     # Check status - allow question regeneration for Draft and In_QA initiatives
-    if initiative.status.value not in ["Draft", "In_QA"]:
+    if initiative.status not in _QUESTION_GEN_STATUSES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Cannot regenerate questions for initiative in {initiative.status.value} status"
         )
 
-    # Get current context
-    context_repo = ContextRepository(db)
-    context = context_repo.get_current(current_user.organization_id)
-
     if not context:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -300,22 +421,24 @@ def regenerate_questions(
 
     # Save questions to database
     question_repo = QuestionRepository(db)
-
-    for question in questions:
-        question_repo.create(question)
+    question_repo.bulk_create(questions)
 
     # Increment initiative iteration
     initiative_repo.increment_iteration(initiative_id, current_user.organization_id)
 
+    # Serialize before committing: bulk_create generated every field client-side,
+    # whereas after the commit each expired question would be reloaded one by one
+    response = _QUESTION_LIST_ADAPTER.validate_python(questions, from_attributes=True)
+
     db.commit()
 
-    # Return questions
-    return [QuestionResponse.model_validate(q) for q in questions]
+    return response
 
 
-@router.post("/initiatives/{initiative_id}/evaluate-readiness")
+@router.post("/initiatives/{initiative_id}/evaluate-readiness", dependencies=[Depends(require_initiative_access)])
 def evaluate_readiness(
     initiative_id: UUID,
+    context_repo: ContextRepository = Depends(get_context_repository),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -331,19 +454,8 @@ def evaluate_readiness(
     Returns:
         Dict with job_id for polling job status
     """
-    # Get initiative
-    initiative_repo = InitiativeRepository(db)
-    initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
-
-    if not initiative:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Initiative not found"
-        )
-
     # Verify context exists
-    context_repo = ContextRepository(db)
-    context = context_repo.get_current(current_user.organization_id)
+    context = context_repo.get_current_snapshot(current_user.organization_id)
 
     if not context:
         raise HTTPException(
@@ -359,18 +471,20 @@ def evaluate_readiness(
         created_by=current_user.id,
         initiative_id=initiative_id
     )
+    job_id = job.id
     db.commit()
 
     # Start background execution
-    execute_job_in_background(job.id)
+    execute_job_in_background(job_id)
 
     # Return job ID for polling
-    return {"job_id": str(job.id)}
+    return {"job_id": str(job_id)}
 
 
 @router.get("/initiatives/{initiative_id}/evaluate-readiness")
 def get_evaluation(
     initiative_id: UUID,
+    initiative_repo: InitiativeRepository = Depends(get_initiative_repository),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -380,11 +494,12 @@ def get_evaluation(
     Returns:
         Dict containing evaluation data, or 404 if no evaluation exists
     """
-    # Get initiative to verify access
-    initiative_repo = InitiativeRepository(db)
-    initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
+    cached = get_current_result(db, "evaluation", current_user.organization_id, initiative_id)
+    if cached is not None:
+        return cached
 
-    if not initiative:
+    # Verify initiative access
+    if not initiative_repo.exists(initiative_id, current_user.organization_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Initiative not found"
@@ -400,12 +515,17 @@ def get_evaluation(
             detail="No evaluation found for this initiative"
         )
 
+    initiative_results_cache.set(
+        result_cache_key("evaluation", current_user.organization_id, initiative_id, evaluation),
+        evaluation.evaluation_data
+    )
     return evaluation.evaluation_data
 
 
-@router.post("/initiatives/{initiative_id}/generate-mrd")
+@router.post("/initiatives/{initiative_id}/generate-mrd", dependencies=[Depends(require_initiative_access)])
 def generate_mrd(
     initiative_id: UUID,
+    context_repo: ContextRepository = Depends(get_context_repository),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -426,19 +546,8 @@ def generate_mrd(
     Returns:
         Dict with job_id for polling job status
     """
-    # Get initiative
-    initiative_repo = InitiativeRepository(db)
-    initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
-
-    if not initiative:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Initiative not found"
-        )
-
     # Verify context exists
-    context_repo = ContextRepository(db)
-    context = context_repo.get_current(current_user.organization_id)
+    context = context_repo.get_current_snapshot(current_user.organization_id)
 
     if not context:
         raise HTTPException(
@@ -446,37 +555,53 @@ def generate_mrd(
             detail="No organizational context found. Please create context first."
         )
 
-    # Create async job
-    job_repo = JobRepository(db)
-    job = job_repo.create_job(
-        job_type=JobType.GENERATE_MRD,
-        organization_id=current_user.organization_id,
-        created_by=current_user.id,
-        initiative_id=initiative_id
-    )
-    db.commit()
-
-    # Start background execution
-    execute_job_in_background(job.id)
+    # Create and start the async job, unless one is already running
+    job_id, _, _ = _start_job(db, JobType.GENERATE_MRD, initiative_id, current_user)
 
     # Return job ID for polling
-    return {"job_id": str(job.id)}
+    return {"job_id": str(job_id)}
 
 
-@router.get("/initiatives/{initiative_id}/mrd", response_model=MRDResponse)
-def get_mrd(
-    initiative_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
+def _json_response(model: BaseModel, etag: Optional[str] = None) -> Response:
     """
-    Get the MRD for an initiative.
+    Serialize a response model straight to a JSON response.
 
-    Returns the most recent version of the MRD if it exists.
+    FastAPI would otherwise dump the returned model, validate it again
+    against response_model and then encode it; the route keeps its
+    response_model for the OpenAPI schema.
     """
-    # Verify initiative access
-    initiative_repo = InitiativeRepository(db)
-    initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
+    return _json_body_response(model.model_dump_json(), etag)
+
+
+def _json_body_response(body: str, etag: Optional[str] = None) -> Response:
+    """JSON response for an already serialized body."""
+    headers = {"ETag": etag} if etag else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _mrd_etag(mrd: MRDResponse) -> str:
+    """Weak ETag for an MRD; the version increments on every content change."""
+    return f'W/"{mrd.id}:{mrd.version}"'
+
+
+def _score_etag(score_id: UUID, body: str) -> str:
+    """Weak ETag for a score, derived from its serialized payload (scores are not versioned)."""
+    digest = hashlib.sha1(body.encode()).hexdigest()[:16]
+    return f'W/"{score_id}:{digest}"'
+
+
+def _get_mrd_snapshot(
+    initiative_id: UUID,
+    current_user: User,
+    initiative_repo: InitiativeRepository
+) -> MRDResponse:
+    """Load an initiative's MRD as a response model, served from the results cache when possible."""
+    cached = get_current_result(initiative_repo.db, "mrd", current_user.organization_id, initiative_id)
+    if cached is not None:
+        return cached
+
+    # Verify initiative access and get the MRD in one query
+    initiative, mrd = initiative_repo.get_with_mrd(initiative_id, current_user.organization_id)
 
     if not initiative:
         raise HTTPException(
@@ -484,63 +609,72 @@ def get_mrd(
             detail="Initiative not found"
         )
 
-    # Get MRD
-    mrd_repo = MRDRepository(db)
-    mrd = mrd_repo.get_by_initiative(initiative_id)
-
     if not mrd:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="MRD not found for this initiative. Generate one first."
         )
 
-    return mrd
+    snapshot = MRDResponse.model_validate(mrd)
+    initiative_results_cache.set(
+        result_cache_key("mrd", current_user.organization_id, initiative_id, mrd),
+        snapshot
+    )
+    return snapshot
+
+
+@router.get("/initiatives/{initiative_id}/mrd", response_model=MRDResponse)
+def get_mrd(
+    initiative_id: UUID,
+    request: Request,
+    initiative_repo: InitiativeRepository = Depends(get_initiative_repository),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the MRD for an initiative.
+
+    Returns the most recent version of the MRD if it exists. Responses carry
+    an ETag; a matching If-None-Match yields 304 Not Modified.
+    """
+    mrd = _get_mrd_snapshot(initiative_id, current_user, initiative_repo)
+    etag = _mrd_etag(mrd)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return _json_response(mrd, etag)
 
 
 @router.get("/initiatives/{initiative_id}/mrd/content", response_model=MRDContentResponse)
 def get_mrd_content(
     initiative_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    request: Request,
+    initiative_repo: InitiativeRepository = Depends(get_initiative_repository),
+    current_user: User = Depends(get_current_user)
 ):
     """
     Get the MRD content (for export/download).
 
     Returns just the content, quality disclaimer, word count, and version.
-    Useful for exporting to files.
+    Useful for exporting to files. Supports If-None-Match like GET /mrd.
     """
-    # Verify initiative access
-    initiative_repo = InitiativeRepository(db)
-    initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
-
-    if not initiative:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Initiative not found"
-        )
-
-    # Get MRD
-    mrd_repo = MRDRepository(db)
-    mrd = mrd_repo.get_by_initiative(initiative_id)
-
-    if not mrd:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="MRD not found for this initiative. Generate one first."
-        )
+    mrd = _get_mrd_snapshot(initiative_id, current_user, initiative_repo)
+    etag = _mrd_etag(mrd)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
-    return MRDContentResponse(
+    content = MRDContentResponse(
         content=mrd.content,
         quality_disclaimer=mrd.quality_disclaimer,
         word_count=mrd.word_count or 0,
         version=mrd.version
     )
+    return _json_response(content, etag)
 
 
-@router.post("/initiatives/{initiative_id}/mrd/fine-tune-section")
+@router.post("/initiatives/{initiative_id}/mrd/fine-tune-section", response_model=MRDResponse)
 def fine_tune_mrd_section(
     initiative_id: UUID,
     request: FineTuneSectionRequest,
+    initiative_repo: InitiativeRepository = Depends(get_initiative_repository),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -559,11 +693,8 @@ def fine_tune_mrd_section(
     - Section content must not be empty
     - User instructions must not be empty
     """
-    import re
-
-    # Verify initiative access
-    initiative_repo = InitiativeRepository(db)
-    initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
+    # Verify initiative access and get the existing MRD in one query
+    initiative, mrd = initiative_repo.get_with_mrd(initiative_id, current_user.organization_id)
 
     if not initiative:
         raise HTTPException(
@@ -571,10 +702,6 @@ def fine_tune_mrd_section(
             detail="Initiative not found"
         )
 
-    # Get existing MRD
-    mrd_repo = MRDRepository(db)
-    mrd = mrd_repo.get_by_initiative(initiative_id)
-
     if not mrd:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -594,6 +721,21 @@ def fine_tune_mrd_section(
             detail="User instructions cannot be empty"
         )
 
+    # Locate the section in the full MRD content before paying for the LLM call
+    current_content = mrd.content
+    section_start = current_content.find(request.section_content)
+
+    if section_start == -1:
+        # Log for debugging
+        logger.warning(
+            f"Section content not found in MRD for initiative {initiative_id}. "
+            f"Section: {request.section_name}, Content length: {len(request.section_content)}"
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Section content not found in MRD. The content may have been modified."
+        )
+
     # Call MRD Editor Agent to fine-tune the section
     editor_agent = MRDEditorAgent(db)
     try:
@@ -610,27 +752,24 @@ def fine_tune_mrd_section(
             detail=str(e)
         )
 
-    # Replace the section in the full MRD content
-    # We need to find and replace the specific section content
-    current_content = mrd.content
-
-    # Check if the section content exists in the MRD
-    if request.section_content not in current_content:
-        # Log for debugging
-        logger.warning(
-            f"Section content not found in MRD for initiative {initiative_id}. "
-            f"Section: {request.section_name}, Content length: {len(request.section_content)}"
-        )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Section content not found in MRD. The content may have been modified."
-        )
-
-    # Replace the section content (only first occurrence)
-    updated_content = current_content.replace(request.section_content, improved_content, 1)
+    # Replace the section content (only first occurrence) by splicing at
+    # the offset found before the LLM call
+    updated_content = (
+        current_content[:section_start]
+        + improved_content
+        + current_content[section_start + len(request.section_content):]
+    )
 
-    # Recalculate word count
-    new_word_count = len(updated_content.split())
+    # Adjust the word count for the replaced section only
+    new_word_count = _spliced_word_count(
+        mrd.word_count,
+        current_content,
+        section_start,
+        request.section_content,
+        improved_content
+    )
+    if new_word_count is None:
+        new_word_count = len(updated_content.split())
 
     # Recalculate completeness score (simple version - can be enhanced)
     # For now, keep the existing completeness score since the structure hasn't changed
@@ -646,30 +785,34 @@ def fine_tune_mrd_section(
     initiative.readiness_score = quality_score
     logger.info(f"Quality score recalculated to {quality_score}% after MRD fine-tuning")
 
+    # Stamp updated_at here so the response can be built from the in-memory
+    # row; reading it back after the commit would cost another SELECT
+    mrd.updated_at = datetime.utcnow()
+    snapshot = MRDResponse.model_validate(mrd)
+
     db.commit()
-    db.refresh(mrd)
+    invalidate_initiative_results(initiative_id)
 
-    return mrd
+    return _json_response(snapshot)
 
 
-@router.get("/initiatives/{initiative_id}/mrd/pdf")
-def export_mrd_pdf(
+def _load_export_source(
+    db: Session,
+    load: Callable[[UUID, UUID], Tuple[Optional[Initiative], Optional[object]]],
     initiative_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
+    organization_id: UUID,
+    schema: Type[BaseModel],
+    missing_detail: str
+) -> Tuple[str, BaseModel]:
     """
-    Export the MRD as a PDF file.
+    Load an initiative's title and one of its results as a snapshot, then close the session.
 
-    Returns a properly formatted PDF with correct page breaks.
+    Runs on the threadpool for the async PDF exports. Closing here returns the
+    pooled connection before the render and the streamed response; get_db
+    would otherwise only release it once the response had been sent.
     """
-    import logging
-    logger = logging.getLogger(__name__)
-
     try:
-        # Get initiative (with organization filtering)
-        initiative_repo = InitiativeRepository(db)
-        initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
+        initiative, result = load(initiative_id, organization_id)
 
         if not initiative:
             raise HTTPException(
@@ -677,34 +820,66 @@ def export_mrd_pdf(
                 detail="Initiative not found"
             )
 
-        # Get MRD
-        mrd_repo = MRDRepository(db)
-        mrd = mrd_repo.get_by_initiative(initiative_id)
-
-        if not mrd:
+        if not result:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="MRD not found for this initiative. Generate one first."
+                detail=missing_detail
             )
 
-        logger.info(f"Generating PDF for MRD {mrd.id}, content length: {len(mrd.content)} chars")
+        return initiative.title, schema.model_validate(result)
+    finally:
+        db.close()
 
-        # Generate PDF
-        pdf_bytes = markdown_to_pdf(
-            markdown_content=mrd.content,
-            title=f"MRD - {initiative.title}"
+
+@router.get("/initiatives/{initiative_id}/mrd/pdf")
+async def export_mrd_pdf(
+    initiative_id: UUID,
+    initiative_repo: InitiativeRepository = Depends(get_initiative_repository),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Export the MRD as a PDF file.
+
+    Returns a properly formatted PDF with correct page breaks. The endpoint
+    is async so no request thread sits idle while the render pool works;
+    the database lookup still runs on the threadpool, and the session is
+    closed before rendering.
+    """
+    try:
+        # Get initiative (with organization filtering) and its MRD together
+        initiative_title, mrd = await run_in_threadpool(
+            _load_export_source,
+            db,
+            initiative_repo.get_with_mrd,
+            initiative_id,
+            current_user.organization_id,
+            MRDResponse,
+            "MRD not found for this initiative. Generate one first."
         )
 
-        logger.info(f"PDF generated successfully, {len(pdf_bytes)} bytes")
+        title = f"MRD - {initiative_title}"
+        cache_key = (initiative_id, mrd.id, mrd.version, title)
+        pdf_bytes = _mrd_pdf_cache.get(cache_key)
+
+        if pdf_bytes is None:
+            logger.info(f"Generating PDF for MRD {mrd.id}, content length: {len(mrd.content)} chars")
+
+            # Generate PDF
+            pdf_bytes = await render_pdf_async(
+                markdown_to_pdf,
+                markdown_content=mrd.content,
+                title=title
+            )
+
+            logger.info(f"PDF generated successfully, {len(pdf_bytes)} bytes")
+
+            # Older versions can no longer be requested
+            _invalidate_mrd_pdf(initiative_id)
+            _mrd_pdf_cache.set(cache_key, pdf_bytes)
 
         # Return PDF with proper headers
-        return Response(
-            content=pdf_bytes,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'attachment; filename="mrd-{initiative_id}.pdf"'
-            }
-        )
+        return _pdf_attachment(pdf_bytes, f"mrd-{initiative_id}.pdf")
     except HTTPException:
         raise
     except Exception as e:
@@ -715,10 +890,14 @@ def export_mrd_pdf(
         )
 
 
-@router.delete("/initiatives/{initiative_id}/mrd", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/initiatives/{initiative_id}/mrd",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_initiative_access)]
+)
 def delete_mrd(
     initiative_id: UUID,
-    current_user: User = Depends(get_current_user),
+    mrd_repo: MRDRepository = Depends(get_mrd_repository),
     db: Session = Depends(get_db)
 ):
     """
@@ -726,18 +905,7 @@ def delete_mrd(
 
     This allows regenerating from scratch with a fresh version 1.
     """
-    # Verify initiative access
-    initiative_repo = InitiativeRepository(db)
-    initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
-
-    if not initiative:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Initiative not found"
-        )
-
     # Delete MRD
-    mrd_repo = MRDRepository(db)
     deleted = mrd_repo.delete_by_initiative(initiative_id)
 
     if not deleted:
@@ -747,13 +915,18 @@ def delete_mrd(
         )
 
     db.commit()
+    # Again after commit: a read between the repository's invalidation and
+    # the commit could have re-cached the deleted MRD
+    invalidate_initiative_results(initiative_id)
+    _invalidate_mrd_pdf(initiative_id)
 
     return None
 
 
-@router.post("/initiatives/{initiative_id}/calculate-scores")
+@router.post("/initiatives/{initiative_id}/calculate-scores", dependencies=[Depends(require_initiative_access)])
 def calculate_scores(
     initiative_id: UUID,
+    context_repo: ContextRepository = Depends(get_context_repository),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -771,26 +944,11 @@ def calculate_scores(
 
     Returns job ID for status polling.
     """
-    from backend.models import Job, JobStatus
-
-    print(f"\n{'='*80}")
-    print(f"[ENDPOINT CALLED] POST /api/agents/initiatives/{initiative_id}/calculate-scores")
-    print(f"[ENDPOINT CALLED] User: {current_user.email} (ID: {current_user.id})")
-    print(f"{'='*80}\n")
 
-    # Get initiative
-    initiative_repo = InitiativeRepository(db)
-    initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
-
-    if not initiative:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Initiative not found"
-        )
+    logger.debug("Score calculation requested for initiative %s by user %s", initiative_id, current_user.id)
 
     # Get current context
-    context_repo = ContextRepository(db)
-    context = context_repo.get_current(current_user.organization_id)
+    context = context_repo.get_current_snapshot(current_user.organization_id)
 
     if not context:
         raise HTTPException(
@@ -798,46 +956,40 @@ def calculate_scores(
             detail="No organizational context found. Please create context first."
         )
 
-    # Create background job
-    job_repo = JobRepository(db)
-    job = Job(
-        job_type=JobType.CALCULATE_SCORES,
-        initiative_id=initiative_id,
-        organization_id=current_user.organization_id,
-        created_by=current_user.id,
-        status=JobStatus.PENDING,
-        progress_percent=0,
+    # Create and start the background job, unless one is already running
+    job_id, job_status, created = _start_job(
+        db,
+        JobType.CALCULATE_SCORES,
+        initiative_id,
+        current_user,
         progress_message="Starting score calculation..."
     )
-    job_repo.create(job)
-    db.commit()
 
-    print(f"[SCORING] Created job {job.id} for score calculation")
+    if not created:
+        return {
+            "job_id": str(job_id),
+            "status": job_status.value,
+            "message": "Score calculation already in progress"
+        }
 
-    # Execute job in background
-    execute_job_in_background(job.id)
+    logger.info("Created job %s for score calculation", job_id)
 
     return {
-        "job_id": str(job.id),
+        "job_id": str(job_id),
         "status": "pending",
         "message": "Score calculation started in background"
     }
 
 
-@router.get("/initiatives/{initiative_id}/scores", response_model=ScoreResponse)
-def get_scores(
+def _load_score_snapshot(
     initiative_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """
-    Get the scores for an initiative.
+    current_user: User,
+    initiative_repo: InitiativeRepository
+) -> ScoreResponse:
+    """Load the score for an initiative in the user's organization, or raise 404."""
 
-    Returns the most recent RICE and FDV scores if they exist.
-    """
-    # Verify initiative access
-    initiative_repo = InitiativeRepository(db)
-    initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
+    # Verify initiative access and get the scores in one query
+    initiative, score = initiative_repo.get_with_score(initiative_id, current_user.organization_id)
 
     if not initiative:
         raise HTTPException(
@@ -845,22 +997,48 @@ def get_scores(
             detail="Initiative not found"
         )
 
-    # Get scores
-    score_repo = ScoreRepository(db)
-    score = score_repo.get_by_initiative(initiative_id)
-
     if not score:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Scores not found for this initiative. Calculate them first."
         )
 
-    return score
+    return ScoreResponse.model_validate(score)
+
+
+@router.get("/initiatives/{initiative_id}/scores", response_model=ScoreResponse)
+def get_scores(
+    initiative_id: UUID,
+    request: Request,
+    initiative_repo: InitiativeRepository = Depends(get_initiative_repository),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the scores for an initiative.
+
+    Returns the most recent RICE and FDV scores if they exist. Responses
+    carry an ETag; a matching If-None-Match yields 304 Not Modified.
+    """
+    organization_id = current_user.organization_id
+    snapshot = get_current_result(initiative_repo.db, "score", organization_id, initiative_id)
+    if snapshot is None:
+        snapshot = _load_score_snapshot(initiative_id, current_user, initiative_repo)
+        initiative_results_cache.set(
+            result_cache_key("score", organization_id, initiative_id, snapshot),
+            snapshot
+        )
+
+    body = snapshot.model_dump_json()
+    etag = _score_etag(snapshot.id, body)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return _json_body_response(body, etag)
 
 
 @router.get("/initiatives/{initiative_id}/scores/pdf")
-def export_scores_pdf(
+async def export_scores_pdf(
     initiative_id: UUID,
+    initiative_repo: InitiativeRepository = Depends(get_initiative_repository),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -868,33 +1046,19 @@ def export_scores_pdf(
     Export the scorecard as a PDF file.
 
     Returns a properly formatted PDF with RICE and FDV scores and reasoning.
+    Async for the same reason as export_mrd_pdf.
     """
-    import logging
-    logger = logging.getLogger(__name__)
-
     try:
-        # Get initiative
-        initiative_repo = InitiativeRepository(db)
-        initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
-
-        if not initiative:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Initiative not found"
-            )
-
-        # Get scores
-        score_repo = ScoreRepository(db)
-        score = score_repo.get_by_initiative(initiative_id)
-
-        if not score:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Scores not found for this initiative. Calculate them first."
-            )
-
-        # Import PDF generator
-        from backend.services.pdf_generator import scorecard_to_pdf
+        # Get initiative (with organization filtering) and its scores together
+        initiative_title, score = await run_in_threadpool(
+            _load_export_source,
+            db,
+            initiative_repo.get_with_score,
+            initiative_id,
+            current_user.organization_id,
+            ScoreResponse,
+            "Scores not found for this initiative. Calculate them first."
+        )
 
         # Prepare data
         rice_data = {
@@ -911,8 +1075,9 @@ def export_scores_pdf(
         }
 
         # Generate PDF
-        pdf_bytes = scorecard_to_pdf(
-            initiative_title=initiative.title,
+        pdf_bytes = await render_pdf_async(
+            scorecard_to_pdf,
+            initiative_title=initiative_title,
             rice_score=score.rice_score,
             rice_data=rice_data,
             rice_reasoning=score.rice_reasoning or {},
@@ -924,13 +1089,7 @@ def export_scores_pdf(
         logger.info(f"Scorecard PDF generated successfully, {len(pdf_bytes)} bytes")
 
         # Return PDF with proper headers
-        return Response(
-            content=pdf_bytes,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'attachment; filename="scorecard-{initiative_id}.pdf"'
-            }
-        )
+        return _pdf_attachment(pdf_bytes, f"scorecard-{initiative_id}.pdf")
     except HTTPException:
         raise
     except Exception as e:
@@ -941,10 +1100,14 @@ def export_scores_pdf(
         )
 
 
-@router.delete("/initiatives/{initiative_id}/scores", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/initiatives/{initiative_id}/scores",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_initiative_access)]
+)
 def delete_scores(
     initiative_id: UUID,
-    current_user: User = Depends(get_current_user),
+    score_repo: ScoreRepository = Depends(get_score_repository),
     db: Session = Depends(get_db)
 ):
     """
@@ -952,18 +1115,7 @@ def delete_scores(
 
     This allows recalculating scores from scratch.
     """
-    # Verify initiative access
-    initiative_repo = InitiativeRepository(db)
-    initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
-
-    if not initiative:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Initiative not found"
-        )
-
     # Delete scores
-    score_repo = ScoreRepository(db)
     deleted = score_repo.delete_by_initiative(initiative_id)
 
     if not deleted:
@@ -973,6 +1125,7 @@ def delete_scores(
         )
 
     db.commit()
+    invalidate_initiative_results(initiative_id)
 
     return None
 
@@ -980,6 +1133,7 @@ def delete_scores(
 @router.post("/initiatives/{initiative_id}/recalculate-quality")
 def recalculate_quality_score(
     initiative_id: UUID,
+    initiative_repo: InitiativeRepository = Depends(get_initiative_repository),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -999,7 +1153,6 @@ def recalculate_quality_score(
         Dict with updated quality_score and detailed breakdown
     """
     # Verify initiative access
-    initiative_repo = InitiativeRepository(db)
     initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
 
     if not initiative:
@@ -1030,9 +1183,10 @@ class AnswerGapQuestionRequest(BaseModel):
     estimation_confidence: str = Field(..., description="Confidence level: Low, Medium, or High")
 
 
-@router.post("/initiatives/{initiative_id}/analyze-scoring-gaps")
+@router.post("/initiatives/{initiative_id}/analyze-scoring-gaps", dependencies=[Depends(require_initiative_access)])
 def analyze_scoring_gaps(
     initiative_id: UUID,
+    context_repo: ContextRepository = Depends(get_context_repository),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -1046,21 +1200,8 @@ def analyze_scoring_gaps(
 
     Returns job ID for status polling.
     """
-    from backend.models import Job, JobStatus
-
-    # Verify initiative access
-    initiative_repo = InitiativeRepository(db)
-    initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
-
-    if not initiative:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Initiative not found"
-        )
-
     # Get context
-    context_repo = ContextRepository(db)
-    context = context_repo.get_current(current_user.organization_id)
+    context = context_repo.get_current_snapshot(current_user.organization_id)
 
     if not context:
         raise HTTPException(
@@ -1068,33 +1209,32 @@ def analyze_scoring_gaps(
             detail="No organizational context found. Please create context first."
         )
 
-    # Create background job
-    job_repo = JobRepository(db)
-    job = Job(
-        job_type=JobType.ANALYZE_SCORING_GAPS,
-        initiative_id=initiative_id,
-        organization_id=current_user.organization_id,
-        created_by=current_user.id,
-        status=JobStatus.PENDING,
-        progress_percent=0,
+    # Create and start the background job, unless one is already running
+    job_id, job_status, created = _start_job(
+        db,
+        JobType.ANALYZE_SCORING_GAPS,
+        initiative_id,
+        current_user,
         progress_message="Starting gap analysis..."
     )
-    job_repo.create(job)
-    db.commit()
 
-    print(f"[GAP ANALYSIS] Created job {job.id} for gap analysis")
+    if not created:
+        return {
+            "job_id": str(job_id),
+            "status": job_status.value,
+            "message": "Gap analysis already in progress"
+        }
 
-    # Execute job in background
-    execute_job_in_background(job.id)
+    logger.info("Created job %s for gap analysis", job_id)
 
     return {
-        "job_id": str(job.id),
+        "job_id": str(job_id),
         "status": "pending",
         "message": "Gap analysis started in background"
     }
 
 
-@router.post("/initiatives/{initiative_id}/answer-gap-question")
+@router.post("/initiatives/{initiative_id}/answer-gap-question", dependencies=[Depends(require_initiative_access)])
 def answer_gap_question(
     initiative_id: UUID,
     request: AnswerGapQuestionRequest,
@@ -1113,16 +1253,6 @@ def answer_gap_question(
     The estimated answers will be used in score calculation with
     confidence penalties applied based on the number of estimates.
     """
-    # Verify initiative access
-    initiative_repo = InitiativeRepository(db)
-    initiative = initiative_repo.get_by_id(initiative_id, current_user.organization_id)
-
-    if not initiative:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Initiative not found"
-        )
-
     # Validate confidence level
     valid_confidence = ["Low", "Medium", "High"]
     if request.estimation_confidence not in valid_confidence:
@@ -1148,9 +1278,6 @@ def answer_gap_question(
         )
 
     # Create or update answer
-    from backend.repositories.answer import AnswerRepository
-    from backend.models.answer import AnswerStatus
-
     answer_repo = AnswerRepository(db)
     existing_answer = answer_repo.get_by_question(request.question_id)
 
@@ -1163,7 +1290,6 @@ def answer_gap_question(
         answer = existing_answer
     else:
         # Create new answer
-        from backend.models.answer import Answer
         answer = Answer(
             question_id=request.question_id,
             answer_text=request.answer_text,
@@ -1211,8 +1337,8 @@ def get_job_status(
         "status": job.status.value,
         "progress_percent": job.progress_percent or 0,
         "progress_message": job.progress_message or "",
-        "result_data": job.result_data if job.status.value == "completed" else None,
-        "error_message": job.error_message if job.status.value == "failed" else None,
+        "result_data": job.result_data if job.status == JobStatus.COMPLETED else None,
+        "error_message": job.error_message if job.status == JobStatus.FAILED else None,
         "created_at": job.created_at.isoformat(),
         "updated_at": job.updated_at.isoformat()
     }
@@ -3,7 +3,9 @@ Authentication endpoints for user registration, login, and session management.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Cookie, Response
-from sqlalchemy.orm import Session, joinedload
+from datetime import datetime
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, joinedload, raiseload
 from typing import Optional
 
 from backend.database import get_db
@@ -38,6 +40,19 @@ def register(
     - If neither is provided, raises a 400 error
     - User is created with PRODUCT_MANAGER role if creating new org, CONTRIBUTOR if joining
     """
+    # Validate password complexity
+    try:
+        validate_password_or_raise(request.password)
+    except PasswordValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    # Hash before touching the database: bcrypt takes a few hundred ms and
+    # would otherwise run with a pooled connection checked out
+    password_hash = hash_password(request.password)
+
     # Check if email already exists
     existing_user = db.query(User).filter(User.email == request.email).first()
     if existing_user:
@@ -74,18 +89,6 @@ def register(
             detail="Must provide either organization_name or organization_id"
         )
 
-    # Validate password complexity
-    try:
-        validate_password_or_raise(request.password)
-    except PasswordValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-
-    # Hash password
-    password_hash = hash_password(request.password)
-
     # Create user
     user = User(
         email=request.email,
@@ -146,10 +149,17 @@ def login(
 
     Returns session information and sets a session cookie.
     """
-    # Find user by email and eagerly load roles
+    # Find user by email and eagerly load roles and organization in one query
     user = db.query(User).filter(User.email == request.email).options(
-        joinedload(User.user_roles).joinedload(UserRoleAssociation.role)
+        joinedload(User.user_roles).joinedload(UserRoleAssociation.role),
+        joinedload(User.organization),
+        raiseload("*")
     ).first()
+    organization = user.organization if user else None
+
+    # Return the connection to the pool before the bcrypt check; closing
+    # detaches the loaded rows without expiring them
+    db.close()
 
     if not user or not verify_password(request.password, user.password_hash):
         raise HTTPException(
@@ -163,11 +173,6 @@ def login(
             detail="User account is disabled"
         )
 
-    # Get organization
-    organization = db.query(Organization).filter(
-        Organization.id == user.organization_id
-    ).first()
-
     if not organization:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -175,8 +180,9 @@ def login(
         )
 
     # Update last login
-    from datetime import datetime
-    user.last_login_at = datetime.utcnow()
+    db.execute(
+        update(User).where(User.id == user.id).values(last_login_at=datetime.utcnow())
+    )
     db.commit()
 
     # Get user role names
@@ -257,9 +263,10 @@ def get_session(session_id: Optional[str] = Cookie(None), db: Session = Depends(
             detail="Invalid or expired session"
         )
 
-    # Fetch user from database to get current force_password_change flag
-    user = db.query(User).filter(User.id == session.user_id).first()
-    force_password_change = user.force_password_change if user else False
+    # Read the flag fresh: an admin may set it from any worker process
+    force_password_change = db.execute(
+        select(User.force_password_change).where(User.id == session.user_id)
+    ).scalar_one_or_none() or False
 
     return SessionResponse(
         session_id=session.session_id,
@@ -300,16 +307,20 @@ def change_password(
             detail="Invalid or expired session"
         )
 
-    # Get user from database
-    user = db.query(User).filter(User.id == session.user_id).first()
-    if not user:
+    # Get the user's password hash, then return the connection to the pool
+    # while bcrypt runs (up to three hashes below)
+    current_hash = db.execute(
+        select(User.password_hash).where(User.id == session.user_id)
+    ).scalar_one_or_none()
+    db.close()
+    if current_hash is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
 
     # Verify current password
-    if not verify_password(request.current_password, user.password_hash):
+    if not verify_password(request.current_password, current_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
@@ -325,15 +336,29 @@ def change_password(
         )
 
     # Prevent reusing the same password
-    if verify_password(request.new_password, user.password_hash):
+    if verify_password(request.new_password, current_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="New password must be different from current password"
         )
 
-    # Update password and clear force_password_change flag
-    user.password_hash = hash_password(request.new_password)
-    user.force_password_change = False
+    # Update password and clear force_password_change flag; matching the
+    # verified hash keeps a concurrent change from being overwritten
+    result = db.execute(
+        update(User).where(
+            User.id == session.user_id,
+            User.password_hash == current_hash
+        ).values(
+            password_hash=hash_password(request.new_password),
+            force_password_change=False
+        )
+    )
+    if result.rowcount != 1:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Password was changed concurrently; please try again"
+        )
     db.commit()
 
     return MessageResponse(message="Password changed successfully")
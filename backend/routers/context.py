@@ -11,6 +11,7 @@ from backend.models import User
 from backend.repositories.context import ContextRepository
 from backend.schemas.context import ContextCreate, ContextResponse, ContextListResponse
 from backend.auth.dependencies import get_current_user, require_product_manager
+from backend.dependencies.repositories import get_context_repository
 
 
 router = APIRouter(prefix="/context", tags=["Context"])
@@ -19,13 +20,11 @@ router = APIRouter(prefix="/context", tags=["Context"])
 @router.get("/current", response_model=ContextResponse)
 def get_current_context(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    repo: ContextRepository = Depends(get_context_repository)
 ):
     """
     Get the current (active) context for the organization.
     """
-    repo = ContextRepository(db)
-
     context = repo.get_current(current_user.organization_id)
 
     if not context:
@@ -41,6 +40,7 @@ def get_current_context(
 def create_context_version(
     data: ContextCreate,
     current_user: User = Depends(require_product_manager),
+    repo: ContextRepository = Depends(get_context_repository),
     db: Session = Depends(get_db)
 ):
     """
@@ -49,8 +49,6 @@ def create_context_version(
     Automatically increments version number and marks as current.
     Requires Product Manager or Admin role.
     """
-    repo = ContextRepository(db)
-
     context = repo.create_new_version(
         organization_id=current_user.organization_id,
         company_mission=data.company_mission,
@@ -69,15 +67,13 @@ def create_context_version(
 @router.get("/versions", response_model=ContextListResponse)
 def list_context_versions(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    repo: ContextRepository = Depends(get_context_repository)
 ):
     """
     List all context versions for the organization.
 
     Returns versions ordered by version number (newest first).
     """
-    repo = ContextRepository(db)
-
     contexts = repo.get_all_versions(current_user.organization_id)
 
     return ContextListResponse(
@@ -90,11 +86,9 @@ def list_context_versions(
 def get_context_version(
     version: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    repo: ContextRepository = Depends(get_context_repository)
 ):
     """Get a specific version of context."""
-    repo = ContextRepository(db)
-
     context = repo.get_by_version(current_user.organization_id, version)
 
     if not context:
@@ -110,6 +104,7 @@ def get_context_version(
 def set_context_as_current(
     context_id: UUID,
     current_user: User = Depends(require_product_manager),
+    repo: ContextRepository = Depends(get_context_repository),
     db: Session = Depends(get_db)
 ):
     """
@@ -117,8 +112,6 @@ def set_context_as_current(
 
     Requires Product Manager or Admin role.
     """
-    repo = ContextRepository(db)
-
     context = repo.set_current(context_id, current_user.organization_id)
 
     if not context:
@@ -136,6 +129,7 @@ def set_context_as_current(
 def delete_context_version(
     context_id: UUID,
     current_user: User = Depends(require_product_manager),
+    repo: ContextRepository = Depends(get_context_repository),
     db: Session = Depends(get_db)
 ):
     """
@@ -144,8 +138,6 @@ def delete_context_version(
     Cannot delete the current version - must set another version as current first.
     Requires Product Manager or Admin role.
     """
-    repo = ContextRepository(db)
-
     deleted = repo.delete_version(context_id, current_user.organization_id)
 
     if not deleted:
@@ -11,11 +11,13 @@ from uuid import UUID
 from backend.database import get_db
 from backend.models import Initiative, InitiativeStatus, User
 from backend.repositories.initiative import InitiativeRepository
+from backend.repositories.results_cache import invalidate_initiative_results
 from backend.schemas.initiative import (
     InitiativeCreate, InitiativeUpdate, InitiativeResponse,
     InitiativeListResponse, InitiativeStatusUpdate, InitiativeQuestionLimitUpdate
 )
 from backend.auth.dependencies import get_current_user, require_product_manager, require_admin
+from backend.dependencies.repositories import get_initiative_repository
 
 
 router = APIRouter(prefix="/initiatives", tags=["Initiatives"])
@@ -77,6 +79,7 @@ def enrich_initiative_with_workflow_data(initiative: Initiative, db: Session) ->
 def create_initiative(
     data: InitiativeCreate,
     current_user: User = Depends(require_product_manager),
+    repo: InitiativeRepository = Depends(get_initiative_repository),
     db: Session = Depends(get_db)
 ):
     """
@@ -84,8 +87,6 @@ def create_initiative(
 
     Requires Product Manager or Admin role.
     """
-    repo = InitiativeRepository(db)
-
     # Create initiative
     initiative = Initiative(
         title=data.title,
@@ -109,6 +110,7 @@ def list_initiatives(
     limit: int = Query(100, ge=1, le=100, description="Max results"),
     offset: int = Query(0, ge=0, description="Results to skip"),
     current_user: User = Depends(get_current_user),
+    repo: InitiativeRepository = Depends(get_initiative_repository),
     db: Session = Depends(get_db)
 ):
     """
@@ -116,8 +118,6 @@ def list_initiatives(
 
     Optionally filter by status.
     """
-    repo = InitiativeRepository(db)
-
     if status_filter:
         initiatives = repo.get_by_status(
             status_filter,
@@ -152,11 +152,9 @@ def list_initiatives(
 def get_initiative(
     initiative_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    repo: InitiativeRepository = Depends(get_initiative_repository)
 ):
     """Get a specific initiative by ID."""
-    repo = InitiativeRepository(db)
-
     initiative = repo.get_by_id(initiative_id, current_user.organization_id)
 
     if not initiative:
@@ -173,6 +171,7 @@ def update_initiative(
     initiative_id: UUID,
     data: InitiativeUpdate,
     current_user: User = Depends(require_product_manager),
+    repo: InitiativeRepository = Depends(get_initiative_repository),
     db: Session = Depends(get_db)
 ):
     """
@@ -180,8 +179,6 @@ def update_initiative(
 
     Requires Product Manager or Admin role.
     """
-    repo = InitiativeRepository(db)
-
     initiative = repo.get_by_id(initiative_id, current_user.organization_id)
 
     if not initiative:
@@ -209,6 +206,7 @@ def update_initiative_status(
     initiative_id: UUID,
     data: InitiativeStatusUpdate,
     current_user: User = Depends(require_product_manager),
+    repo: InitiativeRepository = Depends(get_initiative_repository),
     db: Session = Depends(get_db)
 ):
     """
@@ -216,8 +214,6 @@ def update_initiative_status(
 
     Requires Product Manager or Admin role.
     """
-    repo = InitiativeRepository(db)
-
     updated = repo.update_status(
         initiative_id,
         data.status,
@@ -239,6 +235,7 @@ def update_initiative_status(
 def delete_initiative(
     initiative_id: UUID,
     current_user: User = Depends(require_product_manager),
+    repo: InitiativeRepository = Depends(get_initiative_repository),
     db: Session = Depends(get_db)
 ):
     """
@@ -246,8 +243,6 @@ def delete_initiative(
 
     Requires Product Manager or Admin role.
     """
-    repo = InitiativeRepository(db)
-
     deleted = repo.delete(initiative_id, current_user.organization_id)
 
     if not deleted:
@@ -257,6 +252,7 @@ def delete_initiative(
         )
 
     db.commit()
+    invalidate_initiative_results(initiative_id)
 
     return None
 
@@ -265,16 +261,16 @@ def delete_initiative(
 def search_initiatives(
     search_term: str,
     limit: int = Query(20, ge=1, le=100),
+    prefix: bool = Query(False, description="Only match titles starting with the term (type-ahead)"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    repo: InitiativeRepository = Depends(get_initiative_repository)
 ):
     """Search initiatives by title or description."""
-    repo = InitiativeRepository(db)
-
     initiatives = repo.search_by_title(
         search_term,
         current_user.organization_id,
-        limit=limit
+        limit=limit,
+        prefix=prefix
     )
 
     return initiatives
@@ -285,6 +281,7 @@ def update_initiative_question_limit(
     initiative_id: UUID,
     data: InitiativeQuestionLimitUpdate,
     current_user: User = Depends(require_admin),
+    repo: InitiativeRepository = Depends(get_initiative_repository),
     db: Session = Depends(get_db)
 ):
     """
@@ -294,8 +291,6 @@ def update_initiative_question_limit(
     """
     from datetime import datetime
     
-    repo = InitiativeRepository(db)
-
     initiative = repo.get_by_id(initiative_id, current_user.organization_id)
 
     if not initiative:
@@ -50,14 +50,14 @@ def list_questions(
     answer_repo = AnswerRepository(db)
 
     if priority:
-        questions = question_repo.get_by_priority(initiative_id, priority, iteration)
+        questions = question_repo.get_by_priority(initiative_id, priority, iteration, with_answers=True)
     else:
-        questions = question_repo.get_by_initiative(initiative_id, iteration)
+        questions = question_repo.get_by_initiative(initiative_id, iteration, with_answers=True)
 
-    # Load answers for each question
+    # Answers were loaded with the questions
     questions_with_answers = []
     for question in questions:
-        answer = answer_repo.get_by_question(question.id)
+        answer = question.answer
         question_data = QuestionWithAnswerResponse.model_validate(question)
         if answer:
             question_data.answer = AnswerResponse.model_validate(answer)
@@ -70,6 +70,7 @@ class UserListResponse(BaseModel):
     """Response model for list of users."""
     users: List[UserResponse]
     total: int
+    next_cursor: Optional[UUID] = None
 
 
 class CreateUserRequest(BaseModel):
@@ -106,6 +107,17 @@ class UpdateUserRequest(BaseModel):
     role_ids: Optional[List[UUID]] = None
 
 
+class BulkDeactivateRequest(BaseModel):
+    """Request model for deactivating several users at once."""
+    user_ids: List[UUID] = Field(..., min_length=1, max_length=500, description="IDs of the users to deactivate")
+
+
+class BulkDeactivateResponse(BaseModel):
+    """Response model for bulk user deactivation."""
+    deactivated_user_ids: List[UUID]
+    sessions_invalidated: int
+
+
 class ChangePasswordRequest(BaseModel):
     """Request model for changing a user's password."""
     password: Optional[str] = None
@@ -12,7 +12,14 @@ from backend.models.audit_log import AuditLog
 
 
 class AuditLogger:
-    """Service for creating audit log entries."""
+    """
+    Service for creating audit log entries.
+
+    Entries are added to the caller's transaction so they commit (or roll
+    back) together with the change they describe. They are not flushed one
+    by one: the session writes all of a request's entries in one batched
+    INSERT when it next flushes, usually at the caller's commit.
+    """
 
     def __init__(self, db: Session):
         self.db = db
@@ -51,8 +58,6 @@ class AuditLogger:
         )
 
         self.db.add(audit_log)
-        self.db.commit()
-        self.db.refresh(audit_log)
 
         return audit_log
 
@@ -4,10 +4,11 @@ Budget service for managing user spending limits and cost tracking.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import NamedTuple, Optional
+from typing import Dict, List, NamedTuple, Optional
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import and_, case, func, lambda_stmt, select, tuple_
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from backend.models.user import User
@@ -193,4 +194,172 @@ class BudgetService:
             user_id=user_id,
             current_spending=budget_status.current_spending,
             budget_limit=budget_status.monthly_budget
-        )
\ No newline at end of file
+        )
+
+    def get_org_overview(self, organization_id: UUID) -> dict:
+        """
+        Get the budget overview dashboard for an organization in one query.
+
+        Users are joined to their current-month spending and ordered by
+        utilization (highest first) in SQL; the summary totals are folded
+        from the same result set.
+
+        Returns:
+            Dict with "summary" totals and per-user "users" rows
+        """
+        now = datetime.utcnow()
+        spent = func.coalesce(UserMonthlySpending.total_spent_usd, 0)
+        utilization = case(
+            (User.monthly_budget_usd > 0, spent * 100 / User.monthly_budget_usd),
+            else_=0
+        )
+        rows = (
+            self.db.query(
+                User.id,
+                User.email,
+                User.name,
+                User.monthly_budget_usd,
+                spent.label("spent")
+            )
+            .outerjoin(
+                UserMonthlySpending,
+                and_(
+                    UserMonthlySpending.user_id == User.id,
+                    UserMonthlySpending.year == now.year,
+                    UserMonthlySpending.month == now.month
+                )
+            )
+            .filter(User.organization_id == organization_id)
+            .order_by(utilization.desc(), User.name)
+            .all()
+        )
+
+        from backend.services.notification_service import NotificationService
+        notification_service = NotificationService(self.db)
+
+        total_budget = Decimal('0.00')
+        total_spending = Decimal('0.00')
+        users_over_budget = 0
+        users_near_limit = 0  # 80%+ utilization
+        users = []
+
+        for row in rows:
+            current_spending = Decimal(row.spent)
+            budget_status = notification_service.build_budget_status(
+                email=row.email,
+                current_spending=current_spending,
+                budget_limit=row.monthly_budget_usd
+            )
+
+            total_budget += row.monthly_budget_usd
+            total_spending += current_spending
+            if budget_status["is_over_budget"]:
+                users_over_budget += 1
+            elif budget_status["is_near_limit"]:
+                users_near_limit += 1
+
+            users.append({
+                "user_id": str(row.id),
+                "email": row.email,
+                "name": row.name,
+                # Decimals are converted by the response model, not per row here
+                "monthly_budget_usd": budget_status["budget_limit"],
+                "current_spending_usd": current_spending,
+                "remaining_budget_usd": budget_status["remaining_budget"],
+                "utilization_percentage": budget_status["utilization_percentage"],
+                "is_over_budget": budget_status["is_over_budget"],
+                "is_near_limit": budget_status["is_near_limit"],
+                "has_warning": budget_status["has_warning"],
+                "warning_message": budget_status["warning_message"]
+            })
+
+        return {
+            "summary": {
+                "total_users": len(rows),
+                "total_budget_usd": float(total_budget),
+                "total_spending_usd": float(total_spending),
+                "remaining_budget_usd": float(total_budget - total_spending),
+                "overall_utilization_percentage": float(total_spending / total_budget * 100) if total_budget > 0 else 0.0,
+                "users_over_budget": users_over_budget,
+                "users_near_limit": users_near_limit,
+                "users_within_budget": len(rows) - users_over_budget - users_near_limit
+            },
+            "users": users
+        }
+
+    def get_monthly_spending_totals(
+        self,
+        organization_id: UUID,
+        start_year: int,
+        start_month: int
+    ) -> List[Row]:
+        """
+        Get an organization's total spending per month from a given month on.
+
+        The statement shape never changes, so it is built as a lambda
+        statement: SQLAlchemy caches the compiled SQL and only binds the
+        organization and start period on each call.
+
+        Returns:
+            Rows of (year, month, total_spending, active_users) in month order
+        """
+        stmt = lambda_stmt(lambda: (
+            select(
+                UserMonthlySpending.year,
+                UserMonthlySpending.month,
+                func.sum(UserMonthlySpending.total_spent_usd).label('total_spending'),
+                func.count(UserMonthlySpending.user_id).label('active_users')
+            )
+            .join(User, User.id == UserMonthlySpending.user_id)
+            .where(
+                User.organization_id == organization_id,
+                # Row-value comparison keeps later-year months and can
+                # range-scan ix_user_monthly_spending_year_month_user
+                tuple_(UserMonthlySpending.year, UserMonthlySpending.month) >= tuple_(start_year, start_month)
+            )
+            .group_by(UserMonthlySpending.year, UserMonthlySpending.month)
+            .order_by(UserMonthlySpending.year, UserMonthlySpending.month)
+        ))
+        return self.db.execute(stmt).all()
+
+    def get_budget_statuses_bulk(self, user_ids: List[UUID]) -> Dict[UUID, dict]:
+        """
+        Get budget status with warnings for many users in one query.
+
+        Each value has the same shape as get_budget_status_with_warnings.
+        Users that do not exist are left out of the result.
+        """
+        if not user_ids:
+            return {}
+
+        now = datetime.utcnow()
+        rows = (
+            self.db.query(
+                User.id,
+                User.email,
+                User.monthly_budget_usd,
+                UserMonthlySpending.total_spent_usd
+            )
+            .outerjoin(
+                UserMonthlySpending,
+                and_(
+                    UserMonthlySpending.user_id == User.id,
+                    UserMonthlySpending.year == now.year,
+                    UserMonthlySpending.month == now.month
+                )
+            )
+            .filter(User.id.in_(user_ids))
+            .all()
+        )
+
+        from backend.services.notification_service import NotificationService
+        notification_service = NotificationService(self.db)
+
+        return {
+            row.id: notification_service.build_budget_status(
+                email=row.email,
+                current_spending=row.total_spent_usd if row.total_spent_usd is not None else Decimal('0.00'),
+                budget_limit=row.monthly_budget_usd
+            )
+            for row in rows
+        }
\ No newline at end of file
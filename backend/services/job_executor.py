@@ -3,6 +3,7 @@ Job executor service for running background tasks.
 """
 
 import logging
+import threading
 import traceback
 from typing import Callable, Any
 from uuid import UUID
@@ -12,6 +13,7 @@ from backend.database import SessionLocal
 from backend.models import Job, JobStatus, JobType
 from backend.repositories.job import JobRepository
 from backend.repositories.initiative import InitiativeRepository
+from backend.repositories.results_cache import invalidate_initiative_results
 from backend.repositories.context import ContextRepository
 from backend.repositories.question import QuestionRepository
 from backend.repositories.mrd import MRDRepository
@@ -29,6 +31,10 @@ from backend.services.monthly_budget_reset_service import MonthlyBudgetResetServ
 
 logger = logging.getLogger(__name__)
 
+# Set when a job is queued so a worker in this process polls right away
+# instead of at its next interval; workers in other processes still poll
+job_queued = threading.Event()
+
 
 def execute_job_in_background(job_id: UUID) -> None:
     """
@@ -36,14 +42,14 @@ def execute_job_in_background(job_id: UUID) -> None:
 
     Note: This function no longer spawns threads directly. Instead, it relies
     on the background job worker to poll for pending jobs and execute them.
-    The job should already be created with status PENDING before calling this.
+    The job should already be created and committed with status PENDING
+    before calling this.
 
     Args:
         job_id: ID of the job to execute
     """
-    # Job will be picked up by the background worker
-    # No action needed here - just ensure the job is in PENDING status
     logger.info(f"Job {job_id} queued for background execution by worker")
+    job_queued.set()
 
 
 def _execute_job(job_id: UUID) -> None:
@@ -57,20 +63,16 @@ def _execute_job(job_id: UUID) -> None:
 
     try:
         job_repo = JobRepository(db)
-        job = job_repo._get_by_id_internal(job_id)
-
-        if not job:
-            print(f"Job {job_id} not found")
-            return
 
-        if job.status != JobStatus.PENDING:
-            print(f"Job {job_id} is not pending (status: {job.status})")
+        # Claim the job; another worker process may already have it
+        if not job_repo.claim(job_id):
+            logger.debug(f"Job {job_id} is missing, not pending, or claimed by another worker")
             return
-
-        # Mark as in progress
-        job_repo.update_status(job, JobStatus.IN_PROGRESS, "Starting job...")
         db.commit()
 
+        job = job_repo._get_by_id_internal(job_id)
+        logger.info(f"Executing job {job_id} (type: {job.job_type.value})")
+
         # Execute based on job type
         if job.job_type == JobType.GENERATE_QUESTIONS:
             result = _execute_generate_questions(db, job)
@@ -194,8 +196,7 @@ def _execute_generate_questions(db: Session, job: Job) -> dict:
     db.commit()
 
     # Save questions
-    for question in questions:
-        question_repo.create(question)
+    question_repo.bulk_create(questions)
 
     # Increment iteration count
     initiative.iteration_count += 1
@@ -312,6 +313,7 @@ def _execute_generate_mrd(db: Session, job: Job) -> dict:
         initiative.status = InitiativeStatus.MRD_GENERATED
 
     db.commit()
+    invalidate_initiative_results(job.initiative_id)
 
     return {
         "mrd_id": str(mrd.id),
@@ -377,6 +379,7 @@ def _execute_evaluate_readiness(db: Session, job: Job) -> dict:
     initiative.readiness_score = quality_score
 
     db.commit()
+    invalidate_initiative_results(job.initiative_id)
 
     return {
         "evaluation_id": str(evaluation_record.id),
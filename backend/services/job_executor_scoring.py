@@ -2,16 +2,22 @@
 Job executor handlers for scoring-related jobs.
 """
 
+import logging
+
 from sqlalchemy.orm import Session
 from backend.models import Job, JobStatus
 from backend.repositories.job import JobRepository
 from backend.repositories.initiative import InitiativeRepository
 from backend.repositories.context import ContextRepository
+from backend.repositories.results_cache import invalidate_initiative_results
 from backend.agents.scoring_gap_analyzer import ScoringGapAnalyzer
 from backend.agents.scoring import ScoringAgent
 from backend.agents.base import LLMError
 
 
+logger = logging.getLogger(__name__)
+
+
 def execute_analyze_scoring_gaps(db: Session, job: Job) -> dict:
     """
     Execute gap analysis job.
@@ -54,9 +60,12 @@ def execute_analyze_scoring_gaps(db: Session, job: Job) -> dict:
     )
 
     # Debug logging
-    print(f"Gap analysis completed. Result type: {type(gap_analysis)}, has gap_analysis: {'gap_analysis' in (gap_analysis or {})}")
+    logger.debug(
+        "Gap analysis completed. Result type: %s, has gap_analysis: %s",
+        type(gap_analysis), "gap_analysis" in (gap_analysis or {})
+    )
     if gap_analysis:
-        print(f"Gap analysis keys: {gap_analysis.keys() if isinstance(gap_analysis, dict) else 'not a dict'}")
+        logger.debug("Gap analysis keys: %s", gap_analysis.keys() if isinstance(gap_analysis, dict) else "not a dict")
 
     # Update progress after analysis
     job_repo.update_status(job, JobStatus.IN_PROGRESS, "Processing gap analysis results...", 70)
@@ -73,7 +82,7 @@ def execute_analyze_scoring_gaps(db: Session, job: Job) -> dict:
         "gap_analysis": gap_analysis
     }
 
-    print(f"Returning result: {result.keys()}, gap_analysis is None: {result['gap_analysis'] is None}")
+    logger.debug("Returning result: %s, gap_analysis is None: %s", result.keys(), result["gap_analysis"] is None)
 
     return result
 
@@ -125,48 +134,25 @@ def execute_calculate_scores(db: Session, job: Job) -> dict:
 
     # Save scores to database
     from backend.repositories.score import ScoreRepository
-    from backend.models.score import Score
 
     score_repo = ScoreRepository(db)
-    existing_score = score_repo.get_by_initiative(job.initiative_id)
-
-    if existing_score:
-        # Update existing score
-        existing_score.reach = rice_data.get("reach")
-        existing_score.impact = rice_data.get("impact")
-        existing_score.confidence = rice_data.get("confidence")
-        existing_score.effort = rice_data.get("effort")
-        existing_score.rice_score = rice_data.get("rice_score")
-        existing_score.feasibility = fdv_data.get("feasibility")
-        existing_score.desirability = fdv_data.get("desirability")
-        existing_score.viability = fdv_data.get("viability")
-        existing_score.fdv_score = fdv_data.get("fdv_score")
-        existing_score.rice_reasoning = rice_data.get("reasoning", "")
-        existing_score.fdv_reasoning = fdv_data.get("reasoning", "")
-        existing_score.data_quality = data_quality
-        existing_score.warnings = warnings
-        existing_score.scored_by = job.created_by
-        score = existing_score
-    else:
-        # Create new score
-        score = Score(
-            initiative_id=job.initiative_id,
-            reach=rice_data.get("reach"),
-            impact=rice_data.get("impact"),
-            confidence=rice_data.get("confidence"),
-            effort=rice_data.get("effort"),
-            rice_score=rice_data.get("rice_score"),
-            feasibility=fdv_data.get("feasibility"),
-            desirability=fdv_data.get("desirability"),
-            viability=fdv_data.get("viability"),
-            fdv_score=fdv_data.get("fdv_score"),
-            rice_reasoning=rice_data.get("reasoning", ""),
-            fdv_reasoning=fdv_data.get("reasoning", ""),
-            data_quality=data_quality,
-            warnings=warnings,
-            scored_by=job.created_by
-        )
-        score_repo.create(score)
+    score = score_repo.create_or_update(
+        initiative_id=job.initiative_id,
+        reach=rice_data.get("reach"),
+        impact=rice_data.get("impact"),
+        confidence=rice_data.get("confidence"),
+        effort=rice_data.get("effort"),
+        rice_score=rice_data.get("rice_score"),
+        rice_reasoning=rice_data.get("reasoning", ""),
+        feasibility=fdv_data.get("feasibility"),
+        desirability=fdv_data.get("desirability"),
+        viability=fdv_data.get("viability"),
+        fdv_score=fdv_data.get("fdv_score"),
+        fdv_reasoning=fdv_data.get("reasoning", ""),
+        scored_by=job.created_by,
+        data_quality=data_quality,
+        warnings=warnings
+    )
 
     # Update initiative status to Scored
     from backend.models.initiative import InitiativeStatus
@@ -174,6 +160,7 @@ def execute_calculate_scores(db: Session, job: Job) -> dict:
 
     job_repo.update_status(job, JobStatus.IN_PROGRESS, "Finalizing...", 90)
     db.commit()
+    invalidate_initiative_results(job.initiative_id)
 
     return {
         "initiative_id": str(job.initiative_id),
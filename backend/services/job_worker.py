@@ -7,25 +7,38 @@ only exist in one worker process, this creates a separate background thread
 that polls the database for PENDING jobs and executes them.
 
 Architecture:
-- Single background thread per application instance
-- Polls database every N seconds for PENDING jobs
+- One polling thread per application instance, dispatching to a small
+  thread pool (JOB_WORKER_CONCURRENCY jobs at once)
+- Polls database every N seconds for PENDING jobs, and immediately when
+  a job is queued from the same process
 - Uses database row locking to prevent duplicate execution
 - Graceful shutdown on SIGTERM/SIGINT
 - Works across multiple Gunicorn workers
+
+The worker normally runs inside each API process. To run jobs on dedicated
+machines instead, set RUN_JOB_WORKER=false on the API and start workers with:
+
+    python -m backend.services.job_worker
+
+Jobs are claimed with a conditional UPDATE, so any number of workers can
+poll the same database.
 """
 
 import threading
 import time
 import logging
 import signal
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Set
+from uuid import UUID
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 
+from backend.config import settings
 from backend.database import SessionLocal
 from backend.models import Job, JobStatus
 from backend.repositories.job import JobRepository
-from backend.services.job_executor import _execute_job
+from backend.services.job_executor import _execute_job, job_queued
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +73,11 @@ class JobWorker:
         self._max_restarts = 5
         self._last_heartbeat = datetime.utcnow()
         self._health_check_thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Jobs handed to the executor but not finished, so a job still
+        # queued behind busy threads is not submitted again on the next poll
+        self._in_flight: Set[UUID] = set()
+        self._in_flight_lock = threading.Lock()
 
         # Register signal handlers for graceful shutdown (with error handling)
         try:
@@ -82,9 +100,16 @@ class JobWorker:
             logger.warning("Job worker is already running")
             return
 
-        logger.info(f"Starting job worker with poll_interval={self.poll_interval}s")
+        logger.info(
+            f"Starting job worker with poll_interval={self.poll_interval}s, "
+            f"concurrency={settings.job_worker_concurrency}"
+        )
         self.running = True
         self._shutdown_event.clear()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.job_worker_concurrency),
+            thread_name_prefix="job"
+        )
         
         try:
             self.thread = threading.Thread(target=self._run_worker, daemon=False)
@@ -116,6 +141,7 @@ class JobWorker:
         logger.info("Stopping job worker...")
         self.running = False
         self._shutdown_event.set()
+        job_queued.set()  # Wake the polling thread
 
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=30)  # Wait up to 30 seconds
@@ -124,6 +150,23 @@ class JobWorker:
             else:
                 logger.info("Job worker stopped successfully")
 
+        if self._executor is not None:
+            # Queued jobs were never claimed and stay PENDING for the next worker
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the worker is asked to stop.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if shutdown was requested, False if the timeout elapsed first
+        """
+        return self._shutdown_event.wait(timeout=timeout)
+
     def _run_worker(self):
         """Main worker loop that polls for pending jobs."""
         logger.info("🚀 Job worker loop started")
@@ -137,6 +180,10 @@ class JobWorker:
                 # Update heartbeat for health monitoring
                 self._last_heartbeat = datetime.utcnow()
                 
+                # Clear before polling so a job queued during the fetch
+                # still wakes the wait below
+                job_queued.clear()
+
                 # Check for pending jobs
                 jobs = self._get_pending_jobs()
 
@@ -145,17 +192,14 @@ class JobWorker:
                     for job in jobs:
                         if not self.running:
                             break
-                        logger.info(f"🔄 Executing job {job.id} (type: {job.job_type.value})")
-                        self._execute_job_safely(job.id)
-                        # Update heartbeat after job execution
-                        self._last_heartbeat = datetime.utcnow()
+                        self._submit(job.id)
                 else:
                     logger.debug("No pending jobs found")
 
-                # Wait for next poll interval or shutdown event
+                # Wait for next poll interval, a newly queued job, or shutdown
                 logger.debug(f"Waiting {self.poll_interval}s for next poll...")
-                if self._shutdown_event.wait(timeout=self.poll_interval):
-                    # Shutdown event was set
+                job_queued.wait(timeout=self.poll_interval)
+                if self._shutdown_event.is_set():
                     logger.info("Shutdown event received, exiting worker loop")
                     break
 
@@ -275,6 +319,22 @@ class JobWorker:
         finally:
             db.close()
 
+    def _submit(self, job_id: UUID) -> None:
+        """Hand a pending job to the executor unless it is already there."""
+        with self._in_flight_lock:
+            if job_id in self._in_flight or self._executor is None:
+                return
+            self._in_flight.add(job_id)
+
+        logger.info(f"🔄 Dispatching job {job_id}")
+        future = self._executor.submit(self._execute_job_safely, job_id)
+        future.add_done_callback(lambda _: self._finish(job_id))
+
+    def _finish(self, job_id: UUID) -> None:
+        with self._in_flight_lock:
+            self._in_flight.discard(job_id)
+        self._last_heartbeat = datetime.utcnow()
+
     def _execute_job_safely(self, job_id):
         """
         Execute a job in a separate thread with error handling.
@@ -283,30 +343,9 @@ class JobWorker:
             job_id: ID of the job to execute
         """
         try:
-            # Claim the job by marking it IN_PROGRESS
-            db: Session = SessionLocal()
-            try:
-                job_repo = JobRepository(db)
-                job = job_repo._get_by_id_internal(job_id)
-
-                if not job:
-                    logger.warning(f"Job {job_id} not found")
-                    return
-
-                # Check if already being processed
-                if job.status != JobStatus.PENDING:
-                    logger.debug(f"Job {job_id} is no longer PENDING (status: {job.status})")
-                    return
-
-                # Mark as claimed (will be updated to IN_PROGRESS by executor)
-                logger.info(f"Executing job {job_id} (type: {job.job_type.value})")
-
-            finally:
-                db.close()
-
-            # Execute the job (this will handle its own database session)
+            # _execute_job claims the job atomically and skips it if it is
+            # missing, no longer PENDING or taken by another worker
             _execute_job(job_id)
-
         except Exception as e:
             logger.error(f"Error executing job {job_id}: {e}", exc_info=True)
 
@@ -347,3 +386,20 @@ def stop_job_worker():
 def get_job_worker() -> Optional[JobWorker]:
     """Get the global job worker instance."""
     return _worker
+
+
+def run_standalone_worker(poll_interval: int = 2):
+    """Run a job worker in the foreground until SIGTERM/SIGINT."""
+    from backend.logging_config import setup_logging
+    setup_logging()
+
+    worker = JobWorker(poll_interval=poll_interval)
+    worker.start()
+    while worker.running:
+        # Short waits keep the main thread responsive to signals
+        worker.wait(timeout=1)
+    worker.stop()
+
+
+if __name__ == "__main__":
+    run_standalone_worker()
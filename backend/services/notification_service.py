@@ -79,23 +79,39 @@ class NotificationService:
             if not user:
                 return None
             
-            remaining_budget = budget_limit - current_spending
-            
-            warning_message = (
-                f"Budget Warning: You have used {utilization_percentage:.1f}% "
-                f"of your monthly budget (${current_spending} of ${budget_limit}). "
-                f"Remaining budget: ${remaining_budget}."
-            )
-            
-            # Log the warning
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Budget utilization warning for user {user.email}: {warning_message}")
-            
-            return warning_message
+            return self._budget_warning(user.email, current_spending, budget_limit)
         
         return None
 
+    def _budget_warning(
+        self,
+        email: str,
+        current_spending: Decimal,
+        budget_limit: Decimal
+    ) -> Optional[str]:
+        """Return (and log) the 80%+ utilization warning for a user, if any."""
+        if budget_limit <= 0:
+            return None
+
+        utilization_percentage = float(current_spending / budget_limit * 100)
+        if utilization_percentage < 80:
+            return None
+
+        remaining_budget = budget_limit - current_spending
+
+        warning_message = (
+            f"Budget Warning: You have used {utilization_percentage:.1f}% "
+            f"of your monthly budget (${current_spending} of ${budget_limit}). "
+            f"Remaining budget: ${remaining_budget}."
+        )
+
+        # Log the warning
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.warning(f"Budget utilization warning for user {email}: {warning_message}")
+
+        return warning_message
+
     def get_budget_status_with_warnings(
         self, 
         user_id: UUID, 
@@ -112,6 +128,30 @@ class NotificationService:
             user_id, current_spending, budget_limit
         )
         
+        return self._budget_status(current_spending, budget_limit, warning_message)
+
+    def build_budget_status(
+        self,
+        email: str,
+        current_spending: Decimal,
+        budget_limit: Decimal
+    ) -> dict:
+        """
+        Get budget status with warnings for a user the caller already loaded.
+
+        Same result as get_budget_status_with_warnings without looking the
+        user up again.
+        """
+        warning_message = self._budget_warning(email, current_spending, budget_limit)
+        return self._budget_status(current_spending, budget_limit, warning_message)
+
+    @staticmethod
+    def _budget_status(
+        current_spending: Decimal,
+        budget_limit: Decimal,
+        warning_message: Optional[str]
+    ) -> dict:
+        """Assemble the budget status dictionary."""
         utilization_percentage = float(current_spending / budget_limit * 100) if budget_limit > 0 else 0
         remaining_budget = budget_limit - current_spending
         
@@ -124,4 +164,4 @@ class NotificationService:
             "warning_message": warning_message,
             "is_over_budget": current_spending > budget_limit,
             "is_near_limit": utilization_percentage >= 80
-        }
\ No newline at end of file
+        }
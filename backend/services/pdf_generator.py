@@ -2,10 +2,101 @@
 PDF generation service using WeasyPrint.
 """
 
+import asyncio
 import io
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, Optional
+
 import markdown
 from weasyprint import HTML, CSS
 from weasyprint.text.fonts import FontConfiguration
+from fastapi.concurrency import run_in_threadpool
+
+from backend.config import settings
+
+
+# Rendering is CPU-bound and holds the GIL; running it in worker processes
+# keeps it from stalling the threads serving other requests
+_render_pool: Optional[ProcessPoolExecutor] = None
+_render_pool_lock = threading.Lock()
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            # spawn: forking a process that runs threads and holds DB connections is unsafe
+            _render_pool = ProcessPoolExecutor(
+                max_workers=settings.pdf_render_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _render_pool
+
+
+def render_pdf(renderer: Callable[..., bytes], *args, **kwargs) -> bytes:
+    """
+    Run a PDF renderer in the render process pool.
+
+    Arguments cross a process boundary, so they must be picklable
+    (strings, numbers, dicts). With PDF_RENDER_WORKERS=0 the renderer
+    runs in the calling thread.
+
+    Args:
+        renderer: Module-level rendering function such as markdown_to_pdf
+        *args: Positional arguments for the renderer
+        **kwargs: Keyword arguments for the renderer
+
+    Returns:
+        PDF file as bytes
+    """
+    if settings.pdf_render_workers == 0:
+        return renderer(*args, **kwargs)
+    return _get_render_pool().submit(renderer, *args, **kwargs).result()
+
+
+async def render_pdf_async(renderer: Callable[..., bytes], *args, **kwargs) -> bytes:
+    """
+    Await a PDF render without holding one of the request threads.
+
+    Same contract as render_pdf; use it from async endpoints. With
+    PDF_RENDER_WORKERS=0 the renderer runs on the threadpool instead.
+
+    Returns:
+        PDF file as bytes
+    """
+    if settings.pdf_render_workers == 0:
+        return await run_in_threadpool(renderer, *args, **kwargs)
+    return await asyncio.wrap_future(_get_render_pool().submit(renderer, *args, **kwargs))
+
+
+def shutdown_render_pool() -> None:
+    """Stop the render worker processes, if any were started."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is not None:
+            _render_pool.shutdown(cancel_futures=True)
+            _render_pool = None
+
+
+def iter_pdf_chunks(pdf_bytes: bytes, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Yield a rendered PDF in fixed-size chunks for a streaming response.
+
+    Slicing a memoryview avoids copying the document; only the chunk
+    being sent is materialized.
+
+    Args:
+        pdf_bytes: Rendered PDF
+        chunk_size: Maximum bytes per chunk
+
+    Yields:
+        Consecutive slices of the PDF
+    """
+    view = memoryview(pdf_bytes)
+    for start in range(0, len(view), chunk_size):
+        yield bytes(view[start:start + chunk_size])
 
 
 def markdown_to_pdf(markdown_content: str, title: str = "Document") -> bytes:
@@ -10,7 +10,6 @@ from sqlalchemy.orm import Session
 from uuid import UUID
 
 from backend.repositories.question import QuestionRepository
-from backend.repositories.answer import AnswerRepository
 
 
 def calculate_quality_score(db: Session, initiative_id: UUID) -> Tuple[int, dict]:
@@ -49,10 +48,9 @@ def calculate_quality_score(db: Session, initiative_id: UUID) -> Tuple[int, dict
         }
     """
     question_repo = QuestionRepository(db)
-    answer_repo = AnswerRepository(db)
 
     # Get all questions for initiative
-    questions = question_repo.get_by_initiative(initiative_id)
+    questions = question_repo.get_by_initiative(initiative_id, with_answers=True)
 
     if not questions:
         # No questions = no quality assessment possible
@@ -79,7 +77,7 @@ def calculate_quality_score(db: Session, initiative_id: UUID) -> Tuple[int, dict
 
     # Count answered questions (Answered or Unknown status = answered)
     def is_answered(question):
-        answer = answer_repo.get_by_question(question.id)
+        answer = question.answer
         if not answer:
             return False
         return answer.answer_status in ["Answered", "Unknown"]
@@ -43,6 +43,7 @@ def assign_admin_role(email: str):
 
         # Assign admin role
         user_role_repo.assign_role(user.id, admin_role.id)
+        db.commit()
         print(f"✓ Admin role assigned to {email}")
 
     finally:
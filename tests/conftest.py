@@ -7,11 +7,15 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from fastapi.testclient import TestClient
 
+from backend.config import settings
 from backend.database import Base, get_db
 from backend.main import app
 from backend.models import Organization, User, UserRoleEnum
 
 
+# Unplanned lazy loads in strict routes fail tests instead of adding queries
+settings.strict_relationship_loading = True
+
 # Test database URL (in-memory for tests)
 # Use check_same_thread=False with poolclass=StaticPool to ensure all connections
 # share the same in-memory database
@@ -166,6 +170,36 @@ def test_client_no_auth(client):
     return client
 
 
+@pytest.fixture
+def roles(test_db: Session):
+    """Seed the default roles and return them by name."""
+    from backend.repositories.role_repository import RoleRepository
+
+    role_repo = RoleRepository(test_db)
+    role_repo.ensure_default_roles()
+    return {role.name: role for role in role_repo.get_all()}
+
+
+@pytest.fixture
+def admin_client(client, test_db: Session, admin_user: User, test_organization: Organization, roles):
+    """Authenticated client for a user holding the RBAC admin role."""
+    from backend.auth.session import session_manager
+    from backend.repositories.user_role_repository import UserRoleRepository
+
+    UserRoleRepository(test_db).set_user_roles(admin_user.id, [roles["admin"].id])
+
+    session = session_manager.create_session(
+        user_id=admin_user.id,
+        email=admin_user.email,
+        name=admin_user.name,
+        role=admin_user.role,
+        organization_id=test_organization.id,
+        organization_name=test_organization.name
+    )
+    client.cookies.set("session_id", session.session_id)
+    return client
+
+
 @pytest.fixture
 def test_context(test_db: Session, test_organization: Organization, test_user):
     """Create a test organizational context."""
@@ -0,0 +1,202 @@
+"""
+API tests for admin analytics endpoints.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy.orm import Session
+
+from backend.models.llmcall import LLMCall
+from backend.models.organization import Organization
+from backend.models.user import User
+from backend.models.user_monthly_spending import UserMonthlySpending
+from backend.routers import admin
+
+
+def _add_call(test_db: Session, user: User, organization: Organization, cost: float):
+    test_db.add(LLMCall(
+        agent_name="Knowledge Gap Agent",
+        model="model-a",
+        cost_usd=cost,
+        total_tokens=1000,
+        input_tokens=600,
+        output_tokens=400,
+        user_id=user.id,
+        organization_id=organization.id
+    ))
+    test_db.commit()
+
+
+class TestAnalyticsDashboard:
+    """GET /api/admin/analytics/dashboard"""
+
+    def test_returns_all_panels(self, admin_client, test_db: Session, admin_user: User, test_organization: Organization):
+        _add_call(test_db, admin_user, test_organization, 0.5)
+
+        response = admin_client.get("/api/admin/analytics/dashboard", params={"days": 7})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["period_days"] == 7
+        assert body["overview"]["total_stats"]["total_calls"] == 1
+        assert body["by_user"][0]["email"] == admin_user.email
+        assert body["by_agent"][0]["agent_name"] == "Knowledge Gap Agent"
+        assert body["by_model"][0]["model"] == "model-a"
+        assert sum(bucket["call_count"] for bucket in body["over_time"]) == 1
+
+
+class TestAnalyticsCache:
+    """Short-lived caching of analytics aggregates."""
+
+    def test_repeat_request_is_served_from_cache(self, admin_client, test_db: Session, admin_user: User, test_organization: Organization):
+        _add_call(test_db, admin_user, test_organization, 0.5)
+        first = admin_client.get("/api/admin/analytics/overview", params={"days": 30}).json()
+
+        _add_call(test_db, admin_user, test_organization, 1.0)
+        second = admin_client.get("/api/admin/analytics/overview", params={"days": 30}).json()
+
+        assert second == first
+
+    def test_different_window_is_not_shared(self, admin_client, test_db: Session, admin_user: User, test_organization: Organization):
+        admin_client.get("/api/admin/analytics/overview", params={"days": 30})
+        _add_call(test_db, admin_user, test_organization, 1.0)
+
+        response = admin_client.get("/api/admin/analytics/overview", params={"days": 7})
+
+        assert response.json()["total_stats"]["total_calls"] == 1
+
+    def test_reports_cache_status_header(self, admin_client):
+        first = admin_client.get("/api/admin/analytics/by-model", params={"days": 30})
+        second = admin_client.get("/api/admin/analytics/by-model", params={"days": 30})
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+
+
+class TestAnalyticsConditionalRequests:
+    """ETag revalidation of analytics responses."""
+
+    def test_matching_etag_returns_not_modified(self, admin_client):
+        first = admin_client.get("/api/admin/analytics/by-agent", params={"days": 30})
+        etag = first.headers["ETag"]
+
+        second = admin_client.get(
+            "/api/admin/analytics/by-agent",
+            params={"days": 30},
+            headers={"If-None-Match": etag}
+        )
+
+        assert first.headers["Cache-Control"].startswith("private, max-age=")
+        assert second.status_code == 304
+        assert second.headers["ETag"] == etag
+        assert second.content == b""
+
+    def test_etag_differs_per_window(self, admin_client):
+        thirty = admin_client.get("/api/admin/analytics/by-agent", params={"days": 30})
+
+        seven = admin_client.get(
+            "/api/admin/analytics/by-agent",
+            params={"days": 7},
+            headers={"If-None-Match": thirty.headers["ETag"]}
+        )
+
+        assert seven.status_code == 200
+        assert seven.headers["ETag"] != thirty.headers["ETag"]
+
+    def test_etag_follows_the_payload(self, admin_client, test_db: Session, admin_user: User, test_organization: Organization):
+        first = admin_client.get("/api/admin/analytics/overview", params={"days": 30})
+        # Once the cached aggregate expires, new calls must not revalidate the old copy
+        admin._analytics_cache.clear()
+        _add_call(test_db, admin_user, test_organization, 1.0)
+
+        second = admin_client.get(
+            "/api/admin/analytics/overview",
+            params={"days": 30},
+            headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+        assert second.status_code == 200
+        assert second.headers["ETag"] != first.headers["ETag"]
+        assert second.json()["total_stats"]["total_calls"] == 1
+
+    def test_etag_list_and_weak_tags_match(self, admin_client):
+        etag = admin_client.get("/api/admin/analytics/by-model", params={"days": 30}).headers["ETag"]
+
+        response = admin_client.get(
+            "/api/admin/analytics/by-model",
+            params={"days": 30},
+            headers={"If-None-Match": f'"stale", W/{etag}'}
+        )
+
+        assert response.status_code == 304
+
+
+class TestBudgetOverview:
+    """GET /api/admin/budget/overview"""
+
+    def test_returns_summary_and_users(self, admin_client, test_user: User):
+        response = admin_client.get("/api/admin/budget/overview")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["summary"]["total_users"] == 2
+        assert {user["email"] for user in body["users"]} == {"admin@example.com", test_user.email}
+
+
+class TestSpendingTrends:
+    """GET /api/admin/budget/spending-trends"""
+
+    def test_window_spans_year_boundary(self, admin_client, test_db: Session, test_user: User):
+        now = datetime.utcnow()
+        # Twelve months back always crosses into the previous calendar year
+        # unless the current month is December
+        periods = []
+        for months_ago in (12, 11, 0):
+            year, month_index = divmod(now.year * 12 + now.month - 1 - months_ago, 12)
+            periods.append((year, month_index + 1))
+        for year, month in periods:
+            test_db.add(UserMonthlySpending(
+                user_id=test_user.id, year=year, month=month, total_spent_usd=Decimal("10.00")
+            ))
+        test_db.commit()
+
+        response = admin_client.get("/api/admin/budget/spending-trends", params={"months": 12})
+
+        assert response.status_code == 200
+        returned = [(trend["year"], trend["month"]) for trend in response.json()["trends"]]
+        assert returned == periods[1:]
+
+
+class TestBudgetAlerts:
+    """GET /api/admin/budget/alerts"""
+
+    def test_amounts_serialize_as_numbers(self, admin_client, test_db: Session, test_user: User):
+        now = datetime.utcnow()
+        test_db.add(UserMonthlySpending(
+            user_id=test_user.id, year=now.year, month=now.month, total_spent_usd=Decimal("85.50")
+        ))
+        test_db.commit()
+
+        response = admin_client.get("/api/admin/budget/alerts")
+
+        alert = response.json()["alerts"][0]
+        assert alert["monthly_budget_usd"] == 100.0
+        assert alert["current_spending_usd"] == 85.5
+        assert alert["alert_level"] == "warning"
+
+
+class TestBudgetCache:
+    """Caching of budget dashboards and invalidation on admin edits."""
+
+    def test_budget_update_invalidates_cached_alerts(self, admin_client, test_user: User):
+        assert admin_client.get("/api/admin/budget/alerts").headers["X-Cache"] == "MISS"
+        assert admin_client.get("/api/admin/budget/alerts").headers["X-Cache"] == "HIT"
+
+        response = admin_client.put(
+            f"/api/admin/users/{test_user.id}/budget",
+            json={"monthly_budget_usd": "250.00"}
+        )
+        assert response.status_code == 200
+
+        assert admin_client.get("/api/admin/budget/alerts").headers["X-Cache"] == "MISS"
@@ -0,0 +1,260 @@
+"""
+API tests for admin user management endpoints.
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from backend.auth.session import session_manager
+from backend.repositories._profiling import count_queries
+from backend.models.audit_log import AuditLog
+from backend.models.user import User
+from backend.models.user_role import UserRole
+from backend.services.audit_logger import AuditLogger
+
+
+class TestCreateUser:
+    """POST /api/admin/users"""
+
+    def test_create_user_with_roles(self, admin_client, roles):
+        response = admin_client.post("/api/admin/users", json={
+            "email": "new.user@example.com",
+            "name": "New User",
+            "password": "Password123!",
+            "role_ids": [str(roles["product"].id), str(roles["technical"].id)]
+        })
+
+        assert response.status_code == 201
+        role_names = {role["name"] for role in response.json()["user"]["roles"]}
+        assert role_names == {"product", "technical"}
+
+    def test_roles_are_not_reloaded_after_assignment(self, admin_client, test_db: Session, roles):
+        # Warm the caller's cached role names so only create_user's queries are counted
+        admin_client.get("/api/admin/roles")
+
+        with count_queries(test_db) as queries:
+            response = admin_client.post("/api/admin/users", json={
+                "email": "new.user@example.com",
+                "name": "New User",
+                "password": "Password123!",
+                "role_ids": [str(roles["product"].id)]
+            })
+
+        assert response.status_code == 201
+        assert not [sql for sql in queries.statements if "JOIN roles" in sql]
+
+    def test_duplicate_email_is_rejected(self, admin_client, test_user: User):
+        response = admin_client.post("/api/admin/users", json={
+            "email": test_user.email,
+            "name": "Someone Else",
+            "password": "Password123!"
+        })
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Email already registered"
+
+    def test_unknown_role_is_rejected_without_creating_user(self, admin_client, test_db: Session, roles):
+        unknown_id = uuid4()
+
+        response = admin_client.post("/api/admin/users", json={
+            "email": "new.user@example.com",
+            "name": "New User",
+            "password": "Password123!",
+            "role_ids": [str(roles["product"].id), str(unknown_id)]
+        })
+
+        assert response.status_code == 400
+        assert str(unknown_id) in response.json()["detail"]
+        assert test_db.query(User).filter(User.email == "new.user@example.com").first() is None
+
+
+class TestUpdateUser:
+    """PATCH /api/admin/users/{user_id}"""
+
+    def test_update_roles(self, admin_client, test_user: User, roles):
+        response = admin_client.patch(f"/api/admin/users/{test_user.id}", json={
+            "role_ids": [str(roles["financial"].id)]
+        })
+
+        assert response.status_code == 200
+        assert [role["name"] for role in response.json()["roles"]] == ["financial"]
+
+    def test_unchanged_request_writes_nothing(self, admin_client, test_db: Session, test_user: User, roles):
+        admin_client.patch(f"/api/admin/users/{test_user.id}", json={
+            "role_ids": [str(roles["product"].id)]
+        })
+        audit_count = test_db.query(AuditLog).count()
+
+        response = admin_client.patch(f"/api/admin/users/{test_user.id}", json={
+            "name": "Test User",
+            "is_active": True,
+            "role_ids": [str(roles["product"].id)]
+        })
+
+        assert response.status_code == 200
+        assert [role["name"] for role in response.json()["roles"]] == ["product"]
+        assert test_db.query(AuditLog).count() == audit_count
+
+    def test_email_taken_by_another_user_is_rejected(self, admin_client, test_db: Session, test_user: User, admin_user: User):
+        response = admin_client.patch(f"/api/admin/users/{test_user.id}", json={
+            "email": admin_user.email,
+            "name": "Renamed"
+        })
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Email already registered"
+        test_db.expire_all()
+        assert test_db.get(User, test_user.id).email == "test@example.com"
+
+    def test_unknown_role_leaves_user_unchanged(self, admin_client, test_db: Session, test_user: User):
+        response = admin_client.patch(f"/api/admin/users/{test_user.id}", json={
+            "name": "Renamed",
+            "role_ids": [str(uuid4())]
+        })
+
+        assert response.status_code == 400
+        test_db.expire_all()
+        assert test_db.get(User, test_user.id).name == "Test User"
+
+
+class TestRoleCache:
+    """Cached role names used by require_admin."""
+
+    def test_revoked_admin_role_takes_effect_immediately(self, admin_client, test_user: User, roles):
+        admin_cookie = admin_client.cookies.get("session_id")
+        admin_client.patch(f"/api/admin/users/{test_user.id}", json={
+            "role_ids": [str(roles["admin"].id)]
+        })
+        session = session_manager.create_session(
+            user_id=test_user.id,
+            email=test_user.email,
+            name=test_user.name,
+            role=test_user.role,
+            organization_id=test_user.organization_id,
+            organization_name="Test Organization"
+        )
+
+        admin_client.cookies.set("session_id", session.session_id)
+        assert admin_client.get("/api/admin/roles").status_code == 200
+
+        admin_client.cookies.set("session_id", admin_cookie)
+        admin_client.patch(f"/api/admin/users/{test_user.id}", json={
+            "role_ids": [str(roles["product"].id)]
+        })
+
+        admin_client.cookies.set("session_id", session.session_id)
+        assert admin_client.get("/api/admin/roles").status_code == 403
+
+    def test_role_removed_by_another_process_is_enforced(self, admin_client, test_db: Session, admin_user: User, roles):
+        assert admin_client.get("/api/admin/roles").status_code == 200
+
+        # Another API worker revokes the role; this process never hears about it
+        test_db.query(UserRole).filter(UserRole.user_id == admin_user.id).delete()
+        test_db.commit()
+
+        assert admin_client.get("/api/admin/roles").status_code == 403
+
+
+class TestBulkDeactivate:
+    """POST /api/admin/users/deactivate"""
+
+    def test_deactivates_users_and_revokes_sessions(self, admin_client, test_db: Session, test_user: User, admin_user: User):
+        user_id = test_user.id
+        session = session_manager.create_session(
+            user_id=user_id,
+            email=test_user.email,
+            name=test_user.name,
+            role=test_user.role,
+            organization_id=test_user.organization_id,
+            organization_name="Test Organization"
+        )
+
+        response = admin_client.post("/api/admin/users/deactivate", json={
+            "user_ids": [str(user_id), str(admin_user.id), str(uuid4())]
+        })
+
+        assert response.status_code == 200
+        assert response.json() == {"deactivated_user_ids": [str(user_id)], "sessions_invalidated": 1}
+        assert session_manager.get_session(session.session_id) is None
+        test_db.expire_all()
+        assert test_db.get(User, user_id).is_active is False
+        assert test_db.get(User, admin_user.id).is_active is True
+
+    def test_failed_write_keeps_sessions(self, admin_client, test_user: User, monkeypatch):
+        session = session_manager.create_session(
+            user_id=test_user.id,
+            email=test_user.email,
+            name=test_user.name,
+            role=test_user.role,
+            organization_id=test_user.organization_id,
+            organization_name="Test Organization"
+        )
+
+        def fail(self, **kwargs):
+            raise RuntimeError("audit store unavailable")
+
+        monkeypatch.setattr(AuditLogger, "log_user_update", fail)
+
+        with pytest.raises(RuntimeError):
+            admin_client.post("/api/admin/users/deactivate", json={"user_ids": [str(test_user.id)]})
+
+        assert session_manager.get_session(session.session_id) is not None
+
+
+class TestDeleteUser:
+    """DELETE /api/admin/users/{user_id}"""
+
+    def test_delete_user(self, admin_client, test_db: Session, test_user: User):
+        user_id = test_user.id
+
+        response = admin_client.delete(f"/api/admin/users/{user_id}")
+
+        assert response.status_code == 204
+        test_db.expire_all()
+        assert test_db.get(User, user_id) is None
+        audit = test_db.query(AuditLog).filter(
+            AuditLog.action == "delete_user",
+            AuditLog.entity_id == user_id
+        ).one()
+        assert audit.changes == {"email": "test@example.com"}
+
+    def test_cannot_delete_self(self, admin_client, test_db: Session, admin_user: User):
+        response = admin_client.delete(f"/api/admin/users/{admin_user.id}")
+
+        assert response.status_code == 400
+        test_db.expire_all()
+        assert test_db.get(User, admin_user.id) is not None
+
+
+class TestListUsers:
+    """GET /api/admin/users"""
+
+    def test_lists_users_with_roles(self, admin_client, test_user: User):
+        response = admin_client.get("/api/admin/users")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 2
+        by_email = {user["email"]: user for user in body["users"]}
+        assert [role["name"] for role in by_email["admin@example.com"]["roles"]] == ["admin"]
+        assert by_email[test_user.email]["budget"] is not None
+
+    def test_paginates_by_name(self, admin_client, test_user: User):
+        first = admin_client.get("/api/admin/users", params={"limit": 1}).json()
+        second = admin_client.get("/api/admin/users", params={"limit": 1, "offset": 1}).json()
+
+        assert [user["name"] for user in first["users"]] == ["Admin User"]
+        assert [user["name"] for user in second["users"]] == ["Test User"]
+        assert first["total"] == second["total"] == 2
+
+    def test_cursor_pages_follow_name_order(self, admin_client, test_user: User):
+        first = admin_client.get("/api/admin/users", params={"limit": 1}).json()
+        second = admin_client.get("/api/admin/users", params={"limit": 1, "after": first["next_cursor"]}).json()
+        third = admin_client.get("/api/admin/users", params={"limit": 1, "after": second["next_cursor"]}).json()
+
+        assert [user["name"] for user in first["users"]] == ["Admin User"]
+        assert [user["name"] for user in second["users"]] == ["Test User"]
+        assert third["users"] == []
+        assert third["next_cursor"] is None
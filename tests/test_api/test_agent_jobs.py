@@ -0,0 +1,73 @@
+"""
+API tests for starting agent background jobs.
+"""
+
+from sqlalchemy.orm import Session
+
+from backend.config import settings
+from backend.models import InitiativeStatus, Job, JobType
+from backend.routers import agents
+
+
+class TestJobDeduplication:
+    """Repeated requests while a job is in flight reuse that job."""
+
+    def test_double_submit_starts_one_job(self, test_client, test_db: Session, test_initiative, test_context, monkeypatch):
+        started = []
+        monkeypatch.setattr(agents, "execute_job_in_background", started.append)
+        url = f"/api/agents/initiatives/{test_initiative.id}/calculate-scores"
+
+        first = test_client.post(url).json()
+        second = test_client.post(url).json()
+
+        assert second["job_id"] == first["job_id"]
+        assert second["message"] == "Score calculation already in progress"
+        assert len(started) == 1
+        assert test_db.query(Job).filter(Job.job_type == JobType.CALCULATE_SCORES).count() == 1
+
+    def test_double_submit_starts_one_gap_analysis(self, test_client, test_db: Session, test_initiative, test_context, monkeypatch):
+        started = []
+        monkeypatch.setattr(agents, "execute_job_in_background", started.append)
+        url = f"/api/agents/initiatives/{test_initiative.id}/analyze-scoring-gaps"
+
+        first = test_client.post(url).json()
+        second = test_client.post(url).json()
+
+        assert second["job_id"] == first["job_id"]
+        assert second["status"] == "pending"
+        assert second["message"] == "Gap analysis already in progress"
+        assert len(started) == 1
+        assert test_db.query(Job).filter(Job.job_type == JobType.ANALYZE_SCORING_GAPS).count() == 1
+
+    def test_window_of_zero_disables_deduplication(self, test_client, test_initiative, test_context, monkeypatch):
+        monkeypatch.setattr(agents, "execute_job_in_background", lambda job_id: None)
+        monkeypatch.setattr(settings, "job_dedup_window_seconds", 0)
+        url = f"/api/agents/initiatives/{test_initiative.id}/generate-mrd"
+
+        first = test_client.post(url).json()
+        second = test_client.post(url).json()
+
+        assert second["job_id"] != first["job_id"]
+
+
+class TestQuestionGenerationGate:
+    """Question generation is limited to Draft and In_QA initiatives."""
+
+    def test_in_qa_initiative_starts_a_job(self, test_client, test_db: Session, test_initiative, test_context, monkeypatch):
+        monkeypatch.setattr(agents, "execute_job_in_background", lambda job_id: None)
+        test_initiative.status = InitiativeStatus.IN_QA
+        test_db.commit()
+
+        response = test_client.post(f"/api/agents/initiatives/{test_initiative.id}/generate-questions")
+
+        assert response.status_code == 200
+        assert "job_id" in response.json()
+
+    def test_archived_initiative_is_rejected(self, test_client, test_db: Session, test_initiative, test_context):
+        test_initiative.status = InitiativeStatus.ARCHIVED
+        test_db.commit()
+
+        response = test_client.post(f"/api/agents/initiatives/{test_initiative.id}/generate-questions")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Cannot generate questions for initiative in Archived status"
@@ -0,0 +1,213 @@
+"""
+API tests for the cached agent result endpoints.
+"""
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from backend.config import settings
+from backend.models import MRD
+from backend.repositories._profiling import count_queries
+from backend.repositories.mrd import MRDRepository
+from backend.repositories.score import ScoreRepository
+from backend.routers import agents
+from backend.schemas.mrd import MRDResponse
+
+
+def _save_mrd(test_db: Session, initiative, user, content: str):
+    MRDRepository(test_db).create_or_update(
+        initiative_id=initiative.id,
+        content=content,
+        quality_disclaimer="Draft",
+        word_count=len(content.split()),
+        completeness_score=80,
+        readiness_at_generation=70,
+        assumptions_made=[],
+        generated_by=user.id
+    )
+    test_db.commit()
+
+
+class TestGetMrd:
+    """GET /api/agents/initiatives/{initiative_id}/mrd"""
+
+    def test_repeat_reads_skip_the_mrd_query(self, test_client, test_db: Session, test_initiative, test_user):
+        _save_mrd(test_db, test_initiative, test_user, "First draft")
+        url = f"/api/agents/initiatives/{test_initiative.id}/mrd"
+        first = test_client.get(url)
+
+        with count_queries(test_db) as queries:
+            second = test_client.get(url)
+
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        # Only the version lookup runs; the content is not reloaded
+        assert not [sql for sql in queries.statements if "mrds.content" in sql]
+
+    def test_write_from_another_process_is_served(self, test_client, test_db: Session, test_initiative, test_user):
+        _save_mrd(test_db, test_initiative, test_user, "First draft")
+        url = f"/api/agents/initiatives/{test_initiative.id}/mrd/content"
+        assert test_client.get(url).json()["content"] == "First draft"
+
+        # A job worker's write never reaches this process's cache invalidation
+        test_db.execute(
+            update(MRD)
+            .where(MRD.initiative_id == test_initiative.id)
+            .values(content="Second draft", version=MRD.version + 1)
+        )
+        test_db.commit()
+
+        body = test_client.get(url).json()
+        assert body["version"] == 2
+        assert body["content"] == "Second draft"
+
+    def test_regenerated_mrd_is_served_immediately(self, test_client, test_db: Session, test_initiative, test_user):
+        _save_mrd(test_db, test_initiative, test_user, "First draft")
+        url = f"/api/agents/initiatives/{test_initiative.id}/mrd/content"
+        assert test_client.get(url).json()["version"] == 1
+
+        _save_mrd(test_db, test_initiative, test_user, "Second draft")
+
+        body = test_client.get(url).json()
+        assert body["version"] == 2
+        assert body["content"] == "Second draft"
+
+    def test_deleted_mrd_is_not_served_from_cache(self, test_client, test_db: Session, test_initiative, test_user):
+        _save_mrd(test_db, test_initiative, test_user, "First draft")
+        url = f"/api/agents/initiatives/{test_initiative.id}/mrd"
+        assert test_client.get(url).status_code == 200
+
+        assert test_client.delete(url).status_code == 204
+
+        assert test_client.get(url).status_code == 404
+
+    def test_matching_etag_returns_not_modified(self, test_client, test_db: Session, test_initiative, test_user):
+        _save_mrd(test_db, test_initiative, test_user, "First draft")
+        url = f"/api/agents/initiatives/{test_initiative.id}/mrd"
+        etag = test_client.get(url).headers["etag"]
+
+        response = test_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        _save_mrd(test_db, test_initiative, test_user, "Second draft")
+        response = test_client.get(f"{url}/content", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_body_matches_the_response_model(self, test_client, test_db: Session, test_initiative, test_user):
+        _save_mrd(test_db, test_initiative, test_user, "First draft")
+        mrd = MRDRepository(test_db).get_by_initiative(test_initiative.id)
+
+        response = test_client.get(f"/api/agents/initiatives/{test_initiative.id}/mrd")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == MRDResponse.model_validate(mrd).model_dump(mode="json")
+
+
+class TestExportMrdPdf:
+    """GET /api/agents/initiatives/{initiative_id}/mrd/pdf"""
+
+    def test_unchanged_mrd_is_rendered_once(self, test_client, test_db: Session, test_initiative, test_user, monkeypatch):
+        renders = []
+
+        def fake_markdown_to_pdf(markdown_content, title):
+            renders.append(markdown_content)
+            return f"%PDF {markdown_content}".encode()
+
+        monkeypatch.setattr(agents, "markdown_to_pdf", fake_markdown_to_pdf)
+        monkeypatch.setattr(settings, "pdf_render_workers", 0)
+        _save_mrd(test_db, test_initiative, test_user, "First draft")
+        url = f"/api/agents/initiatives/{test_initiative.id}/mrd/pdf"
+
+        assert test_client.get(url).content == b"%PDF First draft"
+        assert test_client.get(url).content == b"%PDF First draft"
+        _save_mrd(test_db, test_initiative, test_user, "Second draft")
+        assert test_client.get(url).content == b"%PDF Second draft"
+
+        assert renders == ["First draft", "Second draft"]
+
+    def test_session_is_released_before_rendering(self, test_client, test_db: Session, test_initiative, test_user, monkeypatch):
+        in_transaction = []
+
+        def fake_markdown_to_pdf(markdown_content, title):
+            in_transaction.append(test_db.in_transaction())
+            return b"%PDF"
+
+        monkeypatch.setattr(agents, "markdown_to_pdf", fake_markdown_to_pdf)
+        monkeypatch.setattr(settings, "pdf_render_workers", 0)
+        _save_mrd(test_db, test_initiative, test_user, "First draft")
+
+        response = test_client.get(f"/api/agents/initiatives/{test_initiative.id}/mrd/pdf")
+
+        assert response.status_code == 200
+        assert in_transaction == [False]
+
+    def test_missing_mrd_is_not_found(self, test_client, test_initiative):
+        response = test_client.get(f"/api/agents/initiatives/{test_initiative.id}/mrd/pdf")
+
+        assert response.status_code == 404
+
+
+class TestExportScoresPdf:
+    """GET /api/agents/initiatives/{initiative_id}/scores/pdf"""
+
+    def test_session_is_released_before_rendering(self, test_client, test_db: Session, test_initiative, test_user, monkeypatch):
+        rendered = []
+
+        def fake_scorecard_to_pdf(initiative_title, **kwargs):
+            rendered.append((initiative_title, kwargs["rice_score"], test_db.in_transaction()))
+            return b"%PDF"
+
+        monkeypatch.setattr(agents, "scorecard_to_pdf", fake_scorecard_to_pdf)
+        monkeypatch.setattr(settings, "pdf_render_workers", 0)
+        ScoreRepository(test_db).create_or_update(
+            initiative_id=test_initiative.id,
+            reach=1000, impact=2.0, confidence=80, effort=3.0, rice_score=533.3,
+            rice_reasoning={}, feasibility=7, desirability=8, viability=6,
+            fdv_score=7.0, fdv_reasoning={}, scored_by=test_user.id
+        )
+        test_db.commit()
+        title = test_initiative.title
+
+        response = test_client.get(f"/api/agents/initiatives/{test_initiative.id}/scores/pdf")
+
+        assert response.status_code == 200
+        assert rendered == [(title, 533.3, False)]
+
+
+def _save_score(test_db: Session, initiative, user, rice_score: float):
+    ScoreRepository(test_db).create_or_update(
+        initiative_id=initiative.id,
+        reach=1000, impact=2.0, confidence=80, effort=3.0, rice_score=rice_score,
+        rice_reasoning={}, feasibility=7, desirability=8, viability=6,
+        fdv_score=7.0, fdv_reasoning={}, scored_by=user.id
+    )
+    test_db.commit()
+
+
+class TestGetScores:
+    """GET /api/agents/initiatives/{initiative_id}/scores"""
+
+    def test_rescore_from_another_process_is_served(self, test_client, test_db: Session, test_initiative, test_user, monkeypatch):
+        url = f"/api/agents/initiatives/{test_initiative.id}/scores"
+        _save_score(test_db, test_initiative, test_user, 533.3)
+        assert test_client.get(url).json()["rice_score"] == 533.3
+
+        # Simulate the scoring job running in a worker process: its
+        # invalidation does not reach the API process's cache
+        monkeypatch.setattr("backend.repositories.score.invalidate_initiative_results", lambda initiative_id: None)
+        _save_score(test_db, test_initiative, test_user, 120.0)
+
+        assert test_client.get(url).json()["rice_score"] == 120.0
+
+    def test_matching_etag_returns_not_modified(self, test_client, test_db: Session, test_initiative, test_user):
+        _save_score(test_db, test_initiative, test_user, 533.3)
+        url = f"/api/agents/initiatives/{test_initiative.id}/scores"
+        etag = test_client.get(url).headers["etag"]
+
+        response = test_client.get(url, headers={"If-None-Match": f'W/"stale", {etag}'})
+        assert response.status_code == 304
+        assert response.content == b""
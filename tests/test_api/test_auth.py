@@ -0,0 +1,154 @@
+"""
+API tests for the authentication endpoints.
+"""
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from backend.auth.password import verify_password
+from backend.models import User
+from backend.repositories._profiling import count_queries
+from backend.routers import auth
+
+
+def _verify_without_connection(test_db: Session, checked: list):
+    """verify_password stand-in recording whether a transaction was open during the check."""
+    def verify(password, password_hash):
+        checked.append(test_db.in_transaction())
+        return verify_password(password, password_hash)
+    return verify
+
+
+class TestLogin:
+    """POST /auth/login"""
+
+    def test_login_sets_session_and_last_login(self, test_client_no_auth, test_db: Session, test_user, test_organization):
+        user_id, email, password = test_user.id, test_user.email, test_user.plain_password
+
+        response = test_client_no_auth.post("/auth/login", json={"email": email, "password": password})
+
+        assert response.status_code == 200
+        assert response.json()["organization_name"] == test_organization.name
+        assert "session_id" in response.cookies
+        assert test_db.get(User, user_id).last_login_at is not None
+
+    def test_wrong_password_is_rejected(self, test_client_no_auth, test_user):
+        response = test_client_no_auth.post("/auth/login", json={
+            "email": test_user.email,
+            "password": "WrongPass123!"
+        })
+
+        assert response.status_code == 401
+
+    def test_user_roles_and_organization_load_in_one_query(self, test_client_no_auth, test_db: Session, test_user):
+        email, password = test_user.email, test_user.plain_password
+
+        with count_queries(test_db) as queries:
+            response = test_client_no_auth.post("/auth/login", json={"email": email, "password": password})
+
+        assert response.status_code == 200
+        # The joined user fetch plus the last_login_at UPDATE
+        assert len(queries) == 2
+
+    def test_password_is_checked_without_an_open_transaction(self, test_client_no_auth, test_db: Session, test_user, monkeypatch):
+        checked = []
+        monkeypatch.setattr(auth, "verify_password", _verify_without_connection(test_db, checked))
+
+        response = test_client_no_auth.post("/auth/login", json={
+            "email": test_user.email,
+            "password": test_user.plain_password
+        })
+
+        assert response.status_code == 200
+        assert checked == [False]
+
+
+class TestRegister:
+    """POST /auth/register"""
+
+    def test_password_is_hashed_before_the_transaction_opens(self, test_client_no_auth, test_db: Session, monkeypatch):
+        checked = []
+
+        def hash_password(password):
+            checked.append(test_db.in_transaction())
+            return "hashed"
+
+        monkeypatch.setattr(auth, "hash_password", hash_password)
+
+        response = test_client_no_auth.post("/auth/register", json={
+            "email": "new.user@example.com",
+            "password": "NewUserPass123!",
+            "name": "New User",
+            "organization_name": "New Org"
+        })
+
+        assert response.status_code == 201
+        assert checked == [False]
+        assert test_db.query(User).filter(User.email == "new.user@example.com").one().password_hash == "hashed"
+
+
+class TestChangePassword:
+    """POST /auth/change-password"""
+
+    def test_changes_password_and_clears_flag(self, test_client, test_db: Session, test_user, monkeypatch):
+        user_id = test_user.id
+        test_user.force_password_change = True
+        test_db.commit()
+        checked = []
+        monkeypatch.setattr(auth, "verify_password", _verify_without_connection(test_db, checked))
+
+        response = test_client.post("/auth/change-password", json={
+            "current_password": test_user.plain_password,
+            "new_password": "BrandNewPass456!"
+        })
+
+        assert response.status_code == 200
+        user = test_db.get(User, user_id)
+        test_db.refresh(user)
+        assert verify_password("BrandNewPass456!", user.password_hash)
+        assert user.force_password_change is False
+        assert checked == [False, False]
+
+    def test_wrong_current_password_is_rejected(self, test_client, test_user):
+        response = test_client.post("/auth/change-password", json={
+            "current_password": "WrongPass123!",
+            "new_password": "BrandNewPass456!"
+        })
+
+        assert response.status_code == 400
+
+
+class TestGetSession:
+    """GET /auth/session"""
+
+    def test_flag_set_by_another_process_is_reported(self, test_client, test_db: Session, test_user):
+        assert test_client.get("/auth/session").json()["force_password_change"] is False
+
+        # An admin sets the flag through another worker
+        test_db.execute(
+            update(User).where(User.id == test_user.id).values(force_password_change=True)
+        )
+        test_db.commit()
+
+        assert test_client.get("/auth/session").json()["force_password_change"] is True
+
+    def test_password_change_refreshes_the_flag(self, test_client, test_db: Session, test_user):
+        test_user.force_password_change = True
+        test_db.commit()
+        assert test_client.get("/auth/session").json()["force_password_change"] is True
+
+        test_client.post("/auth/change-password", json={
+            "current_password": test_user.plain_password,
+            "new_password": "BrandNewPass456!"
+        })
+
+        assert test_client.get("/auth/session").json()["force_password_change"] is False
+
+    def test_reads_only_the_flag(self, test_client, test_db: Session):
+        with count_queries(test_db) as queries:
+            response = test_client.get("/auth/session")
+
+        assert response.status_code == 200
+        assert response.json()["force_password_change"] is False
+        (statement,) = queries.statements
+        assert "users.password_hash" not in statement
@@ -0,0 +1,30 @@
+"""
+API tests for the shared initiative access dependency.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+
+class TestRequireInitiativeAccess:
+    """Routes guarded by require_initiative_access."""
+
+    @pytest.mark.parametrize("method, path", [
+        ("post", "evaluate-readiness"),
+        ("post", "generate-mrd"),
+        ("delete", "mrd"),
+        ("post", "calculate-scores"),
+        ("delete", "scores"),
+        ("post", "analyze-scoring-gaps"),
+    ])
+    def test_unknown_initiative_is_not_found(self, test_client, method, path):
+        response = getattr(test_client, method)(f"/api/agents/initiatives/{uuid4()}/{path}")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Initiative not found"
+
+    def test_requires_authentication(self, test_client_no_auth, test_initiative):
+        response = test_client_no_auth.delete(f"/api/agents/initiatives/{test_initiative.id}/mrd")
+
+        assert response.status_code == 401
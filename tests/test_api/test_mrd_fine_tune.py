@@ -0,0 +1,100 @@
+"""
+API tests for MRD section fine-tuning.
+"""
+
+from sqlalchemy.orm import Session
+
+from backend.models import MRD
+from backend.repositories._profiling import count_queries
+from backend.repositories.mrd import MRDRepository
+from backend.routers import agents
+
+
+class _UppercaseEditor:
+    calls = 0
+
+    def __init__(self, db):
+        pass
+
+    def fine_tune_section(self, section_content, **kwargs):
+        _UppercaseEditor.calls += 1
+        return section_content.upper()
+
+
+class TestFineTuneMrdSection:
+    """POST /api/agents/initiatives/{initiative_id}/mrd/fine-tune-section"""
+
+    def _setup(self, test_db: Session, test_initiative, test_user, monkeypatch):
+        _UppercaseEditor.calls = 0
+        monkeypatch.setattr(agents, "MRDEditorAgent", _UppercaseEditor)
+        MRDRepository(test_db).create_or_update(
+            initiative_id=test_initiative.id,
+            content="## Problem\nslow checkout\n## Solution\nslow checkout fix",
+            quality_disclaimer=None,
+            word_count=9,
+            completeness_score=80,
+            readiness_at_generation=70,
+            assumptions_made=[],
+            generated_by=test_user.id
+        )
+        test_db.commit()
+        return f"/api/agents/initiatives/{test_initiative.id}/mrd/fine-tune-section"
+
+    def test_replaces_first_occurrence_only(self, test_client, test_db: Session, test_initiative, test_user, monkeypatch):
+        url = self._setup(test_db, test_initiative, test_user, monkeypatch)
+
+        response = test_client.post(url, json={
+            "section_name": "Problem",
+            "section_content": "slow checkout",
+            "user_instructions": "Emphasize it"
+        })
+
+        assert response.status_code == 200
+        assert response.json()["version"] == 2
+        assert response.json()["word_count"] == 9
+        mrd = test_db.query(MRD).filter(MRD.initiative_id == test_initiative.id).one()
+        test_db.refresh(mrd)
+        assert mrd.content == "## Problem\nSLOW CHECKOUT\n## Solution\nslow checkout fix"
+
+    def test_missing_section_is_rejected_before_calling_the_editor(self, test_client, test_db: Session, test_initiative, test_user, monkeypatch):
+        url = self._setup(test_db, test_initiative, test_user, monkeypatch)
+
+        response = test_client.post(url, json={
+            "section_name": "Risks",
+            "section_content": "not in the document",
+            "user_instructions": "Expand"
+        })
+
+        assert response.status_code == 400
+        assert _UppercaseEditor.calls == 0
+
+    def test_word_count_counts_words_joined_across_the_section_boundary(self, test_client, test_db: Session, test_initiative, test_user, monkeypatch):
+        url = self._setup(test_db, test_initiative, test_user, monkeypatch)
+        monkeypatch.setattr(_UppercaseEditor, "fine_tune_section", lambda self, section_content, **kwargs: "out stage")
+
+        response = test_client.post(url, json={
+            "section_name": "Problem",
+            "section_content": "checkout\n## Sol",
+            "user_instructions": "Rewrite"
+        })
+
+        assert response.status_code == 200
+        # "checkout ## Solution" becomes "out stageution"
+        assert response.json()["word_count"] == 8
+
+    def test_updated_mrd_is_not_read_back_after_commit(self, test_client, test_db: Session, test_initiative, test_user, monkeypatch):
+        url = self._setup(test_db, test_initiative, test_user, monkeypatch)
+
+        with count_queries(test_db) as queries:
+            response = test_client.post(url, json={
+                "section_name": "Problem",
+                "section_content": "slow checkout",
+                "user_instructions": "Emphasize it"
+            })
+
+        assert response.status_code == 200
+        assert response.json()["content"] == "## Problem\nSLOW CHECKOUT\n## Solution\nslow checkout fix"
+        assert response.json()["updated_at"]
+        statements = [str(statement) for statement in queries.statements]
+        update_at = next(i for i, s in enumerate(statements) if s.lstrip().upper().startswith("UPDATE MRDS"))
+        assert not any("FROM mrds" in s for s in statements[update_at + 1:])
@@ -0,0 +1,107 @@
+"""
+Query budgets for the agent endpoints.
+
+Each test pins an upper bound on the SQL statements one request issues,
+so a lost eager load or a reintroduced per-row lookup fails here instead
+of slipping through as a slowdown.
+"""
+
+from sqlalchemy.orm import Session
+
+from backend.models import Question, QuestionCategory, QuestionPriority
+from backend.repositories._profiling import count_queries
+from backend.routers import agents
+
+
+class _NoQuestionsAgent:
+    def __init__(self, db):
+        pass
+
+    def regenerate_questions(self, **kwargs):
+        return []
+
+
+class _ThreeQuestionsAgent:
+    def __init__(self, db):
+        pass
+
+    def regenerate_questions(self, initiative, **kwargs):
+        return [
+            Question(
+                initiative_id=initiative.id,
+                iteration=1,
+                category=QuestionCategory.BUSINESS_DEV,
+                priority=QuestionPriority.P1,
+                question_text=f"Question {i}?",
+                rationale="Needed for scoring",
+            )
+            for i in range(3)
+        ]
+
+
+def _post(test_client, test_db: Session, url: str):
+    with count_queries(test_db) as queries:
+        response = test_client.post(url)
+    return response, queries
+
+
+class TestAgentQueryBudgets:
+    """Statements per request for the job-dispatching agent endpoints."""
+
+    def test_calculate_scores(self, test_client, test_db: Session, test_initiative, test_context, monkeypatch):
+        monkeypatch.setattr(agents, "execute_job_in_background", lambda job_id: None)
+        url = f"/api/agents/initiatives/{test_initiative.id}/calculate-scores"
+
+        response, queries = _post(test_client, test_db, url)
+
+        assert response.status_code == 200
+        assert len(queries) <= 6
+
+    def test_generate_mrd(self, test_client, test_db: Session, test_initiative, test_context, monkeypatch):
+        monkeypatch.setattr(agents, "execute_job_in_background", lambda job_id: None)
+        url = f"/api/agents/initiatives/{test_initiative.id}/generate-mrd"
+
+        response, queries = _post(test_client, test_db, url)
+
+        assert response.status_code == 200
+        # Includes the in-flight job lookup that deduplicates double submits
+        assert len(queries) <= 6
+
+    def test_regenerate_questions(self, test_client, test_db: Session, test_initiative, test_context, monkeypatch):
+        monkeypatch.setattr(agents, "KnowledgeGapAgent", _NoQuestionsAgent)
+        url = f"/api/agents/initiatives/{test_initiative.id}/regenerate-questions"
+
+        response, queries = _post(test_client, test_db, url)
+
+        assert response.status_code == 200
+        assert len(queries) <= 11
+
+    def test_regenerate_questions_returns_the_batch(
+        self, test_client, test_db: Session, test_initiative, test_context, monkeypatch
+    ):
+        monkeypatch.setattr(agents, "KnowledgeGapAgent", _ThreeQuestionsAgent)
+        url = f"/api/agents/initiatives/{test_initiative.id}/regenerate-questions"
+
+        response, queries = _post(test_client, test_db, url)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [q["question_text"] for q in body] == ["Question 0?", "Question 1?", "Question 2?"]
+        assert all(q["initiative_id"] == str(test_initiative.id) for q in body)
+        # The empty-batch budget plus one batched INSERT; the new rows are not
+        # read back one by one
+        assert len(queries) <= 12
+
+    def test_job_dispatch_does_not_reload_the_new_job(
+        self, test_client, test_db: Session, test_initiative, test_context, monkeypatch
+    ):
+        """The committed job is not read back, so the connection stays released."""
+        monkeypatch.setattr(agents, "execute_job_in_background", lambda job_id: None)
+        url = f"/api/agents/initiatives/{test_initiative.id}/generate-mrd"
+
+        response, queries = _post(test_client, test_db, url)
+
+        assert response.status_code == 200
+        statements = [str(statement) for statement in queries.statements]
+        insert_at = next(i for i, s in enumerate(statements) if s.lstrip().upper().startswith("INSERT INTO JOBS"))
+        assert not any("FROM jobs" in s for s in statements[insert_at + 1:])
@@ -0,0 +1,64 @@
+"""
+Tests for AnalyticsRepository.
+"""
+
+from datetime import datetime, timedelta
+
+from backend.models.llmcall import LLMCall, LLMCallStatus
+from backend.repositories._profiling import count_queries
+from backend.repositories.analytics import AnalyticsRepository
+
+
+def _add_calls(test_db, test_user, test_organization):
+    calls = [
+        ("Knowledge Gap Agent", "model-a", LLMCallStatus.SUCCESS, 0.50, 1200),
+        ("Knowledge Gap Agent", "model-a", LLMCallStatus.SUCCESS, 0.25, 800),
+        ("MRD Generator", "model-b", LLMCallStatus.SUCCESS, 1.00, 3000),
+        ("MRD Generator", "model-b", LLMCallStatus.ERROR, 0.0, 0),
+    ]
+    test_db.add_all([
+        LLMCall(
+            agent_name=agent_name,
+            model=model,
+            status=status,
+            cost_usd=cost,
+            total_tokens=tokens,
+            input_tokens=tokens // 2,
+            output_tokens=tokens - tokens // 2,
+            latency_ms=100,
+            user_id=test_user.id,
+            organization_id=test_organization.id
+        )
+        for agent_name, model, status, cost, tokens in calls
+    ])
+    test_db.commit()
+
+
+class TestGetDashboard:
+    """Combined dashboard panels."""
+
+    def test_matches_individual_endpoints(self, test_db, test_user, test_organization):
+        _add_calls(test_db, test_user, test_organization)
+        repo = AnalyticsRepository(test_db)
+        org_id = test_organization.id
+        start_date = datetime.utcnow() - timedelta(days=30)
+
+        dashboard = repo.get_dashboard(org_id, start_date=start_date, days=30)
+
+        assert dashboard["overview"]["total_stats"] == repo.get_total_stats(org_id, start_date=start_date)
+        assert dashboard["overview"]["error_stats"] == repo.get_error_stats(org_id, start_date=start_date)
+        assert dashboard["by_user"] == repo.get_usage_by_user(org_id, start_date=start_date)
+        assert dashboard["by_agent"] == repo.get_usage_by_agent(org_id, start_date=start_date)
+        assert dashboard["by_model"] == repo.get_usage_by_model(org_id, start_date=start_date)
+        assert dashboard["over_time"] == repo.get_usage_over_time(org_id, start_date=start_date)
+
+    def test_overview_and_errors_share_one_query(self, test_db, test_user, test_organization):
+        _add_calls(test_db, test_user, test_organization)
+        repo = AnalyticsRepository(test_db)
+        org_id = test_organization.id
+
+        with count_queries(test_db) as queries:
+            repo.get_dashboard(org_id, start_date=datetime.utcnow() - timedelta(days=30), days=30)
+
+        # totals, by_user, by_agent, by_model, over_time
+        assert len(queries) == 5
@@ -0,0 +1,40 @@
+"""
+Tests for ContextRepository's cached current-context lookup.
+"""
+
+from backend.repositories._profiling import count_queries
+from backend.repositories.context import ContextRepository
+
+
+class TestGetCurrentSnapshot:
+    """Cached snapshot used by the agent routes."""
+
+    def test_repeat_lookups_skip_the_database(self, test_db, test_organization, test_user):
+        repo = ContextRepository(test_db)
+        repo.create_new_version(test_organization.id, company_mission="Ship it", created_by=test_user.id)
+        test_db.commit()
+
+        first = repo.get_current_snapshot(test_organization.id)
+        with count_queries(test_db) as queries:
+            second = repo.get_current_snapshot(test_organization.id)
+
+        assert second == first
+        assert second.company_mission == "Ship it"
+        assert len(queries) == 0
+
+    def test_new_version_replaces_cached_snapshot(self, test_db, test_organization, test_user):
+        repo = ContextRepository(test_db)
+        first = repo.create_new_version(test_organization.id, company_mission="Ship it", created_by=test_user.id)
+        test_db.commit()
+        repo.get_current_snapshot(test_organization.id)
+
+        repo.create_new_version(test_organization.id, company_mission="Ship faster", created_by=test_user.id)
+        test_db.commit()
+        assert repo.get_current_snapshot(test_organization.id).version == 2
+
+        repo.set_current(first.id, test_organization.id)
+        test_db.commit()
+        assert repo.get_current_snapshot(test_organization.id).company_mission == "Ship it"
+
+    def test_missing_context_is_none(self, test_db, test_organization):
+        assert ContextRepository(test_db).get_current_snapshot(test_organization.id) is None
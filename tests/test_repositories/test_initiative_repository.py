@@ -0,0 +1,239 @@
+"""
+Tests for InitiativeRepository query helpers.
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from backend.config import settings
+from backend.models import Initiative, InitiativeStatus
+from backend.repositories._profiling import count_queries
+from backend.repositories.initiative import InitiativeRepository
+from backend.repositories.mrd import MRDRepository
+
+
+def _add_initiatives(test_db, organization, user, titles):
+    for title in titles:
+        test_db.add(Initiative(
+            title=title,
+            description=f"About {title}",
+            status=InitiativeStatus.DRAFT,
+            organization_id=organization.id,
+            created_by=user.id,
+            iteration_count=0
+        ))
+    test_db.commit()
+
+
+class TestSearchByTitle:
+    """Substring and prefix search behaviour."""
+
+    def test_prefix_search_matches_title_start_case_insensitively(self, test_db, test_organization, test_user):
+        _add_initiatives(test_db, test_organization, test_user, ["Checkout Revamp", "Mobile checkout", "Search"])
+        repo = InitiativeRepository(test_db)
+
+        results = repo.search_by_title("check", test_organization.id, prefix=True)
+
+        assert [i.title for i in results] == ["Checkout Revamp"]
+
+    def test_substring_search_matches_title_or_description(self, test_db, test_organization, test_user):
+        _add_initiatives(test_db, test_organization, test_user, ["Checkout Revamp", "Mobile checkout", "Search"])
+        repo = InitiativeRepository(test_db)
+
+        results = repo.search_by_title("checkout", test_organization.id)
+
+        assert sorted(i.title for i in results) == ["Checkout Revamp", "Mobile checkout"]
+
+    def test_wildcards_in_term_are_literal(self, test_db, test_organization, test_user):
+        _add_initiatives(test_db, test_organization, test_user, ["100% uptime", "100 new users"])
+        repo = InitiativeRepository(test_db)
+
+        assert [i.title for i in repo.search_by_title("100%", test_organization.id)] == ["100% uptime"]
+        assert [i.title for i in repo.search_by_title("100%", test_organization.id, prefix=True)] == ["100% uptime"]
+
+
+class TestGetReadyForMrd:
+    """Status filtering for MRD-ready initiatives."""
+
+    def test_returns_in_qa_and_ready_only(self, test_db, test_organization, test_user):
+        for title, status in [("Draft", InitiativeStatus.DRAFT), ("QA", InitiativeStatus.IN_QA),
+                              ("Ready", InitiativeStatus.READY)]:
+            test_db.add(Initiative(
+                title=title,
+                description=f"About {title}",
+                status=status,
+                organization_id=test_organization.id,
+                created_by=test_user.id,
+                iteration_count=0
+            ))
+        test_db.commit()
+        repo = InitiativeRepository(test_db)
+
+        results = repo.get_ready_for_mrd(test_organization.id)
+
+        assert sorted(i.title for i in results) == ["QA", "Ready"]
+
+
+class TestStrictRouteLoading:
+    """strict_relationship_loading on the loaders used by the agent routes."""
+
+    def test_relationship_access_raises_when_strict(self, test_db, test_organization, test_user, monkeypatch):
+        monkeypatch.setattr(settings, "strict_relationship_loading", True)
+        _add_initiatives(test_db, test_organization, test_user, ["Checkout Revamp"])
+        initiative_id = test_db.query(Initiative.id).scalar()
+        organization_id = test_organization.id
+        test_db.expunge_all()
+
+        initiative, mrd = InitiativeRepository(test_db).get_with_mrd(initiative_id, organization_id)
+
+        assert initiative.title == "Checkout Revamp"
+        assert mrd is None
+        with pytest.raises(InvalidRequestError):
+            initiative.questions
+
+    def test_relationships_lazy_load_when_not_strict(self, test_db, test_organization, test_user, monkeypatch):
+        monkeypatch.setattr(settings, "strict_relationship_loading", False)
+        _add_initiatives(test_db, test_organization, test_user, ["Checkout Revamp"])
+        initiative_id = test_db.query(Initiative.id).scalar()
+        organization_id = test_organization.id
+        test_db.expunge_all()
+
+        initiative, score = InitiativeRepository(test_db).get_with_score(initiative_id, organization_id)
+
+        assert score is None
+        assert initiative.questions == []
+
+
+class TestGetGenerationState:
+    """Column-only gate for question generation."""
+
+    def test_returns_status_and_iteration_without_loading_the_row(self, test_db, test_initiative, test_organization):
+        initiative_id, organization_id = test_initiative.id, test_organization.id
+        test_db.expunge_all()
+
+        state = InitiativeRepository(test_db).get_generation_state(initiative_id, organization_id)
+
+        assert state == (InitiativeStatus.DRAFT, 0)
+        assert len(test_db.identity_map) == 0
+
+    def test_other_organization_gets_none(self, test_db, test_initiative):
+        assert InitiativeRepository(test_db).get_generation_state(test_initiative.id, uuid4()) is None
+
+
+class TestExists:
+    """Access check that does not load the initiative row."""
+
+    def test_true_only_within_the_organization(self, test_db, test_initiative, test_organization):
+        repo = InitiativeRepository(test_db)
+
+        assert repo.exists(test_initiative.id, test_organization.id)
+        assert not repo.exists(test_initiative.id, uuid4())
+        assert not repo.exists(uuid4(), test_organization.id)
+
+    def test_selects_no_initiative_columns(self, test_db, test_initiative, test_organization):
+        initiative_id, organization_id = test_initiative.id, test_organization.id
+
+        with count_queries(test_db) as queries:
+            InitiativeRepository(test_db).exists(initiative_id, organization_id)
+
+        assert len(queries.statements) == 1
+        assert "initiatives.title" not in queries.statements[0]
+
+
+class TestGetWithContext:
+    """Initiative plus current context in a single statement."""
+
+    def test_returns_initiative_and_current_context(self, test_db, test_initiative, test_context, test_organization):
+        initiative_id, organization_id = test_initiative.id, test_organization.id
+
+        with count_queries(test_db) as queries:
+            initiative, context = InitiativeRepository(test_db).get_with_context(initiative_id, organization_id)
+
+        assert initiative is test_initiative
+        assert context is test_context
+        assert len(queries) == 1
+
+    def test_missing_context_still_returns_initiative(self, test_db, test_initiative, test_organization):
+        initiative, context = InitiativeRepository(test_db).get_with_context(test_initiative.id, test_organization.id)
+
+        assert initiative is test_initiative
+        assert context is None
+
+    def test_other_organization_gets_nothing(self, test_db, test_initiative, test_context):
+        assert InitiativeRepository(test_db).get_with_context(test_initiative.id, uuid4()) == (None, None)
+
+
+class TestGetWithMrd:
+    """Initiative plus its MRD in a single tenant-scoped statement."""
+
+    def test_returns_initiative_and_mrd(self, test_db, test_initiative, test_organization, test_user):
+        MRDRepository(test_db).create_or_update(
+            initiative_id=test_initiative.id,
+            content="Draft",
+            quality_disclaimer=None,
+            word_count=1,
+            completeness_score=50,
+            readiness_at_generation=50,
+            assumptions_made=[],
+            generated_by=test_user.id
+        )
+        test_db.commit()
+        initiative_id, organization_id = test_initiative.id, test_organization.id
+
+        with count_queries(test_db) as queries:
+            initiative, mrd = InitiativeRepository(test_db).get_with_mrd(initiative_id, organization_id)
+
+        assert initiative.id == initiative_id
+        assert mrd.content == "Draft"
+        assert len(queries) == 1
+        assert "mrds.sections" not in queries.statements[0]
+
+    def test_missing_mrd_still_returns_initiative(self, test_db, test_initiative, test_organization):
+        initiative, mrd = InitiativeRepository(test_db).get_with_mrd(test_initiative.id, test_organization.id)
+
+        assert initiative is test_initiative
+        assert mrd is None
+
+    def test_other_organization_gets_nothing(self, test_db, test_initiative):
+        assert InitiativeRepository(test_db).get_with_mrd(test_initiative.id, uuid4()) == (None, None)
+
+
+class TestGetWithScore:
+    """Initiative plus its score in a single tenant-scoped statement."""
+
+    def test_missing_score_still_returns_initiative(self, test_db, test_initiative, test_organization):
+        initiative_id, organization_id = test_initiative.id, test_organization.id
+
+        with count_queries(test_db) as queries:
+            initiative, score = InitiativeRepository(test_db).get_with_score(initiative_id, organization_id)
+
+        assert initiative is test_initiative
+        assert score is None
+        assert len(queries) == 1
+
+    def test_other_organization_gets_nothing(self, test_db, test_initiative):
+        assert InitiativeRepository(test_db).get_with_score(test_initiative.id, uuid4()) == (None, None)
+
+
+class TestIncrementIteration:
+    """Single-statement iteration bump used by question regeneration."""
+
+    def test_increments_in_one_statement(self, test_db, test_initiative, test_organization):
+        initiative_id, organization_id = test_initiative.id, test_organization.id
+        before = test_initiative.iteration_count
+
+        with count_queries(test_db) as queries:
+            initiative = InitiativeRepository(test_db).increment_iteration(initiative_id, organization_id)
+
+        assert initiative is test_initiative
+        assert initiative.iteration_count == before + 1
+        assert len(queries) == 1
+
+    def test_other_organization_is_untouched(self, test_db, test_initiative):
+        before = test_initiative.iteration_count
+
+        assert InitiativeRepository(test_db).increment_iteration(test_initiative.id, uuid4()) is None
+        test_db.expire_all()
+        assert test_initiative.iteration_count == before
@@ -0,0 +1,131 @@
+"""
+Query-count regression tests for repository methods.
+"""
+
+from backend.models import Answer, AnswerStatus, Question, QuestionCategory, QuestionPriority, MRD
+from backend.repositories._profiling import count_queries
+from backend.repositories.mrd import MRDRepository
+from backend.repositories.question import QuestionRepository
+
+
+def _add_questions(test_db, initiative, count=3):
+    for i in range(count):
+        test_db.add(Question(
+            initiative_id=initiative.id,
+            iteration=1,
+            category=QuestionCategory.PRODUCT,
+            priority=QuestionPriority.P1,
+            question_text=f"Question {i}",
+            rationale="Rationale"
+        ))
+    test_db.commit()
+
+
+class TestQueryCounts:
+    """Guard against extra round-trips and compiled-cache misses."""
+
+    def test_get_unanswered_is_single_statement(self, test_db, test_initiative):
+        _add_questions(test_db, test_initiative)
+        initiative_id = test_initiative.id
+        repo = QuestionRepository(test_db)
+
+        with count_queries(test_db) as queries:
+            questions = repo.get_unanswered(initiative_id)
+
+        assert len(questions) == 3
+        assert len(queries) == 1
+
+    def test_get_by_initiative_reuses_compiled_statement(self, test_db, test_initiative, test_user):
+        test_db.add(MRD(
+            initiative_id=test_initiative.id,
+            content="# MRD",
+            quality_disclaimer="",
+            word_count=1,
+            completeness_score=50,
+            readiness_at_generation=50,
+            generated_by=test_user.id
+        ))
+        test_db.commit()
+        initiative_id = test_initiative.id
+        repo = MRDRepository(test_db)
+        repo.get_by_initiative(initiative_id)
+
+        with count_queries(test_db) as queries:
+            for _ in range(5):
+                assert repo.get_by_initiative(initiative_id) is not None
+
+        assert len(queries) == 5
+        assert queries.cache_misses == 0
+
+    def test_count_by_priority_zero_fills_in_one_statement(self, test_db, test_initiative):
+        _add_questions(test_db, test_initiative, count=2)
+        initiative_id = test_initiative.id
+        repo = QuestionRepository(test_db)
+
+        with count_queries(test_db) as queries:
+            counts = repo.count_by_priority(initiative_id)
+
+        assert counts == {"P0": 0, "P1": 2, "P2": 0}
+        assert len(queries) == 1
+
+    def test_role_checks_load_roles_in_one_query(self, test_db, test_user):
+        from backend.repositories.role_repository import RoleRepository
+        from backend.repositories.user_role_repository import UserRoleRepository
+
+        role_repo = RoleRepository(test_db)
+        role_repo.ensure_default_roles()
+        UserRoleRepository(test_db).set_user_roles(test_user.id, [role.id for role in role_repo.get_all()])
+        test_db.commit()
+        test_user.id  # reload the expired user outside the counted block
+
+        with count_queries(test_db) as queries:
+            assert test_user.has_role("admin")
+            assert test_user.has_any_role("financial", "missing")
+            assert "technical" in test_user.role_names
+
+        assert len(queries) == 1
+
+    def test_questions_with_answers_load_in_two_statements(self, test_db, test_initiative):
+        _add_questions(test_db, test_initiative, count=4)
+        initiative_id = test_initiative.id
+        repo = QuestionRepository(test_db)
+        answered = repo.get_by_initiative(initiative_id)[0]
+        test_db.add(Answer(
+            question_id=answered.id,
+            answer_text="Yes",
+            answer_status=AnswerStatus.ANSWERED
+        ))
+        test_db.commit()
+        answered_id = answered.id
+        test_db.expunge_all()
+
+        with count_queries(test_db) as queries:
+            questions = repo.get_by_initiative(initiative_id, with_answers=True)
+            answers = {q.id: q.answer for q in questions}
+
+        # questions, then one IN query for all their answers
+        assert len(queries) == 2
+        assert answers[answered_id].answer_text == "Yes"
+        assert sum(answer is None for answer in answers.values()) == 3
+
+    def test_bulk_create_inserts_in_one_statement(self, test_db, test_initiative):
+        initiative_id = test_initiative.id
+        questions = [
+            Question(
+                initiative_id=initiative_id,
+                iteration=1,
+                category=QuestionCategory.PRODUCT,
+                priority=QuestionPriority.P1,
+                question_text=f"Question {i}",
+                rationale="Rationale"
+            )
+            for i in range(5)
+        ]
+
+        with count_queries(test_db) as queries:
+            QuestionRepository(test_db).bulk_create(questions)
+
+        assert len(queries) == 1
+        assert all(question.id is not None for question in questions)
+        test_db.commit()
+        assert len(QuestionRepository(test_db).get_by_initiative(initiative_id)) == 5
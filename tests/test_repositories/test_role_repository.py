@@ -0,0 +1,29 @@
+"""
+Tests for RoleRepository.
+"""
+
+from uuid import uuid4
+
+from backend.repositories._profiling import count_queries
+from backend.repositories.role_repository import RoleRepository
+
+
+class TestGetMany:
+    """Bulk role ID validation used by the admin user endpoints."""
+
+    def test_unknown_ids_are_left_out_in_one_query(self, test_db, roles):
+        repo = RoleRepository(test_db)
+        known = [roles["product"].id, roles["technical"].id]
+        unknown = uuid4()
+
+        with count_queries(test_db) as queries:
+            found = repo.get_many(known + [unknown])
+
+        assert {role.id for role in found} == set(known)
+        assert len(queries) == 1
+
+    def test_empty_request_skips_the_query(self, test_db):
+        with count_queries(test_db) as queries:
+            assert RoleRepository(test_db).get_many([]) == []
+
+        assert len(queries) == 0
@@ -0,0 +1,42 @@
+"""
+Tests for ScoreRepository.
+"""
+
+from backend.repositories._profiling import count_queries
+from backend.repositories.score import ScoreRepository
+
+
+def _score_fields(test_user, rice_score):
+    return dict(
+        reach=1000,
+        impact=2.0,
+        confidence=80,
+        effort=3.0,
+        rice_score=rice_score,
+        rice_reasoning={"reach": "estimate"},
+        feasibility=7,
+        desirability=8,
+        viability=6,
+        fdv_score=7.0,
+        fdv_reasoning={"feasibility": "ok"},
+        scored_by=test_user.id,
+        data_quality={"reach": "estimated"},
+        warnings=["low confidence"]
+    )
+
+
+class TestCreateOrUpdate:
+    """Upsert behaviour of create_or_update."""
+
+    def test_second_call_updates_existing_row_in_one_statement(self, test_db, test_initiative, test_user):
+        repo = ScoreRepository(test_db)
+        initiative_id = test_initiative.id
+        created = repo.create_or_update(initiative_id=initiative_id, **_score_fields(test_user, 533.3))
+
+        with count_queries(test_db) as queries:
+            updated = repo.create_or_update(initiative_id=initiative_id, **_score_fields(test_user, 800.0))
+
+        assert len(queries) == 1
+        assert updated.id == created.id
+        assert updated.rice_score == 800.0
+        assert repo.get_by_initiative(initiative_id).rice_score == 800.0
@@ -0,0 +1,206 @@
+"""
+Tests for UserRepository.
+"""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.exc import InvalidRequestError
+
+from backend.models import Organization
+from backend.repositories._profiling import count_queries
+from backend.repositories.user_repository import UserRepository
+from backend.repositories.user_role_repository import UserRoleRepository
+
+
+class TestCreate:
+    """Email uniqueness on insert."""
+
+    def test_duplicate_email_returns_none_in_one_statement(self, test_db, test_user, test_organization):
+        repo = UserRepository(test_db)
+        organization_id = test_organization.id
+
+        with count_queries(test_db) as queries:
+            user = repo.create(
+                email="test@example.com",
+                password="Password123!",
+                name="Duplicate",
+                organization_id=organization_id
+            )
+
+        assert user is None
+        assert len(queries) == 1
+
+    def test_new_email_gets_column_defaults(self, test_db, test_organization):
+        user = UserRepository(test_db).create(
+            email="fresh@example.com",
+            password="Password123!",
+            name="Fresh",
+            organization_id=test_organization.id
+        )
+
+        assert user.id is not None
+        assert user.monthly_budget_usd == 100
+        assert user.created_at is not None
+
+
+class TestGetAll:
+    """Admin list view query."""
+
+    def test_skips_columns_the_list_view_does_not_render(self, test_db, test_user, test_organization):
+        organization_id = test_organization.id
+        test_db.expunge_all()
+
+        users = UserRepository(test_db).get_all(organization_id)
+
+        state = inspect(users[0])
+        assert "password_hash" in state.unloaded
+        assert "email" not in state.unloaded
+
+    def test_roles_load_in_fixed_number_of_queries(self, test_db, test_user, admin_user, test_organization, roles):
+        user_role_repo = UserRoleRepository(test_db)
+        user_role_repo.set_user_roles(test_user.id, [roles["product"].id])
+        user_role_repo.set_user_roles(admin_user.id, [roles["admin"].id, roles["technical"].id])
+        test_db.commit()
+        organization_id = test_organization.id
+        test_db.expunge_all()
+
+        with count_queries(test_db) as queries:
+            users = UserRepository(test_db).get_all(organization_id)
+            role_names = {user.email: {ur.role.name for ur in user.user_roles} for user in users}
+
+        # users, user_roles, roles
+        assert len(queries) == 3
+        assert role_names["admin@example.com"] == {"admin", "technical"}
+
+
+    def test_keyset_cursor_breaks_name_ties_by_id(self, test_db, test_organization):
+        repo = UserRepository(test_db)
+        for index in range(3):
+            repo.create(
+                email=f"same.name.{index}@example.com",
+                password="Password123!",
+                name="Same Name",
+                organization_id=test_organization.id
+            )
+        test_db.commit()
+        organization_id = test_organization.id
+
+        first_page = repo.get_all(organization_id, limit=2)
+        second_page = repo.get_all(organization_id, limit=2, after=first_page[-1].id)
+
+        ids = [user.id for user in first_page + second_page]
+        assert len(ids) == len(set(ids)) == 3
+        assert ids == sorted(ids)
+
+    def test_cursor_from_another_organization_matches_nothing(self, test_db, test_user, test_organization):
+        other = Organization(name="Other Organization")
+        test_db.add(other)
+        test_db.flush()
+        outsider = UserRepository(test_db).create(
+            email="outsider@example.com",
+            password="Password123!",
+            name="A",
+            organization_id=other.id
+        )
+        test_db.commit()
+
+        # Must not reveal where the outsider sorts among this org's users
+        assert UserRepository(test_db).get_all(test_organization.id, after=outsider.id) == []
+
+    def test_page_query_reads_the_name_index_without_sorting(self, test_db, test_organization):
+        organization_id = test_organization.id
+
+        with count_queries(test_db) as queries:
+            UserRepository(test_db).get_all(organization_id, limit=10)
+
+        users_query = queries.statements[0]
+        plan = " ".join(
+            row[-1] for row in test_db.connection().exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {users_query}", (None,) * users_query.count("?")
+            )
+        )
+        assert "ix_users_organization_name_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_unplanned_lazy_loads_raise(self, test_db, test_user, test_organization):
+        organization_id = test_organization.id
+        test_db.expunge_all()
+
+        user = UserRepository(test_db).get_all(organization_id)[0]
+
+        with pytest.raises(InvalidRequestError):
+            user.monthly_spending
+
+
+class TestSumMonthlyBudget:
+    """Organization budget total used by spending trends."""
+
+    def test_sums_budgets_in_one_query(self, test_db, test_user, admin_user, test_organization):
+        test_user.monthly_budget_usd = Decimal("250.50")
+        test_db.commit()
+        organization_id = test_organization.id
+
+        with count_queries(test_db) as queries:
+            total = UserRepository(test_db).sum_monthly_budget(organization_id)
+
+        assert total == admin_user.monthly_budget_usd + Decimal("250.50")
+        assert len(queries) == 1
+
+    def test_empty_organization_is_zero(self, test_db):
+        assert UserRepository(test_db).sum_monthly_budget(uuid4()) == Decimal("0")
+
+
+class TestUpdate:
+    """Partial updates."""
+
+    def test_updates_in_a_single_statement(self, test_db, test_user, test_organization):
+        repo = UserRepository(test_db)
+        user_id, organization_id = test_user.id, test_organization.id
+
+        with count_queries(test_db) as queries:
+            user = repo.update(user_id, organization_id, name="Renamed", is_active=False)
+
+        assert len(queries) == 1
+        assert user is test_user
+        assert (user.name, user.is_active) == ("Renamed", False)
+
+    def test_other_organization_is_not_updated(self, test_db, test_user):
+        from uuid import uuid4
+
+        assert UserRepository(test_db).update(test_user.id, uuid4(), name="Renamed") is None
+        test_db.expire_all()
+        assert test_user.name == "Test User"
+
+
+class TestLookups:
+    """Cached single-user lookups."""
+
+    def test_repeat_lookups_reuse_compiled_sql(self, test_db, test_user, test_organization):
+        repo = UserRepository(test_db)
+        user_id, organization_id = test_user.id, test_organization.id
+        repo.get_by_id(user_id, organization_id)
+        repo.get_by_email("test@example.com")
+
+        with count_queries(test_db) as queries:
+            assert repo.get_by_id(user_id, organization_id) is test_user
+            assert repo.get_by_email("test@example.com") is test_user
+            assert repo.get_by_email("nobody@example.com") is None
+
+        assert len(queries) == 3
+        assert queries.cache_misses == 0
+
+    def test_get_by_id_loads_roles_in_the_same_query(self, test_db, test_user, test_organization, roles):
+        UserRoleRepository(test_db).set_user_roles(test_user.id, [roles["product"].id])
+        test_db.commit()
+        user_id, organization_id = test_user.id, test_organization.id
+        test_db.expunge_all()
+
+        with count_queries(test_db) as queries:
+            user = UserRepository(test_db).get_by_id(user_id, organization_id)
+            role_names = [ur.role.name for ur in user.user_roles]
+
+        assert len(queries) == 1
+        assert role_names == ["product"]
@@ -0,0 +1,61 @@
+"""
+Tests for UserRoleRepository.
+"""
+
+from backend.repositories._profiling import count_queries
+from backend.repositories.role_repository import RoleRepository
+from backend.repositories.user_role_repository import UserRoleRepository
+
+
+class TestSetUserRoles:
+    """Diff-based role synchronisation."""
+
+    def test_unchanged_assignments_are_kept(self, test_db, test_user):
+        role_repo = RoleRepository(test_db)
+        role_repo.ensure_default_roles()
+        roles = {role.name: role.id for role in role_repo.get_all()}
+        repo = UserRoleRepository(test_db)
+
+        first = repo.set_user_roles(test_user.id, [roles["product"], roles["technical"]])
+        kept_id = next(ur.id for ur in first if ur.role_id == roles["technical"])
+
+        second = repo.set_user_roles(test_user.id, [roles["technical"], roles["financial"]])
+
+        assert {ur.role_id for ur in second} == {roles["technical"], roles["financial"]}
+        assert next(ur.id for ur in second if ur.role_id == roles["technical"]) == kept_id
+
+    def test_empty_list_removes_all_roles(self, test_db, test_user):
+        role_repo = RoleRepository(test_db)
+        role_repo.ensure_default_roles()
+        repo = UserRoleRepository(test_db)
+        repo.set_user_roles(test_user.id, [role_repo.get_by_name("admin").id])
+
+        assert repo.set_user_roles(test_user.id, []) == []
+        assert repo.get_user_roles(test_user.id) == []
+
+    def test_new_roles_are_inserted_in_one_statement(self, test_db, test_user):
+        role_repo = RoleRepository(test_db)
+        role_repo.ensure_default_roles()
+        role_ids = [role.id for role in role_repo.get_all()]
+        user_id = test_user.id
+        repo = UserRoleRepository(test_db)
+
+        with count_queries(test_db) as queries:
+            repo.set_user_roles(user_id, role_ids)
+
+        inserts = [sql for sql in queries.statements if sql.lstrip().upper().startswith("INSERT")]
+        assert len(inserts) == 1
+        assert len(repo.get_user_roles(user_id)) == len(role_ids)
+
+
+class TestHasRole:
+    """Existence check for a named role."""
+
+    def test_has_role(self, test_db, test_user):
+        role_repo = RoleRepository(test_db)
+        role_repo.ensure_default_roles()
+        repo = UserRoleRepository(test_db)
+        repo.set_user_roles(test_user.id, [role_repo.get_by_name("product").id])
+
+        assert repo.has_role(test_user.id, "product") is True
+        assert repo.has_role(test_user.id, "admin") is False
@@ -0,0 +1,45 @@
+"""
+Tests for AuditLogger.
+"""
+
+from sqlalchemy.orm import Session
+
+from backend.models.audit_log import AuditLog
+from backend.repositories._profiling import count_queries
+from backend.services.audit_logger import AuditLogger
+
+
+class TestAuditLogger:
+    """Audit entries written with the caller's transaction."""
+
+    def test_entries_are_inserted_together_at_commit(self, test_db: Session, test_user, admin_user):
+        audit_logger = AuditLogger(test_db)
+        user_id, organization_id = test_user.id, test_user.organization_id
+
+        with count_queries(test_db) as queries:
+            for name in ("First", "Second", "Third"):
+                audit_logger.log_user_update(
+                    user_id=user_id,
+                    changes={"name": {"old": "Test User", "new": name}},
+                    actor_id=admin_user.id,
+                    organization_id=organization_id
+                )
+            assert len(queries) == 0
+            test_db.commit()
+
+        inserts = [sql for sql in queries.statements if sql.startswith("INSERT INTO audit_logs")]
+        assert len(inserts) == 1
+        assert test_db.query(AuditLog).filter(AuditLog.entity_id == user_id).count() == 3
+
+    def test_entries_roll_back_with_the_change(self, test_db: Session, test_user):
+        user_id, organization_id = test_user.id, test_user.organization_id
+
+        AuditLogger(test_db).log_password_change(
+            user_id=user_id,
+            changed_by_admin=False,
+            actor_id=user_id,
+            organization_id=organization_id
+        )
+        test_db.rollback()
+
+        assert test_db.query(AuditLog).filter(AuditLog.entity_id == user_id).count() == 0
@@ -390,4 +390,117 @@ class TestBudgetServiceProperties:
             )
         except Exception:
             # If repository creation fails, that's okay for this test
-            test_db.rollback()
\ No newline at end of file
+            test_db.rollback()
+
+
+class TestBudgetStatusesBulk:
+    """Tests for BudgetService.get_budget_statuses_bulk."""
+
+    def test_matches_per_user_status(self, test_db: Session, test_user: User, admin_user: User):
+        now = datetime.utcnow()
+        test_db.add(UserMonthlySpending(
+            user_id=test_user.id,
+            year=now.year,
+            month=now.month,
+            total_spent_usd=Decimal('85.00')
+        ))
+        test_db.commit()
+        budget_service = BudgetService(test_db)
+
+        statuses = budget_service.get_budget_statuses_bulk([test_user.id, admin_user.id, uuid4()])
+
+        assert set(statuses) == {test_user.id, admin_user.id}
+        assert statuses[test_user.id] == budget_service.get_budget_status_with_warnings(test_user.id)
+        assert statuses[admin_user.id] == budget_service.get_budget_status_with_warnings(admin_user.id)
+        assert statuses[test_user.id]["has_warning"] is True
+        assert statuses[admin_user.id]["current_spending"] == Decimal('0.00')
+
+    def test_single_query_for_many_users(self, test_db: Session, test_user: User, admin_user: User):
+        from backend.repositories._profiling import count_queries
+
+        user_ids = [test_user.id, admin_user.id]
+
+        with count_queries(test_db) as queries:
+            BudgetService(test_db).get_budget_statuses_bulk(user_ids)
+
+        assert len(queries) == 1
+
+
+class TestOrgOverview:
+    """Tests for BudgetService.get_org_overview."""
+
+    def test_summary_and_ordering(self, test_db: Session, test_user: User, admin_user: User):
+        now = datetime.utcnow()
+        test_db.add(UserMonthlySpending(
+            user_id=test_user.id,
+            year=now.year,
+            month=now.month,
+            total_spent_usd=Decimal('120.00')
+        ))
+        test_db.add(UserMonthlySpending(
+            user_id=admin_user.id,
+            year=now.year,
+            month=now.month,
+            total_spent_usd=Decimal('85.00')
+        ))
+        test_db.commit()
+
+        overview = BudgetService(test_db).get_org_overview(test_user.organization_id)
+
+        summary = overview["summary"]
+        assert summary["total_users"] == 2
+        assert summary["total_budget_usd"] == 200.0
+        assert summary["total_spending_usd"] == 205.0
+        assert summary["users_over_budget"] == 1
+        assert summary["users_near_limit"] == 1
+        assert summary["users_within_budget"] == 0
+        assert [user["email"] for user in overview["users"]] == [test_user.email, admin_user.email]
+        assert overview["users"][1]["has_warning"] is True
+
+    def test_users_without_spending_count_as_zero(self, test_db: Session, test_user: User):
+        from backend.repositories._profiling import count_queries
+
+        organization_id = test_user.organization_id
+
+        with count_queries(test_db) as queries:
+            overview = BudgetService(test_db).get_org_overview(organization_id)
+
+        assert len(queries) == 1
+        assert overview["users"][0]["current_spending_usd"] == 0.0
+        assert overview["summary"]["users_within_budget"] == 1
+
+
+class TestMonthlySpendingTotals:
+    """Tests for BudgetService.get_monthly_spending_totals."""
+
+    def test_totals_from_start_month_across_years(self, test_db: Session, test_user: User, admin_user: User):
+        for user, year, month, amount in (
+            (test_user, 2025, 10, '99.00'),
+            (test_user, 2025, 11, '10.00'),
+            (admin_user, 2025, 11, '5.50'),
+            (test_user, 2026, 2, '20.00'),
+        ):
+            test_db.add(UserMonthlySpending(
+                user_id=user.id, year=year, month=month, total_spent_usd=Decimal(amount)
+            ))
+        test_db.commit()
+
+        rows = BudgetService(test_db).get_monthly_spending_totals(test_user.organization_id, 2025, 11)
+
+        assert [(row.year, row.month, row.total_spending, row.active_users) for row in rows] == [
+            (2025, 11, Decimal('15.50'), 2),
+            (2026, 2, Decimal('20.00'), 1),
+        ]
+
+    def test_repeat_calls_reuse_the_compiled_statement(self, test_db: Session, test_user: User):
+        from backend.repositories._profiling import count_queries
+
+        organization_id = test_user.organization_id
+        budget_service = BudgetService(test_db)
+        budget_service.get_monthly_spending_totals(organization_id, 2025, 1)
+
+        with count_queries(test_db) as queries:
+            budget_service.get_monthly_spending_totals(organization_id, 2026, 6)
+
+        assert len(queries) == 1
+        assert queries.cache_misses == 0
@@ -0,0 +1,78 @@
+"""
+Tests for job worker dispatch.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from backend.services.job_executor import execute_job_in_background, job_queued
+from backend.services.job_worker import JobWorker
+
+
+class TestDispatch:
+    """Handing polled jobs to the worker's thread pool."""
+
+    def test_job_still_queued_is_not_submitted_twice(self, monkeypatch):
+        worker = JobWorker(auto_restart=False)
+        worker._executor = ThreadPoolExecutor(max_workers=1)
+        release = threading.Event()
+        ran = []
+
+        def fake_execute(job_id):
+            ran.append(job_id)
+            release.wait(timeout=5)
+
+        monkeypatch.setattr(worker, "_execute_job_safely", fake_execute)
+        job_id = uuid4()
+
+        worker._submit(job_id)
+        worker._submit(job_id)
+        release.set()
+        worker._executor.shutdown(wait=True)
+
+        assert ran == [job_id]
+        assert not worker._in_flight
+
+    def test_queueing_a_job_wakes_the_worker(self):
+        job_queued.clear()
+
+        execute_job_in_background(uuid4())
+
+        assert job_queued.is_set()
+        job_queued.clear()
+
+    def test_job_queued_during_poll_is_not_missed(self, monkeypatch):
+        worker = JobWorker(poll_interval=30, auto_restart=False)
+        polled = threading.Event()
+        polls = []
+
+        def fake_pending_jobs():
+            polls.append(1)
+            if len(polls) == 1:
+                # A job is queued while the first poll is still running
+                job_queued.set()
+            else:
+                polled.set()
+            return []
+
+        monkeypatch.setattr(worker, "_get_pending_jobs", fake_pending_jobs)
+        worker.running = True
+        thread = threading.Thread(target=worker._run_worker)
+        thread.start()
+        try:
+            # The second poll follows immediately rather than after poll_interval
+            assert polled.wait(timeout=5)
+        finally:
+            worker.stop()
+            thread.join(timeout=5)
+            job_queued.clear()
+
+    def test_wait_returns_once_stopped(self):
+        worker = JobWorker(auto_restart=False)
+        worker.running = True
+
+        assert worker.wait(timeout=0) is False
+        worker.stop()
+        assert worker.wait(timeout=0) is True
+        job_queued.clear()
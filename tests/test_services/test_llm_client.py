@@ -0,0 +1,44 @@
+"""
+Tests for the Anthropic client wrapper's session handling.
+"""
+
+from types import SimpleNamespace
+
+from backend.llm.client import AnthropicClient
+from backend.models import LLMCall
+
+
+class _FakeMessages:
+    def __init__(self, db):
+        self.db = db
+        self.in_transaction_during_call = None
+
+    def create(self, **kwargs):
+        self.in_transaction_during_call = self.db.in_transaction()
+        return SimpleNamespace(
+            content=[SimpleNamespace(text="ok")],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+            stop_reason="end_turn"
+        )
+
+
+class TestCreateMessage:
+    """Database connection use around the API request."""
+
+    def test_connection_is_released_during_the_api_request(self, test_db, test_initiative, test_organization):
+        client = AnthropicClient(api_key="test-key")
+        messages = _FakeMessages(test_db)
+        client.client = SimpleNamespace(messages=messages)
+        test_initiative.title  # Start a transaction, as a route's reads would
+
+        text, llm_call, _ = client.create_message(
+            db=test_db,
+            agent_name="Test Agent",
+            system="system",
+            messages=[{"role": "user", "content": "hi"}],
+            organization_id=test_organization.id
+        )
+
+        assert text == "ok"
+        assert messages.in_transaction_during_call is False
+        assert test_db.query(LLMCall).filter(LLMCall.id == llm_call.id).count() == 1
@@ -0,0 +1,54 @@
+"""
+Tests for the PDF render process pool and response streaming.
+"""
+
+import asyncio
+import os
+
+from backend.config import settings
+from backend.services.pdf_generator import iter_pdf_chunks, render_pdf, render_pdf_async, shutdown_render_pool
+
+
+def _render_pid(title: str) -> bytes:
+    return f"{title}:{os.getpid()}".encode()
+
+
+class TestRenderPdf:
+    """Offloading renderers to worker processes."""
+
+    def test_renders_in_a_worker_process(self, monkeypatch):
+        monkeypatch.setattr(settings, "pdf_render_workers", 1)
+        try:
+            title, pid = render_pdf(_render_pid, title="MRD").decode().split(":")
+        finally:
+            shutdown_render_pool()
+
+        assert title == "MRD"
+        assert int(pid) != os.getpid()
+
+    def test_zero_workers_renders_inline(self, monkeypatch):
+        monkeypatch.setattr(settings, "pdf_render_workers", 0)
+
+        assert render_pdf(_render_pid, "MRD") == f"MRD:{os.getpid()}".encode()
+
+    def test_async_render_awaits_the_worker_process(self, monkeypatch):
+        monkeypatch.setattr(settings, "pdf_render_workers", 1)
+        try:
+            title, pid = asyncio.run(render_pdf_async(_render_pid, title="Scorecard")).decode().split(":")
+        finally:
+            shutdown_render_pool()
+
+        assert title == "Scorecard"
+        assert int(pid) != os.getpid()
+
+
+class TestIterPdfChunks:
+    """Chunking rendered PDFs for streaming responses."""
+
+    def test_chunks_reassemble_to_the_document(self):
+        pdf_bytes = b"%PDF" + bytes(range(256)) * 10
+
+        chunks = list(iter_pdf_chunks(pdf_bytes, chunk_size=1000))
+
+        assert [len(chunk) for chunk in chunks] == [1000, 1000, 564]
+        assert b"".join(chunks) == pdf_bytes